@@ -0,0 +1,10 @@
+"""
+Benchmark Modules
+
+- eager_getitem.py
+- import_time.py
+- profiler.py
+- spectrogram.py
+- suite.py
+- synthetic.py
+"""
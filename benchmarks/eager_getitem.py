@@ -0,0 +1,67 @@
+# Import libraries
+import argparse
+import time
+
+import numpy as np
+
+# Import Datasets
+from datasets.baseclasses import BaseDataset
+from datasets.dataset import EagerAudioDataset, EagerImageDataset
+
+# Paths to audio and image datasets
+AUDIO_DATASET_PATH = "data/audio_dataset"
+IMAGE_DATASET_PATH = "data/image_dataset"
+
+
+def time_getitem(dataset: BaseDataset, epochs: int) -> np.ndarray:
+    """
+    Times every __getitem__ call over a number of epochs.
+
+    Args:
+        dataset (BaseDataset): The dataset to be timed.
+        epochs (int): The number of passes over the dataset.
+
+    Returns:
+        np.ndarray: The latency of every call in microseconds.
+    """
+    latencies = np.empty(epochs * len(dataset))
+
+    # Time every access separately
+    for epoch in range(epochs):
+        for index in range(len(dataset)):
+            start = time.perf_counter_ns()
+            dataset[index]
+            latencies[epoch * len(dataset) + index] = time.perf_counter_ns() - start
+
+    # Convert nanoseconds to microseconds
+    return latencies / 1000
+
+
+def main() -> None:
+    """
+    Compares the per-item latency of the copying and the read-only mode.
+    """
+    parser = argparse.ArgumentParser(
+        description="Per-item __getitem__ latency of the eager datasets, "
+        "copying every access versus returning read-only arrays."
+    )
+    parser.add_argument("--epochs", type=int, default=20)
+    args = parser.parse_args()
+
+    # Loop through the eager datasets and both access modes
+    for name, loader, root in (
+        ("audio", EagerAudioDataset, AUDIO_DATASET_PATH),
+        ("image", EagerImageDataset, IMAGE_DATASET_PATH),
+    ):
+        for readonly in (False, True):
+            dataset = loader(root=root, readonly=readonly)
+            latencies = time_getitem(dataset, args.epochs)
+            print(
+                f"{name:<6} readonly={readonly!s:<6}"
+                f"p50 {np.percentile(latencies, 50):9.2f} us   "
+                f"p99 {np.percentile(latencies, 99):9.2f} us"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# Import libraries
+import argparse
+import subprocess
+import sys
+
+import numpy as np
+
+# Backends that must only be imported when a data point needs them
+HEAVY_MODULES = ("cv2", "librosa", "matplotlib", "numba", "scipy", "soundfile")
+
+
+def cold_import(statement: str) -> tuple[float, list[str]]:
+    """
+    Runs a statement in a fresh interpreter and times it.
+
+    Args:
+        statement (str): The statement to be run, such as an import.
+
+    Returns:
+        tuple[float, list[str]]: The time of the statement in milliseconds and
+            the heavy backends it imported.
+    """
+    code = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "print((time.perf_counter() - start) * 1000)\n"
+        f"print(*sorted({{name.split('.')[0] for name in sys.modules}}"
+        f" & set({HEAVY_MODULES!r})))\n"
+    )
+    # The code only runs this interpreter on the given import statement
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    milliseconds, backends = result.stdout.splitlines()[-2:]
+    return float(milliseconds), backends.split()
+
+
+def main() -> None:
+    """
+    Times the cold import of the dataset modules.
+    """
+    parser = argparse.ArgumentParser(
+        description="Cold-start import time of the dataset modules, "
+        "each measured in a fresh interpreter."
+    )
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument(
+        "--max-ms",
+        type=float,
+        default=None,
+        help="exit with an error if the median import takes longer",
+    )
+    args = parser.parse_args()
+
+    # Time every module, the median of a number of fresh interpreters
+    slow = False
+    for module in ("datasets.dataset", "datasets.loader", "datasets.transform"):
+        timings, backends = [], []
+        for _ in range(args.repeats):
+            milliseconds, backends = cold_import(f"import {module}")
+            timings.append(milliseconds)
+        median = float(np.median(timings))
+        slow = slow or (args.max_ms is not None and median > args.max_ms)
+        print(f"{module:<20} {median:8.1f} ms   backends: {', '.join(backends) or '-'}")
+
+    # Fail when a module exceeds the budget, to guard cold-start latency
+    if slow:
+        sys.exit(f"median import time exceeds {args.max_ms} ms")
+
+
+if __name__ == "__main__":
+    main()
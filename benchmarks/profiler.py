@@ -0,0 +1,176 @@
+# Import libraries
+import pathlib
+import sys
+import threading
+from collections import Counter
+from types import FrameType, TracebackType
+from typing import Self
+
+
+class SamplingProfiler:
+    """
+    Sampling Profiler
+
+    Samples the Python stacks of the thread that started it, or of all
+    threads, at a fixed interval from a background thread. Unlike cProfile,
+    functions are not instrumented, so the overhead does not grow with the
+    number of calls, and the stacks can be written in the folded format of
+    flamegraph.pl, speedscope and inferno.
+
+    Time spent in C code, such as decoding, is attributed to the Python frame
+    that called it.
+
+    Attributes:
+        samples (Counter[tuple[str, ...]]): The number of samples per stack,
+            from the thread name at the root to the running frame.
+
+    Methods:
+        start(): Starts sampling.
+        stop(): Stops sampling.
+        folded(): Returns the stacks in the folded format.
+        write_folded(path): Writes the stacks in the folded format.
+        hotspots(top): Returns the frames with the most samples.
+    """
+
+    def __init__(self, interval: float = 0.001, *, all_threads: bool = False) -> None:
+        """
+        Initializes the SamplingProfiler class.
+
+        Args:
+            interval (float): The time between samples in seconds.
+            all_threads (bool): Whether all threads are sampled, such as the
+                workers of a pool, instead of the thread that calls start.
+                Idle workers are sampled too, while they wait for work.
+        """
+        self._interval = interval
+        self._all_threads = all_threads
+        self._target: int | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.samples: Counter[tuple[str, ...]] = Counter()
+
+    @staticmethod
+    def _label(frame: FrameType) -> str:
+        """
+        Returns the label of a frame: the function, file and first line.
+
+        Args:
+            frame (FrameType): The frame to be labelled.
+
+        Returns:
+            str: The label, without the ";" that separates folded frames.
+        """
+        code = frame.f_code
+        name = pathlib.Path(code.co_filename).name
+        return f"{code.co_name} ({name}:{code.co_firstlineno})".replace(";", ":")
+
+    def _sample(self) -> None:
+        """
+        Records the stacks of the sampled threads.
+        """
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        # The standard library has no public way to read the stacks of threads
+        for ident, frame in sys._current_frames().items():  # noqa: SLF001
+            # Skip the sampling thread and, by default, all but the target
+            if ident == threading.get_ident() or (
+                not self._all_threads and ident != self._target
+            ):
+                continue
+
+            # Walk from the running frame to the root
+            stack = []
+            current: FrameType | None = frame
+            while current is not None:
+                stack.append(self._label(current))
+                current = current.f_back
+            stack.append(names.get(ident, f"thread {ident}"))
+            self.samples[tuple(reversed(stack))] += 1
+
+    def _run(self) -> None:
+        """
+        Samples until stopped.
+        """
+        while not self._stop.wait(self._interval):
+            self._sample()
+
+    def start(self) -> None:
+        """
+        Starts sampling in a background thread.
+        """
+        self._target = threading.get_ident()
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="sampling-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops sampling and waits for the background thread.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> Self:
+        """
+        Starts sampling.
+
+        Returns:
+            SamplingProfiler: The profiler itself.
+        """
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """
+        Stops sampling.
+        """
+        self.stop()
+
+    def folded(self) -> list[str]:
+        """
+        Returns the stacks in the folded format, one "a;b;c count" per line.
+
+        Returns:
+            list[str]: The folded stacks, sorted.
+        """
+        return sorted(f"{';'.join(stack)} {n}" for stack, n in self.samples.items())
+
+    def write_folded(self, path: str) -> None:
+        """
+        Writes the stacks in the folded format, for flamegraph tools.
+
+        Args:
+            path (str): The file to be written.
+        """
+        pathlib.Path(path).write_text("\n".join(self.folded()) + "\n")
+
+    def hotspots(self, top: int = 25) -> list[tuple[str, int, int]]:
+        """
+        Returns the frames with the most samples.
+
+        Args:
+            top (int): The number of frames to be returned.
+
+        Returns:
+            list[tuple[str, int, int]]: The frame, the samples in which it was
+                running (self) and the samples in which it was on the stack
+                (total), sorted by self and then total samples.
+        """
+        own, total = Counter(), Counter()
+        for stack, n in self.samples.items():
+            own[stack[-1]] += n
+
+            # Count recursive frames once per stack
+            for frame in set(stack[1:]):
+                total[frame] += n
+
+        frames = sorted(total, key=lambda frame: (own[frame], total[frame]))
+        return [(frame, own[frame], total[frame]) for frame in frames[::-1][:top]]
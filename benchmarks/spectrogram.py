@@ -0,0 +1,50 @@
+# Import libraries
+import argparse
+import time
+
+import librosa
+import numpy as np
+
+# Import from other modules
+from datasets.spectrogram import MelSpectrogramEngine
+
+
+def main() -> None:
+    """
+    Compares per-clip librosa spectrograms with the batched engine.
+    """
+    parser = argparse.ArgumentParser(
+        description="Mel spectrogram throughput of librosa, one clip per call, "
+        "versus the batched engine, one batch per call."
+    )
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--sr", type=int, default=22050)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    # A batch of random equal-length clips
+    rng = np.random.default_rng(0)
+    shape = (args.batch_size, int(args.seconds * args.sr))
+    batch = rng.standard_normal(shape).astype(np.float32)
+    engine = MelSpectrogramEngine()
+
+    # Time both implementations, the best of a number of repeats
+    for name, compute in (
+        (
+            "librosa",
+            lambda: [librosa.feature.melspectrogram(y=c, sr=args.sr) for c in batch],
+        ),
+        ("engine", lambda: engine.compute(batch, args.sr)),
+    ):
+        timings = []
+        for _ in range(args.repeats):
+            start = time.perf_counter()
+            compute()
+            timings.append(time.perf_counter() - start)
+        clips_per_second = args.batch_size / min(timings)
+        print(f"{name:<8} {clips_per_second:10.1f} clips/s")
+
+
+if __name__ == "__main__":
+    main()
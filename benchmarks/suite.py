@@ -0,0 +1,255 @@
+# Import libraries
+import argparse
+import json
+import pathlib
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+import numpy as np
+
+# Import from other modules
+from benchmarks.eager_getitem import time_getitem
+from benchmarks.synthetic import make_synthetic_dataset
+from datasets.baseclasses import DataTransform
+from datasets.dataset import (
+    EagerAudioDataset,
+    EagerImageDataset,
+    LazyAudioDataset,
+    LazyImageDataset,
+)
+from datasets.transform import (
+    CenterCropTransform,
+    RandomAudioCropTransform,
+    SpectrogramTransform,
+    SquareErasingTransform,
+)
+
+# Dataset classes per name, with the data type they read
+DATASETS = {
+    "EagerAudioDataset": ("audio", EagerAudioDataset),
+    "LazyAudioDataset": ("audio", LazyAudioDataset),
+    "EagerImageDataset": ("image", EagerImageDataset),
+    "LazyImageDataset": ("image", LazyImageDataset),
+}
+
+# Transforms per data type, built from the options of the synthetic data
+TRANSFORMS: dict[str, dict[str, Callable[[dict], DataTransform | None]]] = {
+    "audio": {
+        "none": lambda _: None,
+        "random_crop": lambda options: RandomAudioCropTransform(
+            t=options["audio_seconds"] / 2
+        ),
+        "spectrogram": lambda _: SpectrogramTransform(),
+    },
+    "image": {
+        "none": lambda _: None,
+        "center_crop": lambda options: CenterCropTransform(
+            s=options["image_size"] // 2
+        ),
+        "square_erasing": lambda options: SquareErasingTransform(
+            s=options["image_size"] // 4
+        ),
+    },
+}
+
+
+def peak_rss_mb() -> float:
+    """
+    Returns the peak resident set size of the current process.
+
+    Returns:
+        float: The peak resident set size in MiB.
+    """
+    # Linux reports kibibytes and macOS bytes
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    scale = 1 if sys.platform == "darwin" else 1024
+    return peak * scale / 2**20
+
+
+def run_case(
+    root: str, dataset_name: str, transform_name: str, options: dict, epochs: int
+) -> dict:
+    """
+    Measures one dataset class with one transform, meant for a fresh process.
+
+    Args:
+        root (str): The root directory of the synthetic dataset.
+        dataset_name (str): The name of the dataset class, see DATASETS.
+        transform_name (str): The name of the transform, see TRANSFORMS.
+        options (dict): The options the synthetic dataset was written with.
+        epochs (int): The number of passes over the dataset.
+
+    Returns:
+        dict: The load time, the latency of the first item, the per-item
+            latency, the throughput and the peak resident set size.
+    """
+    data_type, loader = DATASETS[dataset_name]
+    transform = TRANSFORMS[data_type][transform_name](options)
+
+    # Time the construction, which calls load()
+    start = time.perf_counter()
+    dataset = loader(root=root, transform=transform)
+    load_s = time.perf_counter() - start
+
+    # The first item may import the decoder, time it apart from the epochs
+    start = time.perf_counter()
+    dataset[0]
+    first_item_ms = (time.perf_counter() - start) * 1000
+
+    # Time every __getitem__ call, an epoch is one pass over all items
+    latencies = time_getitem(dataset, epochs)
+
+    return {
+        "dataset": dataset_name,
+        "transform": transform_name,
+        "items": len(dataset),
+        "load_s": load_s,
+        "first_item_ms": first_item_ms,
+        "p50_us": float(np.percentile(latencies, 50)),
+        "p99_us": float(np.percentile(latencies, 99)),
+        "items_per_s": float(len(latencies) / (latencies.sum() / 1e6)),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def git_commit() -> str | None:
+    """
+    Returns the commit the benchmarks ran on.
+
+    Returns:
+        str | None: The hash of HEAD, None without git or outside of a git
+            repository.
+    """
+    # Run git from its full path, the arguments are fixed
+    git = shutil.which("git")
+    if git is None:
+        return None
+    try:
+        result = subprocess.run(  # noqa: S603
+            [git, "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def compare(results: list[dict], baseline_path: str) -> None:
+    """
+    Prints the change of every case relative to an earlier run.
+
+    Args:
+        results (list[dict]): The results of this run.
+        baseline_path (str): The JSON file written by an earlier run.
+    """
+    with pathlib.Path(baseline_path).open() as file:
+        baseline = {
+            (case["dataset"], case["transform"]): case
+            for case in json.load(file)["results"]
+        }
+
+    # Ratios above 1 mean slower loading and latency or higher throughput
+    for case in results:
+        before = baseline.get((case["dataset"], case["transform"]))
+        if before is None:
+            continue
+        print(
+            f"{case['dataset']:<18} {case['transform']:<15}"
+            f"load x{case['load_s'] / before['load_s']:5.2f}   "
+            f"p50 x{case['p50_us'] / before['p50_us']:5.2f}   "
+            f"items/s x{case['items_per_s'] / before['items_per_s']:5.2f}"
+        )
+
+
+def main() -> None:
+    """
+    Benchmarks every dataset class with every transform on synthetic data.
+    """
+    parser = argparse.ArgumentParser(
+        description="Load time, __getitem__ latency, epoch throughput and peak "
+        "RSS of all dataset classes and transforms on synthetic datasets."
+    )
+    parser.add_argument("--classes", type=int, default=4)
+    parser.add_argument("--files-per-class", type=int, default=64)
+    parser.add_argument("--image-size", type=int, default=128)
+    parser.add_argument("--audio-seconds", type=float, default=1.0)
+    parser.add_argument("--sr", type=int, default=22050)
+    parser.add_argument("--epochs", type=int, default=3)
+    parser.add_argument("--num-workers", type=int, default=0)
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--compare", help="JSON results of an earlier run")
+    args = parser.parse_args()
+
+    options = {
+        "classes": args.classes,
+        "files_per_class": args.files_per_class,
+        "image_size": args.image_size,
+        "audio_seconds": args.audio_seconds,
+        "sr": args.sr,
+    }
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        # Write one synthetic dataset per data type
+        for data_type in TRANSFORMS:
+            make_synthetic_dataset(
+                f"{directory}/{data_type}",
+                data_type,
+                classes=args.classes,
+                files_per_class=args.files_per_class,
+                image_size=(args.image_size, args.image_size),
+                audio_seconds=args.audio_seconds,
+                sr=args.sr,
+                num_workers=args.num_workers,
+            )
+
+        # Measure every case in a fresh process, so the peak RSS is its own
+        for dataset_name, (data_type, _) in DATASETS.items():
+            for transform_name in TRANSFORMS[data_type]:
+                with ProcessPoolExecutor(1, mp_context=get_context("spawn")) as pool:
+                    case = pool.submit(
+                        run_case,
+                        f"{directory}/{data_type}",
+                        dataset_name,
+                        transform_name,
+                        options,
+                        args.epochs,
+                    ).result()
+                results.append(case)
+                print(
+                    f"{dataset_name:<18} {transform_name:<15}"
+                    f"load {case['load_s']:7.3f} s   "
+                    f"first {case['first_item_ms']:7.1f} ms   "
+                    f"p50 {case['p50_us']:9.1f} us   "
+                    f"p99 {case['p99_us']:9.1f} us   "
+                    f"{case['items_per_s']:9.1f} items/s   "
+                    f"RSS {case['peak_rss_mb']:7.1f} MiB"
+                )
+
+    # Write the results with what is needed to compare them across commits
+    with pathlib.Path(args.output).open("w") as file:
+        json.dump(
+            {
+                "commit": git_commit(),
+                "python": platform.python_version(),
+                "numpy": np.__version__,
+                "options": {**options, "epochs": args.epochs},
+                "results": results,
+            },
+            file,
+            indent=2,
+        )
+
+    if args.compare is not None:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+# Import libraries
+import argparse
+import pathlib
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Import from other modules
+from datasets.utils import INVALID_S_T_MSG, INVALID_WORKERS_MSG
+
+# Data types and their file formats, and messages
+SYNTHETIC_FORMATS = {"audio": ("wav",), "image": ("png", "jpg")}
+INVALID_DATA_TYPE_MSG = 'data_type must be one of {}, got "{}"'
+INVALID_FORMAT_MSG = 'image_format must be one of {}, got "{}"'
+
+# Number of files written per task of a worker
+SYNTHETIC_CHUNK = 256
+
+
+def _write_files(root: str, label: int, *, start: int, stop: int, options: dict) -> int:
+    """
+    Writes the files start to stop of one class.
+
+    Every file draws from its own generator, seeded with the seed, label and
+    index, so the contents do not depend on the number of workers.
+
+    Args:
+        root (str): The root directory of the dataset.
+        label (int): The label id of the class.
+        start (int): The index of the first file.
+        stop (int): The index after the last file.
+        options (dict): The data type and options of make_synthetic_dataset.
+
+    Returns:
+        int: The number of files written.
+    """
+    # Import the encoders only when writing data
+    import cv2  # noqa: PLC0415
+    import soundfile as sf  # noqa: PLC0415
+
+    # Zero padded names sort in the order of the label ids and indices
+    class_name = f"class_{label:04d}"
+    class_path = pathlib.Path(root) / class_name
+    class_path.mkdir(parents=True, exist_ok=True)
+
+    for index in range(start, stop):
+        rng = np.random.default_rng([options["seed"], label, index])
+        path = class_path / f"{class_name}_{index:06d}.{options['format']}"
+
+        if options["data_type"] == "image":
+            # Upsample a coarse random pattern, which compresses like a photo
+            height, width = options["image_size"]
+            pattern = rng.integers(0, 256, (8, 8, 3), dtype=np.uint8)
+            image = cv2.resize(pattern, (width, height), interpolation=cv2.INTER_LINEAR)
+            cv2.imwrite(str(path), image)
+        else:
+            # A tone per class with a random phase and some noise
+            samples = round(options["audio_seconds"] * options["sr"])
+            frequency = 220.0 * 2 ** ((label % 24) / 12)
+            time = np.arange(samples) / options["sr"]
+            phase = rng.uniform(0, 2 * np.pi)
+            audio = 0.5 * np.sin(2 * np.pi * frequency * time + phase)
+            audio += 0.05 * rng.standard_normal(samples)
+            sf.write(path, audio.astype(np.float32), options["sr"])
+
+    return stop - start
+
+
+def make_synthetic_dataset(  # noqa: PLR0913 - the options after * are keyword-only
+    root: str,
+    data_type: str,
+    *,
+    classes: int = 4,
+    files_per_class: int = 64,
+    image_size: tuple[int, int] = (128, 128),
+    image_format: str = "png",
+    audio_seconds: float = 1.0,
+    sr: int = 22050,
+    seed: int = 0,
+    num_workers: int = 0,
+) -> int:
+    """
+    Writes a synthetic dataset in the class folder layout that load() reads.
+
+    The root contains one directory per class, class_0000, class_0001, ...,
+    each with files_per_class images or audio clips. The same arguments always
+    write the same files.
+
+    Args:
+        root (str): The root directory of the dataset, created if missing.
+        data_type (str): Either "audio" or "image".
+        classes (int): The number of classes.
+        files_per_class (int): The number of files per class.
+        image_size (tuple[int, int]): The height and width of the images.
+        image_format (str): The image file format, "png" or "jpg".
+        audio_seconds (float): The duration of the audio clips in seconds.
+        sr (int): The sampling rate of the audio clips.
+        seed (int): The seed of the contents.
+        num_workers (int): The number of processes writing files. With 0 the
+            files are written one after another.
+
+    Returns:
+        int: The number of files written.
+
+    Raises:
+        ValueError: If the data type or format is unknown, a count or size is
+            not positive or num_workers is negative.
+    """
+    # Check the arguments before writing anything
+    if data_type not in SYNTHETIC_FORMATS:
+        raise ValueError(
+            INVALID_DATA_TYPE_MSG.format(tuple(SYNTHETIC_FORMATS), data_type)
+        )
+    file_format = image_format if data_type == "image" else "wav"
+    if file_format not in SYNTHETIC_FORMATS[data_type]:
+        raise ValueError(
+            INVALID_FORMAT_MSG.format(SYNTHETIC_FORMATS["image"], image_format)
+        )
+    for name, value in (
+        ("classes", classes),
+        ("files_per_class", files_per_class),
+        ("image_size", min(image_size)),
+        ("audio_seconds", audio_seconds),
+        ("sr", sr),
+    ):
+        if value <= 0:
+            raise ValueError(INVALID_S_T_MSG.format(name, "0"))
+    if num_workers < 0:
+        raise ValueError(INVALID_WORKERS_MSG)
+
+    options = {
+        "data_type": data_type,
+        "image_size": tuple(image_size),
+        "format": file_format,
+        "audio_seconds": audio_seconds,
+        "sr": sr,
+        "seed": seed,
+    }
+
+    # Split every class into chunks of files
+    tasks = [
+        (label, start, min(start + SYNTHETIC_CHUNK, files_per_class))
+        for label in range(classes)
+        for start in range(0, files_per_class, SYNTHETIC_CHUNK)
+    ]
+
+    # Write the chunks one after another or in a pool of processes
+    if num_workers == 0:
+        return sum(
+            _write_files(root, label, start=start, stop=stop, options=options)
+            for label, start, stop in tasks
+        )
+    with ProcessPoolExecutor(num_workers) as pool:
+        futures = [
+            pool.submit(
+                _write_files, root, label, start=start, stop=stop, options=options
+            )
+            for label, start, stop in tasks
+        ]
+        return sum(future.result() for future in futures)
+
+
+def main() -> None:
+    """
+    Writes a synthetic dataset from the command line.
+    """
+    parser = argparse.ArgumentParser(
+        description="Writes a synthetic audio or image dataset in the class "
+        "folder layout of the datasets, for benchmarks and stress tests."
+    )
+    parser.add_argument("root")
+    parser.add_argument("data_type", choices=tuple(SYNTHETIC_FORMATS))
+    parser.add_argument("--classes", type=int, default=4)
+    parser.add_argument("--files-per-class", type=int, default=64)
+    parser.add_argument("--height", type=int, default=128)
+    parser.add_argument("--width", type=int, default=128)
+    parser.add_argument("--image-format", default="png")
+    parser.add_argument("--audio-seconds", type=float, default=1.0)
+    parser.add_argument("--sr", type=int, default=22050)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--num-workers", type=int, default=0)
+    args = parser.parse_args()
+
+    files = make_synthetic_dataset(
+        args.root,
+        args.data_type,
+        classes=args.classes,
+        files_per_class=args.files_per_class,
+        image_size=(args.height, args.width),
+        image_format=args.image_format,
+        audio_seconds=args.audio_seconds,
+        sr=args.sr,
+        seed=args.seed,
+        num_workers=args.num_workers,
+    )
+    print(f"Wrote {files} {args.data_type} files to {args.root}")
+
+
+if __name__ == "__main__":
+    main()
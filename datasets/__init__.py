@@ -2,9 +2,18 @@
 Dataset Modules
 
 - baseclasses.py
+- cache.py
 - datasets.py
 - exceptions.py
+- index.py
+- instrumentation.py
+- loader.py
+- manifest.py
 - mixins.py
+- multiprocess.py
+- packed.py
+- prefetch.py
+- spectrogram.py
 - transform.py
 - utils.py
 """
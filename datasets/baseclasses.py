@@ -1,18 +1,48 @@
 # Import libaries
+import os
 import pathlib
 from abc import ABC, abstractmethod
-from copy import deepcopy
+from collections.abc import Callable
+from copy import copy
+from typing import Self, cast
+
+import numpy as np
 
 # Import from other modules
-from datasets.utils import DATA_RETURN_TYPES, GETITEM_RETURN_TYPE, INVALID_FILE_ERROR
+from datasets.cache import (
+    DiskCache,
+    FileVersion,
+    LRUCache,
+    file_key,
+    file_version,
+    version_key,
+)
+from datasets.index import PackedStrings
+from datasets.instrumentation import Instrumentation
+from datasets.manifest import read_manifest, scan_directory, write_manifest
+from datasets.utils import (
+    DATA_RETURN_TYPES,
+    GETITEM_RETURN_TYPE,
+    INVALID_FILE_ERROR,
+    readonly,
+)
 
 
 class DataTransform(ABC):
     """
     Abstract Base Class for Data Transformations
 
+    Transforms only hold immutable parameters, so that a shallow copy of a
+    transform is independent of the original.
+
+    Attributes:
+        deterministic (bool): Whether the output only depends on the input.
+        params (dict[str, object]): The parameters that influence the output.
+
     Methods:
         process(data): Processes the data and returns the transformed data.
+        process_batch(batch): Processes a collated batch of data.
+        snapshot(): Returns an independent copy of the transform.
     """
 
     @abstractmethod
@@ -29,25 +59,131 @@ class DataTransform(ABC):
         This method should be overridden in subclasses of DataTransform.
         """
 
+    @property
+    def deterministic(self) -> bool:
+        """
+        Returns whether the output only depends on the input and the params.
+
+        Only outputs of deterministic transforms can be stored and reused.
+
+        Returns:
+            bool: Whether the transform is deterministic, False by default.
+        """
+        return False
+
+    @property
+    def params(self) -> dict[str, object]:
+        """
+        Returns the parameters that influence the output of the transform.
+
+        Returns:
+            dict[str, object]: The parameters of the transform.
+        """
+        return {}
+
+    def process_batch(self, batch: DATA_RETURN_TYPES) -> DATA_RETURN_TYPES:
+        """
+        Processes a collated batch of data and returns the transformed batch.
+
+        A batch of images has the shape (N, H, W, C), a batch of audio is a
+        tuple of an array of shape (N, ..., T) and the shared sampling rate,
+        as returned by the collate functions of datasets.loader.
+
+        This default calls process on every data point and stacks the results.
+        Subclasses override it with a vectorized implementation.
+
+        Args:
+            batch (DATA_RETURN_TYPES): The batch to be processed.
+
+        Returns:
+            DATA_RETURN_TYPES: The transformed batch.
+        """
+        # Audio batches are (audio, sampling rate) tuples
+        if isinstance(batch, tuple):
+            audio, sr = batch
+            return np.stack([self.process((sample, sr))[0] for sample in audio]), sr
+
+        # Else the batch is an array of images, which stay images
+        images = [self.process(sample) for sample in batch]
+        return np.stack(cast("list[np.ndarray]", images))
+
+    def snapshot(self) -> Self:
+        """
+        Returns an independent copy of the transform.
+
+        The parameters are immutable, so a shallow copy costs O(1) and changes
+        to the copy do not reach this transform. Cached state, such as
+        precomputed filters, is shared instead of duplicated.
+
+        Returns:
+            DataTransform: A copy of the transform.
+        """
+        return copy(self)
+
+
+class TransformedLoading(ABC):
+    """
+    Abstract Base Class for Loading Transformed Data Points
+
+    BaseDataset implements it. Mixins that come before BaseDataset in a
+    dataset derive from it too, so they can extend it through super().
+
+    Methods:
+        _load_transformed(path): Loads only the part the transform keeps.
+    """
+
+    @abstractmethod
+    def _load_transformed(self, path: str) -> DATA_RETURN_TYPES:
+        """
+        Loads and transforms a single data point, decoding only what is kept.
+        This method should be overridden in subclasses of TransformedLoading.
+        """
+
 
-class BaseDataset(ABC):
+class BaseDataset(TransformedLoading):
     """
     Abstract Base Class for Datasets
 
     Attributes:
         _root (str): The root directory of the dataset.
-        _data (list): The list of data points in the dataset.
+        _data (Sequence): The data points in the dataset.
+        _classes (tuple[str, ...]): The sorted names of the classes.
+        _label_ids (np.ndarray): The label id of every data point.
+        _disk_cache (DiskCache | None): The persistent cache of decoded data.
+        _feature_store (LRUCache | DiskCache | None): The store of outputs of
+            deterministic transforms.
+        _manifest (str | None): The path of the manifest of the root directory.
+        instrumentation (Instrumentation | None): The per-stage timing of
+            __getitem__.
         transform (DataTransform | None): The transformation
             to be applied to the data points.
 
     Methods:
         load(): Loads the dataset.
         __getitem__(index): Returns the data point at the given index.
+        __len__(): Returns the number of data points in the dataset.
         _load_single_data(path): Loads a single data point from the given path.
+        _load_data(path): Loads a single data point through the disk cache.
+        _load_transformed(path): Loads only the part the transform keeps.
+        _feature_key(path, transform, version): Returns the key of the
+            transform output.
+        _load_features(key, load, transform, store): Returns the stored output
+            of the transform.
+        _mark(stage, data): Ends a stage of the instrumented data point.
         _check_valid_transform(transform): Checks if the given transform is valid.
+        _scan(): Collects the paths and label ids of the files in root.
     """
 
-    def __init__(self, root: str, transform: DataTransform | None = None) -> None:
+    def __init__(  # noqa: PLR0913 - the options after * are keyword-only
+        self,
+        root: str,
+        transform: DataTransform | None = None,
+        *,
+        disk_cache: DiskCache | None = None,
+        feature_store: LRUCache | DiskCache | None = None,
+        manifest: str | None = None,
+        instrumentation: Instrumentation | None = None,
+    ) -> None:
         """
         Initializes the BaseDataset class.
 
@@ -55,6 +191,16 @@ class BaseDataset(ABC):
             root (str): The root directory of the dataset.
             transform (DataTransform | None): The transformation to be applied
                 to the data points.
+            disk_cache (DiskCache | None): The persistent cache of decoded data.
+                None disables it.
+            feature_store (LRUCache | DiskCache | None): The store of outputs of
+                deterministic transforms, in memory or memory-mapped from disk.
+                None disables it.
+            manifest (str | None): The path of a file listing the files in root.
+                It is written by the first load and reused while the
+                directories are unchanged. None always scans root.
+            instrumentation (Instrumentation | None): Records the time and bytes
+                of every stage of __getitem__. None records nothing.
 
         Raises:
             DirectoryInvalidError: If the given root directory is invalid.
@@ -62,6 +208,12 @@ class BaseDataset(ABC):
         # Set root and initialise data
         self._root = root
         self._data = []
+        self._classes: tuple[str, ...] = ()
+        self._label_ids = np.empty(0, dtype=np.int32)
+        self._disk_cache = disk_cache
+        self._feature_store = feature_store
+        self._manifest = manifest
+        self._instrumentation = instrumentation
 
         # Set transform using setter
         self.transform = transform
@@ -99,6 +251,81 @@ class BaseDataset(ABC):
             IndexError: If the index is out of range.
         """
 
+    def __len__(self) -> int:
+        """
+        Returns the number of data points in the dataset.
+
+        Returns:
+            int: The number of data points in the dataset.
+        """
+        return len(self._data)
+
+    @property
+    def classes(self) -> tuple[str, ...]:
+        """
+        Returns the names of the classes, sorted so that ids are reproducible.
+
+        Returns:
+            tuple[str, ...]: The name of every label id.
+        """
+        return self._classes
+
+    @property
+    def class_to_idx(self) -> dict[str, int]:
+        """
+        Returns the mapping from the name of every class to its label id.
+
+        Returns:
+            dict[str, int]: The label id of every class.
+        """
+        return {name: idx for idx, name in enumerate(self._classes)}
+
+    @property
+    def label_ids(self) -> np.ndarray:
+        """
+        Returns the label id of every data point, in dataset order.
+
+        Indexing it with the indices of a batch gives the labels of the batch
+        as an integer array without looking up any data point.
+
+        Returns:
+            np.ndarray: A read-only view of the label ids.
+        """
+        return readonly(self._label_ids.view())
+
+    def _scan(self) -> PackedStrings:
+        """
+        Collects the paths and label ids of the files in root.
+
+        Every directory in root is a class. The classes are sorted by name and
+        numbered in that order, which sets _classes and _label_ids. The files
+        of a class are sorted by name. With a manifest, the walk is skipped
+        while the directories are unchanged.
+
+        Returns:
+            PackedStrings: The paths of the files, in the order of _label_ids.
+        """
+        # Reuse the manifest if the directories did not change
+        manifest_path = self._manifest
+        manifest = None
+        if manifest_path is not None:
+            manifest = read_manifest(manifest_path, self._root)
+
+        # Else walk root, and stat the files only to write a new manifest
+        if manifest is None:
+            manifest = scan_directory(self._root, stat=manifest_path is not None)
+            if manifest_path is not None:
+                write_manifest(manifest_path, manifest)
+
+        # Store the classes and label ids, and join the paths to root as
+        # strings, which is much faster than a Path per file
+        self._classes = manifest.classes
+        self._label_ids = manifest.label_ids
+        return PackedStrings(
+            os.path.join(self._root, path)  # noqa: PTH118
+            for path in manifest.paths
+        )
+
     @abstractmethod
     def _load_single_data(self, path: str) -> DATA_RETURN_TYPES:
         """
@@ -115,6 +342,196 @@ class BaseDataset(ABC):
             ImageNotFoundError: If the image file is not found.
         """
 
+    @property
+    def _load_params(self) -> dict[str, object]:
+        """
+        Returns the parameters that influence what _load_single_data returns.
+
+        Returns:
+            dict[str, object]: The loading parameters.
+        """
+        return {}
+
+    @property
+    def instrumentation(self) -> Instrumentation | None:
+        """
+        Returns the per-stage timing of __getitem__.
+
+        Returns:
+            Instrumentation | None: The instrumentation, None if disabled.
+        """
+        return self._instrumentation
+
+    def _mark(self, stage: str, data: DATA_RETURN_TYPES | bytes | None = None) -> None:
+        """
+        Ends a stage of the data point being returned, when instrumented.
+
+        Without instrumentation this only checks an attribute, so stages can
+        be marked on the hot path.
+
+        Args:
+            stage (str): The name of the stage, such as "read" or "transform".
+            data (DATA_RETURN_TYPES | bytes | None): The output of the stage.
+        """
+        if self._instrumentation is not None:
+            self._instrumentation.mark(stage, data)
+
+    def _load_data(self, path: str) -> DATA_RETURN_TYPES:
+        """
+        Loads a single data point through the disk cache, if there is one.
+
+        Data is decoded with _load_single_data once per version of the file
+        and loading parameters. Later loads read it back from the disk cache.
+
+        Args:
+            path (str): The path to the data point to be loaded.
+
+        Returns:
+            DATA_RETURN_TYPES: The loaded data point.
+
+        Raises:
+            AudioNotFoundError: If the audio file is not found.
+            ImageNotFoundError: If the image file is not found.
+        """
+        # Without a disk cache, always decode the data
+        if self._disk_cache is None:
+            return self._load_single_data(path)
+
+        # Files that cannot be accessed raise their error when decoded
+        try:
+            key = file_key(path, **self._load_params)
+        except OSError:
+            return self._load_single_data(path)
+
+        # Decode and store the data if it is not cached yet
+        data = self._disk_cache.get(key)
+        if data is None:
+            data = self._disk_cache.put(key, self._load_single_data(path))
+        else:
+            self._mark("disk_cache", data)
+
+        return data
+
+    def _load_transformed(self, path: str) -> DATA_RETURN_TYPES:
+        """
+        Loads and transforms a single data point, decoding only what is kept.
+
+        This default decodes the whole data point and then transforms it.
+        Subclasses override this when the transform can be pushed down into
+        the decoding, such as a crop that selects a window before decoding.
+
+        Args:
+            path (str): The path to the data point to be loaded.
+
+        Returns:
+            DATA_RETURN_TYPES: The transformed data point.
+
+        Raises:
+            AudioNotFoundError: If the audio file is not found.
+            ImageNotFoundError: If the image file is not found.
+        """
+        # Without a transform this is the decoded data point
+        data = self._load_data(path)
+        if self._transform is None:
+            return data
+        data = self._transform.process(data)
+        self._mark("transform", data)
+        return data
+
+    @property
+    def _feature_stage(self) -> tuple[DataTransform, LRUCache | DiskCache] | None:
+        """
+        Returns the transform and the store, if the store serves its output.
+
+        Returns:
+            tuple[DataTransform, LRUCache | DiskCache] | None: The transform and
+                the feature store, None if there is no feature store or the
+                transform is missing or random.
+        """
+        if (
+            self._feature_store is None
+            or self._transform is None
+            or not self._transform.deterministic
+        ):
+            return None
+        return self._transform, self._feature_store
+
+    def _feature_key(
+        self, path: str, transform: DataTransform, version: FileVersion | None = None
+    ) -> str | None:
+        """
+        Returns the key of the output of the transform in the feature store.
+
+        The key identifies the version of the file, the loading parameters and
+        the transform parameters. When any of them changes, the key changes
+        and the output is computed again.
+
+        Args:
+            path (str): The path to the data point.
+            transform (DataTransform): The transform of the feature store.
+            version (FileVersion | None): The version of the file the data
+                point was decoded from. None reads the current version.
+
+        Returns:
+            str | None: The key, None if the file cannot be accessed.
+        """
+        if version is None:
+            try:
+                version = file_version(path)
+            except OSError:
+                return None
+
+        return version_key(
+            version,
+            transform=type(transform).__name__,
+            transform_params=transform.params,
+            **self._load_params,
+        )
+
+    def _load_features(
+        self,
+        key: str | None,
+        load: Callable[[], DATA_RETURN_TYPES],
+        transform: DataTransform,
+        store: LRUCache | DiskCache,
+    ) -> DATA_RETURN_TYPES:
+        """
+        Returns the output of the transform from the feature store.
+
+        The output is computed and stored once per key, see _feature_key.
+
+        Args:
+            key (str | None): The key of the output. None transforms the data
+                point without the store.
+            load (Callable[[], DATA_RETURN_TYPES]): The function returning the
+                data point to be transformed, only called when it is not stored.
+            transform (DataTransform): The deterministic transform.
+            store (LRUCache | DiskCache): The feature store.
+
+        Returns:
+            DATA_RETURN_TYPES: The read-only transformed data point.
+
+        Raises:
+            AudioNotFoundError: If the audio file is not found.
+            ImageNotFoundError: If the image file is not found.
+        """
+        # Files that cannot be accessed are transformed without the store
+        if key is None:
+            features = transform.process(load())
+            self._mark("transform", features)
+            return features
+
+        # Transform and store the data point if it is not stored yet
+        features = store.get(key)
+        if features is None:
+            features = transform.process(load())
+            self._mark("transform", features)
+            features = readonly(store.put(key, features))
+        else:
+            self._mark("feature_store", features)
+
+        return features
+
     @abstractmethod
     def _check_valid_transform(self, transform: DataTransform | None) -> None:
         """
@@ -130,14 +547,19 @@ class BaseDataset(ABC):
     @property
     def transform(self) -> DataTransform | None:
         """
-        Returns a deep copy of the current transform.
+        Returns a snapshot of the current transform.
 
         If the transform is None, it will return None.
 
         Returns:
-            DataTransform | None: A deep copy of the current transform.
+            DataTransform | None: A snapshot of the current transform.
         """
-        return deepcopy(self._transform)
+        # Return None if there is no transform
+        if self._transform is None:
+            return None
+
+        # Else return a copy that cannot change the transform of the dataset
+        return self._transform.snapshot()
 
     @transform.setter
     def transform(self, transform: DataTransform | None) -> None:
@@ -0,0 +1,504 @@
+# Import libraries
+import hashlib
+import json
+import os
+import pathlib
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from typing import BinaryIO, NamedTuple
+
+import numpy as np
+
+# Import from other modules
+from datasets.utils import DATA_RETURN_TYPES, INVALID_S_T_MSG, data_nbytes, readonly
+
+# Version of a file: its absolute path, modification time and size
+FileVersion = tuple[str, int, int]
+
+
+def file_version(path: str) -> FileVersion:
+    """
+    Returns the current version of a file.
+
+    Args:
+        path (str): The path to the file.
+
+    Returns:
+        FileVersion: The absolute path, modification time in ns and size.
+
+    Raises:
+        OSError: If the file cannot be accessed.
+    """
+    stat = pathlib.Path(path).stat()
+    return str(pathlib.Path(path).resolve()), stat.st_mtime_ns, stat.st_size
+
+
+def version_key(version: FileVersion, **params: object) -> str:
+    """
+    Returns a key identifying a version of a file and the given parameters.
+
+    Args:
+        version (FileVersion): The version of the file, see file_version.
+        **params (object): The parameters that influence the stored data.
+
+    Returns:
+        str: The key of the file.
+    """
+    # Hash the version together with the sorted parameters
+    text = json.dumps([list(version), sorted(params.items())], default=str)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def file_key(path: str, **params: object) -> str:
+    """
+    Returns a key identifying the current version of a file.
+
+    The key changes when the file is modified (path, modification time and
+    size) or when any of the given parameters changes.
+
+    Args:
+        path (str): The path to the file.
+        **params (object): The parameters that influence the stored data.
+
+    Returns:
+        str: The key of the file.
+
+    Raises:
+        OSError: If the file cannot be accessed.
+    """
+    return version_key(file_version(path), **params)
+
+
+class CacheInfo(NamedTuple):
+    """
+    Snapshot of the counters and size of a cache
+
+    Attributes:
+        hits (int): The number of lookups that found the data.
+        misses (int): The number of lookups that did not find the data.
+        evictions (int): The number of entries removed to respect the bounds.
+        items (int): The number of entries currently stored.
+        nbytes (int): The number of bytes currently stored.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    items: int
+    nbytes: int
+
+
+class LRUCache:
+    """
+    Least Recently Used Cache
+
+    Stores decoded data points in memory, bounded by a number of items and/or
+    a number of bytes. When a bound is exceeded, the least recently used
+    entries are evicted. Stored arrays are made read-only, so callers cannot
+    change the cached data.
+
+    Attributes:
+        max_items (int | None): The maximum number of entries.
+        max_bytes (int | None): The maximum number of bytes.
+        info (CacheInfo): The counters and size of the cache.
+
+    Methods:
+        get(key): Returns the data stored under key or None.
+        put(key, data): Stores the data under key.
+        clear(): Removes all entries and resets the counters.
+    """
+
+    def __init__(
+        self, max_items: int | None = None, max_bytes: int | None = None
+    ) -> None:
+        """
+        Initializes the LRUCache class.
+
+        Without any bound, the cache is unbounded.
+
+        Args:
+            max_items (int | None): The maximum number of entries.
+            max_bytes (int | None): The maximum number of bytes.
+
+        Raises:
+            ValueError: If max_items or max_bytes is less than or equal to 0.
+        """
+        if max_items is not None and max_items <= 0:
+            raise ValueError(INVALID_S_T_MSG.format("max_items", "0"))
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError(INVALID_S_T_MSG.format("max_bytes", "0"))
+
+        self._max_items = max_items
+        self._max_bytes = max_bytes
+
+        # Entries in order of use, the least recently used first
+        self._entries: OrderedDict[str, tuple[DATA_RETURN_TYPES, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._reset_counters()
+
+    def _reset_counters(self) -> None:
+        """
+        Resets the counters and the size of the cache.
+        """
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._nbytes = 0
+
+    @property
+    def max_items(self) -> int | None:
+        """
+        Returns the maximum number of entries.
+
+        Returns:
+            int | None: The maximum number of entries, None if unbounded.
+        """
+        return self._max_items
+
+    @property
+    def max_bytes(self) -> int | None:
+        """
+        Returns the maximum number of bytes.
+
+        Returns:
+            int | None: The maximum number of bytes, None if unbounded.
+        """
+        return self._max_bytes
+
+    @property
+    def info(self) -> CacheInfo:
+        """
+        Returns the counters and size of the cache.
+
+        Returns:
+            CacheInfo: The counters and size of the cache.
+        """
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                len(self._entries),
+                self._nbytes,
+            )
+
+    def __len__(self) -> int:
+        """
+        Returns the number of entries.
+
+        Returns:
+            int: The number of entries.
+        """
+        return len(self._entries)
+
+    def get(self, key: str) -> DATA_RETURN_TYPES | None:
+        """
+        Returns the data stored under key and marks it as recently used.
+
+        Args:
+            key (str): The key of the data.
+
+        Returns:
+            DATA_RETURN_TYPES | None: The stored data, None if not stored.
+        """
+        with self._lock:
+            # Count a miss if the key is not stored
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            # Else count a hit and move the entry to the most recent position
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: str, data: DATA_RETURN_TYPES) -> DATA_RETURN_TYPES:
+        """
+        Stores the data under key and evicts entries to respect the bounds.
+
+        The arrays of data are made read-only in place. Data larger than
+        max_bytes on its own is not stored.
+
+        Args:
+            key (str): The key of the data.
+            data (DATA_RETURN_TYPES): The data to be stored.
+
+        Returns:
+            DATA_RETURN_TYPES: The read-only data.
+        """
+        data = readonly(data)
+        nbytes = data_nbytes(data)
+
+        # Data that can never fit is not stored
+        if self._max_bytes is not None and nbytes > self._max_bytes:
+            return data
+
+        with self._lock:
+            # Replace a previous entry under the same key
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._nbytes -= previous[1]
+
+            # Store the entry as the most recently used
+            self._entries[key] = (data, nbytes)
+            self._nbytes += nbytes
+
+            # Evict the least recently used entries while a bound is exceeded
+            while (
+                self._max_items is not None and len(self._entries) > self._max_items
+            ) or (self._max_bytes is not None and self._nbytes > self._max_bytes):
+                _, (_, evicted_nbytes) = self._entries.popitem(last=False)
+                self._nbytes -= evicted_nbytes
+                self._evictions += 1
+
+        return data
+
+    def clear(self) -> None:
+        """
+        Removes all entries and resets the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._reset_counters()
+
+    def __getstate__(self) -> dict:
+        """
+        Returns the state for pickling, without the lock.
+
+        Returns:
+            dict: The state of the cache.
+        """
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restores the state after unpickling, with a new lock.
+
+        Args:
+            state (dict): The state of the cache.
+        """
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+class DiskCache:
+    """
+    Disk Cache
+
+    Stores decoded data points as uncompressed .npy files in a directory, so
+    they survive restarts. Stored data is read back as a read-only memory map,
+    which only reads the pages that are accessed. The sampling rate of audio
+    is stored next to it in a small .json file.
+
+    Keys include the version of the file (see file_key), so a modified file
+    is stored under a new key and its old entry is never read again. Old
+    entries stay on disk until prune() or clear() removes them.
+
+    Attributes:
+        directory (str): The directory of the stored files.
+        info (CacheInfo): The counters and size of the cache.
+
+    Methods:
+        get(key): Returns the data stored under key or None.
+        put(key, data): Stores the data under key.
+        prune(keys): Removes all entries whose key is not in keys.
+        clear(): Removes all entries and resets the counters.
+    """
+
+    def __init__(self, directory: str) -> None:
+        """
+        Initializes the DiskCache class.
+
+        Args:
+            directory (str): The directory of the stored files,
+                created if it does not exist.
+        """
+        self._directory = pathlib.Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def directory(self) -> str:
+        """
+        Returns the directory of the stored files.
+
+        Returns:
+            str: The directory of the stored files.
+        """
+        return str(self._directory)
+
+    @property
+    def info(self) -> CacheInfo:
+        """
+        Returns the counters and size of the cache.
+
+        Entries are never evicted, they stay on disk until clear() is called.
+
+        Returns:
+            CacheInfo: The counters and size of the cache.
+        """
+        # Count the stored arrays and their size on disk
+        arrays = list(self._directory.glob("*.npy"))
+        nbytes = sum(array.stat().st_size for array in arrays)
+
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, 0, len(arrays), nbytes)
+
+    def _count(self, *, hit: bool) -> None:
+        """
+        Counts a hit or a miss.
+
+        Args:
+            hit (bool): Whether the lookup found the data.
+        """
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+
+    def get(self, key: str) -> DATA_RETURN_TYPES | None:
+        """
+        Returns the data stored under key as a read-only memory map.
+
+        Args:
+            key (str): The key of the data.
+
+        Returns:
+            DATA_RETURN_TYPES | None: The stored data, None if not stored.
+        """
+        # The array is written last, so if it exists the entry is complete
+        array_path = self._directory / f"{key}.npy"
+        try:
+            array = np.load(array_path, mmap_mode="r")
+        except FileNotFoundError:
+            self._count(hit=False)
+            return None
+        self._count(hit=True)
+
+        # Audio has its sampling rate stored next to the array
+        meta_path = self._directory / f"{key}.json"
+        if meta_path.exists():
+            return array, json.loads(meta_path.read_text())["sr"]
+
+        # Else it is an image
+        return array
+
+    def _write_atomic(
+        self, path: pathlib.Path, write: Callable[[BinaryIO], object]
+    ) -> None:
+        """
+        Writes a file under a temporary name and renames it when complete.
+
+        Args:
+            path (pathlib.Path): The final path of the file.
+            write (Callable[[BinaryIO], object]): The function writing the
+                contents to an open binary file.
+        """
+        # Readers never see partially written files
+        handle, temp_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "wb") as file:
+                write(file)
+            pathlib.Path(temp_path).replace(path)
+        except BaseException:
+            pathlib.Path(temp_path).unlink(missing_ok=True)
+            raise
+
+    def put(self, key: str, data: DATA_RETURN_TYPES) -> DATA_RETURN_TYPES:
+        """
+        Stores the data under key.
+
+        The arrays of data are made read-only in place, like the data that
+        get returns.
+
+        Args:
+            key (str): The key of the data.
+            data (DATA_RETURN_TYPES): The data to be stored.
+
+        Returns:
+            DATA_RETURN_TYPES: The read-only data.
+        """
+        # Store the sampling rate of audio first
+        if isinstance(data, tuple):
+            array, sr = data
+            meta = json.dumps({"sr": sr}).encode()
+            self._write_atomic(
+                self._directory / f"{key}.json", lambda file: file.write(meta)
+            )
+        else:
+            array = data
+
+        # Then store the array, which completes the entry
+        self._write_atomic(
+            self._directory / f"{key}.npy",
+            lambda file: np.save(file, np.ascontiguousarray(array)),
+        )
+
+        return readonly(data)
+
+    def prune(self, keys: Iterable[str]) -> int:
+        """
+        Removes all entries whose key is not in keys.
+
+        Used to remove the entries of modified or deleted files, by passing
+        the keys of the current files.
+
+        Args:
+            keys (Iterable[str]): The keys of the entries to be kept.
+
+        Returns:
+            int: The number of removed entries.
+        """
+        keep = set(keys)
+        removed = 0
+        for path in self._directory.glob("*.npy"):
+            if path.stem in keep:
+                continue
+
+            # Remove the array first, so a half-removed entry is a miss
+            path.unlink(missing_ok=True)
+            path.with_suffix(".json").unlink(missing_ok=True)
+            removed += 1
+
+        return removed
+
+    def clear(self) -> None:
+        """
+        Removes all entries and resets the counters.
+        """
+        for path in self._directory.iterdir():
+            if path.suffix in {".npy", ".json"}:
+                path.unlink(missing_ok=True)
+
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+
+    def __getstate__(self) -> dict:
+        """
+        Returns the state for pickling, without the lock.
+
+        Returns:
+            dict: The state of the cache.
+        """
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restores the state after unpickling, with a new lock.
+
+        Args:
+            state (dict): The state of the cache.
+        """
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
@@ -1,6 +1,13 @@
 # Import from other modules
 from datasets.baseclasses import BaseDataset, DataTransform
-from datasets.mixins import AudioMixin, EagerMixin, ImageMixin, LazyMixin
+from datasets.instrumentation import Instrumentation
+from datasets.mixins import (
+    AudioMixin,
+    EagerMixin,
+    ImageMixin,
+    LazyMixin,
+    PackedMixin,
+)
 
 
 class EagerAudioDataset(AudioMixin, EagerMixin, BaseDataset):
@@ -11,16 +18,21 @@ class EagerAudioDataset(AudioMixin, EagerMixin, BaseDataset):
         root (str): The root directory of the dataset.
         transform (DataTransform | None): The transformation to be applied
             to the data points.
-        _data (list): The list of data points in the dataset.
+        classes (tuple[str, ...]): The sorted names of the classes.
+        class_to_idx (dict[str, int]): The label id of every class.
+        label_ids (np.ndarray): The label id of every data point.
+        _data (LabeledTable): The data points and their label ids.
 
     Methods:
-        load(self)
+        load(self, num_workers, executor)
         __getitem__(self, index: int)
         _load_single_data(self, path: str)
         _check_valid_transform(self, transform)
     """
 
-    def __init__(self, root: str, transform: DataTransform | None = None) -> None:
+    def __init__(
+        self, root: str, transform: DataTransform | None = None, **kwargs
+    ) -> None:
         """
         Initializes the EagerAudioDataset class.
 
@@ -28,8 +40,27 @@ class EagerAudioDataset(AudioMixin, EagerMixin, BaseDataset):
             root (str): The root directory of the dataset.
             transform (DataTransform | None): The transformation to be applied
                 to the data points.
+
+        Keyword Args:
+            sr (float | None): The sampling rate to resample to, None keeps the
+                native sampling rate.
+            mono (bool): Whether multichannel audio is mixed down to mono.
+            res_type (str): The resampling method, see utils.RES_TYPES.
+            num_workers (int): The number of workers used to decode the files
+                while loading. With 0 the files are decoded one after another.
+            executor (str): The type of pool used by the workers,
+                either "thread" or "process".
+            readonly (bool): Whether data points are returned as read-only
+                arrays instead of deep copies.
+            disk_cache (DiskCache | None): The persistent cache of decoded data.
+            feature_store (LRUCache | DiskCache | None): The store of outputs of
+                deterministic transforms, such as spectrograms.
+            manifest (str | None): The path of a file listing the files in root,
+                reused while the directories are unchanged.
+            instrumentation (Instrumentation | None): Records the time and bytes
+                of every stage of __getitem__.
         """
-        super().__init__(root, transform)
+        super().__init__(root, transform, **kwargs)
 
 
 class LazyAudioDataset(AudioMixin, LazyMixin, BaseDataset):
@@ -40,16 +71,24 @@ class LazyAudioDataset(AudioMixin, LazyMixin, BaseDataset):
         root (str): The root directory of the dataset.
         transform (DataTransform | None): The transformation to be applied
             to the data points.
-        _data (list): The list of data points in the dataset.
+        classes (tuple[str, ...]): The sorted names of the classes.
+        class_to_idx (dict[str, int]): The label id of every class.
+        label_ids (np.ndarray): The label id of every data point.
+        _data (LabeledTable): The data points and their label ids.
 
     Methods:
         load(self)
         __getitem__(self, index: int)
         _load_single_data(self, path: str)
         _check_valid_transform(self, transform)
+        prefetch(self, indices, prefetch, num_workers)
+        aget(self, index)
+        abatches(self, batch_size, indices, collate_fn)
     """
 
-    def __init__(self, root: str, transform: DataTransform | None = None) -> None:
+    def __init__(
+        self, root: str, transform: DataTransform | None = None, **kwargs
+    ) -> None:
         """
         Initializes the LazyAudioDataset class.
 
@@ -57,8 +96,24 @@ class LazyAudioDataset(AudioMixin, LazyMixin, BaseDataset):
             root (str): The root directory of the dataset.
             transform (DataTransform | None): The transformation to be applied
                 to the data points.
+
+        Keyword Args:
+            sr (float | None): The sampling rate to resample to, None keeps the
+                native sampling rate.
+            mono (bool): Whether multichannel audio is mixed down to mono.
+            res_type (str): The resampling method, see utils.RES_TYPES.
+            cache (LRUCache | None): The in-memory cache of decoded data points.
+            async_workers (int): The maximum number of data points that aget
+                and abatches decode at the same time.
+            disk_cache (DiskCache | None): The persistent cache of decoded data.
+            feature_store (LRUCache | DiskCache | None): The store of outputs of
+                deterministic transforms, such as spectrograms.
+            manifest (str | None): The path of a file listing the files in root,
+                reused while the directories are unchanged.
+            instrumentation (Instrumentation | None): Records the time and bytes
+                of every stage of __getitem__.
         """
-        super().__init__(root, transform)
+        super().__init__(root, transform, **kwargs)
 
 
 class EagerImageDataset(ImageMixin, EagerMixin, BaseDataset):
@@ -69,16 +124,21 @@ class EagerImageDataset(ImageMixin, EagerMixin, BaseDataset):
         root (str): The root directory of the dataset.
         transform (DataTransform | None): The transformation to be applied
             to the data points.
-        _data (list): The list of data points in the dataset.
+        classes (tuple[str, ...]): The sorted names of the classes.
+        class_to_idx (dict[str, int]): The label id of every class.
+        label_ids (np.ndarray): The label id of every data point.
+        _data (LabeledTable): The data points and their label ids.
 
     Methods:
-        load(self)
+        load(self, num_workers, executor)
         __getitem__(self, index: int)
         _load_single_data(self, path: str)
         _check_valid_transform(self, transform)
     """
 
-    def __init__(self, root: str, transform: DataTransform | None = None) -> None:
+    def __init__(
+        self, root: str, transform: DataTransform | None = None, **kwargs
+    ) -> None:
         """
         Initializes the EagerImageDataset class.
 
@@ -86,8 +146,27 @@ class EagerImageDataset(ImageMixin, EagerMixin, BaseDataset):
             root (str): The root directory of the dataset.
             transform (DataTransform | None): The transformation to be applied
                 to the data points.
+
+        Keyword Args:
+            reduction (int): The factor the resolution is reduced by while
+                decoding, see utils.IMAGE_REDUCTIONS.
+            size (tuple[int, int] | None): The (height, width) images are resized
+                to, None keeps the decoded size.
+            num_workers (int): The number of workers used to decode the files
+                while loading. With 0 the files are decoded one after another.
+            executor (str): The type of pool used by the workers,
+                either "thread" or "process".
+            readonly (bool): Whether data points are returned as read-only
+                arrays instead of deep copies.
+            disk_cache (DiskCache | None): The persistent cache of decoded data.
+            feature_store (LRUCache | DiskCache | None): The store of outputs of
+                deterministic transforms, such as spectrograms.
+            manifest (str | None): The path of a file listing the files in root,
+                reused while the directories are unchanged.
+            instrumentation (Instrumentation | None): Records the time and bytes
+                of every stage of __getitem__.
         """
-        super().__init__(root, transform)
+        super().__init__(root, transform, **kwargs)
 
 
 class LazyImageDataset(ImageMixin, LazyMixin, BaseDataset):
@@ -98,16 +177,24 @@ class LazyImageDataset(ImageMixin, LazyMixin, BaseDataset):
         root (str): The root directory of the dataset.
         transform (DataTransform | None): The transformation to be applied
             to the data points.
-        _data (list): The list of data points in the dataset.
+        classes (tuple[str, ...]): The sorted names of the classes.
+        class_to_idx (dict[str, int]): The label id of every class.
+        label_ids (np.ndarray): The label id of every data point.
+        _data (LabeledTable): The data points and their label ids.
 
     Methods:
         load(self)
         __getitem__(self, index: int)
         _load_single_data(self, path: str)
         _check_valid_transform(self, transform)
+        prefetch(self, indices, prefetch, num_workers)
+        aget(self, index)
+        abatches(self, batch_size, indices, collate_fn)
     """
 
-    def __init__(self, root: str, transform: DataTransform | None = None) -> None:
+    def __init__(
+        self, root: str, transform: DataTransform | None = None, **kwargs
+    ) -> None:
         """
         Initializes the LazyImageDataset class.
 
@@ -115,5 +202,103 @@ class LazyImageDataset(ImageMixin, LazyMixin, BaseDataset):
             root (str): The root directory of the dataset.
             transform (DataTransform | None): The transformation to be applied
                 to the data points.
+
+        Keyword Args:
+            reduction (int): The factor the resolution is reduced by while
+                decoding, see utils.IMAGE_REDUCTIONS.
+            size (tuple[int, int] | None): The (height, width) images are resized
+                to, None keeps the decoded size.
+            cache (LRUCache | None): The in-memory cache of decoded data points.
+            async_workers (int): The maximum number of data points that aget
+                and abatches decode at the same time.
+            disk_cache (DiskCache | None): The persistent cache of decoded data.
+            feature_store (LRUCache | DiskCache | None): The store of outputs of
+                deterministic transforms, such as spectrograms.
+            manifest (str | None): The path of a file listing the files in root,
+                reused while the directories are unchanged.
+            instrumentation (Instrumentation | None): Records the time and bytes
+                of every stage of __getitem__.
+        """
+        super().__init__(root, transform, **kwargs)
+
+
+class PackedAudioDataset(AudioMixin, PackedMixin, BaseDataset):
+    """
+    PackedAudioDataset class
+
+    Reads an audio dataset written by datasets.packed.pack_dataset.
+
+    Attributes:
+        root (str): The directory of the packed dataset.
+        transform (DataTransform | None): The transformation to be applied
+            to the data points.
+        classes (tuple[str, ...]): The sorted names of the classes.
+        class_to_idx (dict[str, int]): The label id of every class.
+        label_ids (np.ndarray): The label id of every data point.
+        _data (np.ndarray): The memory map of the packed data points.
+
+    Methods:
+        load(self)
+        __getitem__(self, index: int)
+        _check_valid_transform(self, transform)
+    """
+
+    def __init__(
+        self,
+        root: str,
+        transform: DataTransform | None = None,
+        *,
+        instrumentation: Instrumentation | None = None,
+    ) -> None:
+        """
+        Initializes the PackedAudioDataset class.
+
+        Args:
+            root (str): The directory of the packed dataset.
+            transform (DataTransform | None): The transformation to be applied
+                to the data points.
+            instrumentation (Instrumentation | None): Records the time and bytes
+                of every stage of __getitem__.
+        """
+        super().__init__(root, transform, instrumentation=instrumentation)
+
+
+class PackedImageDataset(ImageMixin, PackedMixin, BaseDataset):
+    """
+    PackedImageDataset class
+
+    Reads an image dataset written by datasets.packed.pack_dataset.
+
+    Attributes:
+        root (str): The directory of the packed dataset.
+        transform (DataTransform | None): The transformation to be applied
+            to the data points.
+        classes (tuple[str, ...]): The sorted names of the classes.
+        class_to_idx (dict[str, int]): The label id of every class.
+        label_ids (np.ndarray): The label id of every data point.
+        _data (np.ndarray): The memory map of the packed data points.
+
+    Methods:
+        load(self)
+        __getitem__(self, index: int)
+        _check_valid_transform(self, transform)
+    """
+
+    def __init__(
+        self,
+        root: str,
+        transform: DataTransform | None = None,
+        *,
+        instrumentation: Instrumentation | None = None,
+    ) -> None:
+        """
+        Initializes the PackedImageDataset class.
+
+        Args:
+            root (str): The directory of the packed dataset.
+            transform (DataTransform | None): The transformation to be applied
+                to the data points.
+            instrumentation (Instrumentation | None): Records the time and bytes
+                of every stage of __getitem__.
         """
-        super().__init__(root, transform)
+        super().__init__(root, transform, instrumentation=instrumentation)
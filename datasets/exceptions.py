@@ -17,7 +17,7 @@ class ImageNotFoundError(Exception):
             path (str): The path to the image that was not found.
         """
         self._path = path
-        super().__init__()
+        super().__init__(path)
 
     def __str__(self) -> str:
         """
@@ -45,7 +45,7 @@ class AudioNotFoundError(Exception):
             path (str): The path to the audio file that was not found.
         """
         self._path = path
-        super().__init__()
+        super().__init__(path)
 
     def __str__(self) -> str:
         """
@@ -0,0 +1,181 @@
+# Import libraries
+from collections.abc import Iterable, Sequence
+from typing import TypeVar, overload
+
+import numpy as np
+
+T = TypeVar("T")
+
+
+class PackedStrings(Sequence[str]):
+    """
+    Packed String Table
+
+    Stores strings as a single UTF-8 encoded bytes object and an array of
+    offsets, instead of one Python str object per string.
+
+    Attributes:
+        nbytes (int): The number of bytes of the table.
+
+    Methods:
+        __getitem__(index): Returns the string at the given index.
+        __len__(): Returns the number of strings.
+    """
+
+    def __init__(self, strings: Iterable[str]) -> None:
+        """
+        Initializes the PackedStrings class.
+
+        Args:
+            strings (Iterable[str]): The strings to be stored.
+        """
+        encoded = [string.encode() for string in strings]
+
+        # String i is stored in _blob[_offsets[i] : _offsets[i + 1]]
+        self._blob = b"".join(encoded)
+        self._offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(string) for string in encoded], out=self._offsets[1:])
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Returns the number of bytes of the table.
+
+        Returns:
+            int: The number of bytes of the strings and offsets.
+        """
+        return len(self._blob) + self._offsets.nbytes
+
+    def __len__(self) -> int:
+        """
+        Returns the number of strings.
+
+        Returns:
+            int: The number of strings.
+        """
+        return len(self._offsets) - 1
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        """
+        Returns the string at the given index.
+
+        Args:
+            index (int | slice): The index of the string.
+
+        Returns:
+            str | list[str]: The decoded string, or a list for a slice.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        # Normalize negative indices and check the range
+        positions = range(len(self))[index]
+        if isinstance(positions, range):
+            return [self[position] for position in positions]
+
+        start, end = self._offsets[positions], self._offsets[positions + 1]
+        return self._blob[start:end].decode()
+
+
+class LabeledTable(Sequence[tuple[T, str]]):
+    """
+    Labeled Table
+
+    Stores the data points of a dataset as a sequence of items, such as paths
+    or arrays, and a NumPy array of integer label ids. Indexing returns the
+    item and the name of its class, like a list of (item, label) tuples.
+
+    Attributes:
+        items (Sequence[T]): The items of the data points.
+        label_ids (np.ndarray): The label id of every data point.
+        classes (tuple[str, ...]): The name of every label id.
+
+    Methods:
+        __getitem__(index): Returns the item and label at the given index.
+        __len__(): Returns the number of data points.
+    """
+
+    def __init__(
+        self, items: Sequence[T], label_ids: np.ndarray, classes: tuple[str, ...]
+    ) -> None:
+        """
+        Initializes the LabeledTable class.
+
+        Args:
+            items (Sequence[T]): The items of the data points.
+            label_ids (np.ndarray): The label id of every data point.
+            classes (tuple[str, ...]): The name of every label id.
+        """
+        self._items = items
+        self._label_ids = label_ids
+        self._classes = classes
+
+    @property
+    def items(self) -> Sequence[T]:
+        """
+        Returns the items of the data points.
+
+        Returns:
+            Sequence[T]: The items of the data points.
+        """
+        return self._items
+
+    @property
+    def label_ids(self) -> np.ndarray:
+        """
+        Returns the label id of every data point.
+
+        Returns:
+            np.ndarray: The label ids.
+        """
+        return self._label_ids
+
+    @property
+    def classes(self) -> tuple[str, ...]:
+        """
+        Returns the name of every label id.
+
+        Returns:
+            tuple[str, ...]: The names of the classes.
+        """
+        return self._classes
+
+    def __len__(self) -> int:
+        """
+        Returns the number of data points.
+
+        Returns:
+            int: The number of data points.
+        """
+        return len(self._label_ids)
+
+    @overload
+    def __getitem__(self, index: int) -> tuple[T, str]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[tuple[T, str]]: ...
+
+    def __getitem__(self, index: int | slice) -> tuple[T, str] | list[tuple[T, str]]:
+        """
+        Returns the item and label at the given index.
+
+        Args:
+            index (int | slice): The index of the data point.
+
+        Returns:
+            tuple[T, str] | list[tuple[T, str]]: The item and the name of its
+                class, or a list for a slice.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if isinstance(index, slice):
+            return [self[position] for position in range(len(self))[index]]
+
+        return self._items[index], self._classes[self._label_ids[index]]
@@ -0,0 +1,290 @@
+# Import libraries
+import threading
+import time
+from collections.abc import Callable
+from typing import NamedTuple, TypeVar
+
+import numpy as np
+
+# Import from other modules
+from datasets.utils import DATA_RETURN_TYPES, STAGE_HISTOGRAM_EDGES, data_nbytes
+
+T = TypeVar("T")
+
+
+class StageTiming(NamedTuple):
+    """
+    Wall time and size of one stage of one data point
+
+    Attributes:
+        seconds (float): The wall time of the stage in seconds.
+        nbytes (int): The number of bytes the stage produced.
+    """
+
+    seconds: float
+    nbytes: int
+
+
+class SampleTiming(NamedTuple):
+    """
+    Timings of the stages of one __getitem__ call
+
+    Attributes:
+        index (int): The index of the data point.
+        stages (dict[str, StageTiming]): The timing of every stage that ran,
+            in the order they ran.
+        total_s (float): The wall time of the whole call in seconds.
+    """
+
+    index: int
+    stages: dict[str, StageTiming]
+    total_s: float
+
+
+class StageSummary(NamedTuple):
+    """
+    Aggregate of one stage over all recorded data points
+
+    The percentiles are read from the histogram, so they are the upper edge of
+    the histogram bin that contains them.
+
+    Attributes:
+        count (int): The number of data points that ran the stage.
+        total_s (float): The total wall time in seconds.
+        mean_s (float): The mean wall time in seconds.
+        p50_s (float): The median wall time in seconds.
+        p99_s (float): The 99th percentile of the wall time in seconds.
+        nbytes (int): The total number of bytes the stage produced.
+    """
+
+    count: int
+    total_s: float
+    mean_s: float
+    p50_s: float
+    p99_s: float
+    nbytes: int
+
+
+class Instrumentation:
+    """
+    Per-stage timing of __getitem__
+
+    A dataset given an Instrumentation records the wall time and the produced
+    bytes of every stage, such as reading, decoding or transforming, for every
+    data point it returns. The timings are aggregated into histograms and
+    passed to an optional callback. Stages are laps: each one lasts from the
+    end of the previous stage, so they add up to the call.
+
+    Recording is per thread, so data points returned concurrently do not mix.
+    Copies sent to worker processes record separately from the original.
+
+    Attributes:
+        edges (np.ndarray): The edges of the histogram bins in seconds.
+
+    Methods:
+        record(index, function, *args): Calls function and records its stages.
+        mark(stage, data): Ends a stage of the data point being recorded.
+        histogram(stage): Returns the histogram counts of a stage.
+        summary(): Returns the aggregate of every stage.
+        reset(): Removes all recorded timings.
+    """
+
+    def __init__(self, callback: Callable[[SampleTiming], None] | None = None) -> None:
+        """
+        Initializes the Instrumentation class.
+
+        Args:
+            callback (Callable[[SampleTiming], None] | None): Called with the
+                timings of every recorded data point, for example to forward
+                them to a metrics system. None only aggregates them.
+        """
+        self._callback = callback
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.reset()
+
+    @property
+    def edges(self) -> np.ndarray:
+        """
+        Returns the edges of the histogram bins.
+
+        Returns:
+            np.ndarray: The edges in seconds, from 1 us to 100 s.
+        """
+        return STAGE_HISTOGRAM_EDGES
+
+    def reset(self) -> None:
+        """
+        Removes all recorded timings.
+        """
+        with self._lock:
+            # Histogram counts, total seconds and bytes per stage
+            self._counts: dict[str, np.ndarray] = {}
+            self._seconds: dict[str, float] = {}
+            self._nbytes: dict[str, int] = {}
+
+    def record(self, index: int, function: Callable[..., T], *args: object) -> T:
+        """
+        Calls function and records the stages marked while it runs.
+
+        Args:
+            index (int): The index of the data point.
+            function (Callable[..., T]): The function returning the data point.
+            *args (object): The arguments of the function.
+
+        Returns:
+            T: The result of the function.
+        """
+        # Start a lap timer for this thread
+        local = self._local
+        local.stages = {}
+        start = local.last = time.perf_counter_ns()
+
+        # Data points that raise are not recorded
+        try:
+            result = function(*args)
+        finally:
+            stages, local.stages = local.stages, None
+        total_s = (time.perf_counter_ns() - start) / 1e9
+
+        timing = SampleTiming(index, stages, total_s)
+        self._aggregate(timing)
+        if self._callback is not None:
+            self._callback(timing)
+
+        return result
+
+    def mark(self, stage: str, data: DATA_RETURN_TYPES | bytes | None = None) -> None:
+        """
+        Ends a stage of the data point being recorded on this thread.
+
+        Marks outside of record, such as while an eager dataset loads, are
+        ignored.
+
+        Args:
+            stage (str): The name of the stage.
+            data (DATA_RETURN_TYPES | bytes | None): The output of the stage,
+                whose size is recorded.
+        """
+        # Ignore marks outside of a recorded data point
+        stages = getattr(self._local, "stages", None)
+        if stages is None:
+            return
+
+        # The stage lasted since the end of the previous one
+        now = time.perf_counter_ns()
+        seconds = (now - self._local.last) / 1e9
+        self._local.last = now
+
+        # Count the bytes of the output
+        if data is None:
+            nbytes = 0
+        elif isinstance(data, bytes):
+            nbytes = len(data)
+        else:
+            nbytes = data_nbytes(data)
+
+        # A stage that runs twice is summed
+        if stage in stages:
+            seconds += stages[stage].seconds
+            nbytes += stages[stage].nbytes
+        stages[stage] = StageTiming(seconds, nbytes)
+
+    def _aggregate(self, timing: SampleTiming) -> None:
+        """
+        Adds the timings of a data point to the histograms.
+
+        Args:
+            timing (SampleTiming): The timings of the data point.
+        """
+        entries = [(name, s.seconds, s.nbytes) for name, s in timing.stages.items()]
+        entries.append(("total", timing.total_s, 0))
+
+        with self._lock:
+            for stage, seconds, nbytes in entries:
+                if stage not in self._counts:
+                    self._counts[stage] = np.zeros(len(self.edges) + 1, np.int64)
+                    self._seconds[stage] = 0.0
+                    self._nbytes[stage] = 0
+
+                # Bin 0 holds shorter times, the last bin longer times
+                self._counts[stage][np.searchsorted(self.edges, seconds)] += 1
+                self._seconds[stage] += seconds
+                self._nbytes[stage] += nbytes
+
+    def histogram(self, stage: str) -> np.ndarray:
+        """
+        Returns the histogram counts of a stage.
+
+        Count i is the number of times in (edges[i - 1], edges[i]]. The first
+        and last counts hold the times outside of the edges.
+
+        Args:
+            stage (str): The name of the stage, or "total" for the whole call.
+
+        Returns:
+            np.ndarray: The counts, of length len(edges) + 1.
+
+        Raises:
+            KeyError: If the stage was never recorded.
+        """
+        with self._lock:
+            return self._counts[stage].copy()
+
+    def _percentile(self, counts: np.ndarray, q: float) -> float:
+        """
+        Returns the upper edge of the bin that contains a percentile.
+
+        Args:
+            counts (np.ndarray): The histogram counts.
+            q (float): The percentile, between 0 and 100.
+
+        Returns:
+            float: The percentile in seconds, inf beyond the last edge.
+        """
+        position = np.searchsorted(np.cumsum(counts), q / 100 * counts.sum())
+        return float(self.edges[position]) if position < len(self.edges) else np.inf
+
+    def summary(self) -> dict[str, StageSummary]:
+        """
+        Returns the aggregate of every stage.
+
+        Returns:
+            dict[str, StageSummary]: The aggregate per stage, including "total"
+                for the whole __getitem__ call.
+        """
+        with self._lock:
+            summary = {}
+            for stage, counts in self._counts.items():
+                count = int(counts.sum())
+                summary[stage] = StageSummary(
+                    count=count,
+                    total_s=self._seconds[stage],
+                    mean_s=self._seconds[stage] / count,
+                    p50_s=self._percentile(counts, 50),
+                    p99_s=self._percentile(counts, 99),
+                    nbytes=self._nbytes[stage],
+                )
+            return summary
+
+    def __getstate__(self) -> dict:
+        """
+        Returns the state for pickling, without the lock and thread state.
+
+        Returns:
+            dict: The picklable state.
+        """
+        state = self.__dict__.copy()
+        del state["_lock"], state["_local"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restores the state with a new lock and thread state.
+
+        Args:
+            state (dict): The state returned by __getstate__.
+        """
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._local = threading.local()
@@ -0,0 +1,350 @@
+# Import libraries
+import math
+from collections.abc import Callable, Iterator
+from typing import cast
+
+import numpy as np
+
+# Import from other modules
+from datasets.baseclasses import BaseDataset, DataTransform
+from datasets.utils import (
+    BATCH_RETURN_TYPE,
+    BATCH_STREAM,
+    DATA_RETURN_TYPES,
+    GETITEM_RETURN_TYPE,
+    INVALID_S_T_MSG,
+    MIXED_SR_MSG,
+    ORDER_STREAM,
+    SAMPLE_STREAM,
+    SEED,
+    rng_scope,
+    spawn_rng,
+)
+
+# Type hint of a collate function
+COLLATE_FN = Callable[[list[DATA_RETURN_TYPES]], DATA_RETURN_TYPES]
+
+
+def collate_images(samples: list[np.ndarray]) -> np.ndarray:
+    """
+    Stacks fixed-size images into a single array.
+
+    Args:
+        samples (list[np.ndarray]): The images, all of shape (H, W, C).
+
+    Returns:
+        np.ndarray: The stacked images of shape (N, H, W, C).
+    """
+    return np.stack(samples)
+
+
+def collate_audio(samples: list[tuple[np.ndarray, float]]) -> tuple[np.ndarray, float]:
+    """
+    Zero-pads variable-length audio to the longest sample and stacks it.
+
+    Padding happens along the last axis, so this also collates spectrograms
+    with a different number of frames.
+
+    Args:
+        samples (list[tuple[np.ndarray, float]]): The audio and sampling rates.
+
+    Returns:
+        tuple[np.ndarray, float]: The padded audio of shape (N, ..., T_max)
+            and the shared sampling rate.
+
+    Raises:
+        ValueError: If the samples have different sampling rates.
+    """
+    # All samples in a batch must share the sampling rate
+    sampling_rates = {sr for _, sr in samples}
+    if len(sampling_rates) > 1:
+        raise ValueError(MIXED_SR_MSG.format(sorted(sampling_rates)))
+
+    # Allocate the padded batch once and copy every sample into it
+    first = samples[0][0]
+    max_length = max(audio.shape[-1] for audio, _ in samples)
+    batch = np.zeros((len(samples), *first.shape[:-1], max_length), dtype=first.dtype)
+    for i, (audio, _) in enumerate(samples):
+        batch[i, ..., : audio.shape[-1]] = audio
+
+    # Return the batch and sampling rate
+    return batch, samples[0][1]
+
+
+def default_collate(samples: list[DATA_RETURN_TYPES]) -> DATA_RETURN_TYPES:
+    """
+    Collates audio with collate_audio and images with collate_images.
+
+    Args:
+        samples (list[DATA_RETURN_TYPES]): The samples to collate.
+
+    Returns:
+        DATA_RETURN_TYPES: The collated batch.
+    """
+    # Audio samples are (audio, sampling rate) tuples, a batch has one type
+    if isinstance(samples[0], tuple):
+        return collate_audio(cast("list[tuple[np.ndarray, float]]", samples))
+
+    # Else the samples are images
+    return collate_images(cast("list[np.ndarray]", samples))
+
+
+def transform_collate(
+    transform: DataTransform, collate_fn: COLLATE_FN = default_collate
+) -> COLLATE_FN:
+    """
+    Returns a collate function that also transforms every batch at once.
+
+    Unlike the transform of a dataset, which runs once per data point, the
+    transform runs once per batch through its vectorized process_batch.
+
+    Args:
+        transform (DataTransform): The transform applied to every batch.
+        collate_fn (COLLATE_FN): The function combining the data points.
+
+    Returns:
+        COLLATE_FN: The function collating and then transforming the batch.
+    """
+
+    def collate(samples: list[DATA_RETURN_TYPES]) -> DATA_RETURN_TYPES:
+        # Collate the data points and transform the batch
+        return transform.process_batch(collate_fn(samples))
+
+    return collate
+
+
+class BatchLoader:
+    """
+    Batch Loader
+
+    Iterates over a dataset in batches of stacked data and label ids. The
+    label ids are gathered from dataset.label_ids, dataset.classes names them.
+
+    Random transforms of the dataset and of the collate function do not draw
+    from the shared RNG. Every data point and every batch gets its own random
+    stream, spawned from the seed, the epoch and its index, so the epochs are
+    reproducible and the streams never depend on which worker loads them.
+
+    Attributes:
+        dataset (BaseDataset): The dataset to be batched.
+        batch_size (int): The number of data points per batch.
+        shuffle (bool): Whether the order is shuffled every epoch.
+        drop_last (bool): Whether the last incomplete batch is dropped.
+        seed (int): The seed of the random streams.
+        epoch (int): The number of the next epoch.
+
+    Methods:
+        __iter__(): Returns an iterator over the batches of one epoch.
+        __len__(): Returns the number of batches per epoch.
+    """
+
+    def __init__(  # noqa: PLR0913 - the options after * are keyword-only
+        self,
+        dataset: BaseDataset,
+        batch_size: int = 1,
+        *,
+        shuffle: bool = False,
+        drop_last: bool = False,
+        collate_fn: COLLATE_FN | None = None,
+        seed: int = SEED,
+    ) -> None:
+        """
+        Initializes the BatchLoader class.
+
+        Args:
+            dataset (BaseDataset): The dataset to be batched.
+            batch_size (int): The number of data points per batch.
+            shuffle (bool): Whether the order is shuffled every epoch.
+            drop_last (bool): Whether the last incomplete batch is dropped.
+            collate_fn (COLLATE_FN | None): The function combining a list of
+                data points into a batch, defaults to default_collate.
+            seed (int): The seed of the random streams of every epoch.
+
+        Raises:
+            ValueError: If batch_size is less than or equal to 0.
+        """
+        if batch_size <= 0:
+            raise ValueError(INVALID_S_T_MSG.format("batch_size", "0"))
+
+        self._dataset = dataset
+        self._batch_size = batch_size
+        self._shuffle = shuffle
+        self._drop_last = drop_last
+        self._collate_fn = default_collate if collate_fn is None else collate_fn
+        self._seed = seed
+        self._epoch = 0
+
+    @property
+    def dataset(self) -> BaseDataset:
+        """
+        Returns the dataset to be batched.
+
+        Returns:
+            BaseDataset: The dataset to be batched.
+        """
+        return self._dataset
+
+    @property
+    def batch_size(self) -> int:
+        """
+        Returns the number of data points per batch.
+
+        Returns:
+            int: The number of data points per batch.
+        """
+        return self._batch_size
+
+    @property
+    def shuffle(self) -> bool:
+        """
+        Returns whether the order is shuffled every epoch.
+
+        Returns:
+            bool: Whether the order is shuffled every epoch.
+        """
+        return self._shuffle
+
+    @property
+    def drop_last(self) -> bool:
+        """
+        Returns whether the last incomplete batch is dropped.
+
+        Returns:
+            bool: Whether the last incomplete batch is dropped.
+        """
+        return self._drop_last
+
+    @property
+    def seed(self) -> int:
+        """
+        Returns the seed of the random streams.
+
+        Returns:
+            int: The seed of the random streams.
+        """
+        return self._seed
+
+    @property
+    def epoch(self) -> int:
+        """
+        Returns the number of the next epoch.
+
+        Returns:
+            int: The number of the next epoch, 0 before the first one.
+        """
+        return self._epoch
+
+    @epoch.setter
+    def epoch(self, epoch: int) -> None:
+        """
+        Sets the number of the next epoch, for example to repeat an epoch.
+
+        Args:
+            epoch (int): The number of the next epoch.
+
+        Raises:
+            ValueError: If epoch is negative.
+        """
+        if epoch < 0:
+            raise ValueError(INVALID_S_T_MSG.format("epoch", "-1"))
+        self._epoch = epoch
+
+    def __len__(self) -> int:
+        """
+        Returns the number of batches per epoch.
+
+        Returns:
+            int: The number of batches per epoch.
+        """
+        # Drop or round up the last incomplete batch
+        if self._drop_last:
+            return len(self._dataset) // self._batch_size
+        return math.ceil(len(self._dataset) / self._batch_size)
+
+    def _batch_indices(self, epoch: int) -> Iterator[np.ndarray]:
+        """
+        Returns the indices of every batch of one epoch.
+
+        Args:
+            epoch (int): The number of the epoch.
+
+        Returns:
+            Iterator[np.ndarray]: The indices of every batch.
+        """
+        # Shuffle the order if requested
+        if self._shuffle:
+            rng = spawn_rng(self._seed, epoch, ORDER_STREAM)
+            order = rng.permutation(len(self._dataset))
+        else:
+            order = np.arange(len(self._dataset))
+
+        # Yield the indices of one batch at a time
+        for batch in range(len(self)):
+            yield order[batch * self._batch_size : (batch + 1) * self._batch_size]
+
+    def _get_sample(self, epoch: int, index: int) -> GETITEM_RETURN_TYPE:
+        """
+        Returns a data point, transformed with its own random stream.
+
+        Args:
+            epoch (int): The number of the epoch.
+            index (int): The index of the data point.
+
+        Returns:
+            GETITEM_RETURN_TYPE: The data point and its label.
+        """
+        with rng_scope(spawn_rng(self._seed, epoch, SAMPLE_STREAM, index)):
+            return self._dataset[index]
+
+    def __iter__(self) -> Iterator[BATCH_RETURN_TYPE]:
+        """
+        Returns an iterator over the batches of one epoch.
+
+        Every call starts the next epoch.
+
+        Returns:
+            Iterator[BATCH_RETURN_TYPE]: The collated data and the label ids
+                of every batch.
+        """
+        # Claim the epoch now, so that iterators of different epochs can overlap
+        epoch = self._epoch
+        self._epoch += 1
+        return self._iter_epoch(epoch)
+
+    def _iter_epoch(self, epoch: int) -> Iterator[BATCH_RETURN_TYPE]:
+        """
+        Returns an iterator over the batches of the given epoch.
+
+        Args:
+            epoch (int): The number of the epoch.
+
+        Returns:
+            Iterator[BATCH_RETURN_TYPE]: The collated data and the label ids
+                of every batch.
+        """
+        # Loop through the batches of this epoch
+        for batch, indices in enumerate(self._batch_indices(epoch)):
+            yield self._load_batch(epoch, batch, indices)
+
+    def _load_batch(
+        self, epoch: int, batch: int, indices: np.ndarray
+    ) -> BATCH_RETURN_TYPE:
+        """
+        Loads and collates one batch.
+
+        Args:
+            epoch (int): The number of the epoch.
+            batch (int): The number of the batch in the epoch.
+            indices (np.ndarray): The indices of the data points of the batch.
+
+        Returns:
+            BATCH_RETURN_TYPE: The collated data and the label ids.
+        """
+        # Get all data points of the batch
+        samples = [self._get_sample(epoch, int(index)) for index in indices]
+
+        # Collate the data with the stream of the batch, the label ids of the
+        # batch are a single gather
+        with rng_scope(spawn_rng(self._seed, epoch, BATCH_STREAM, batch)):
+            data = self._collate_fn([sample[0] for sample in samples])
+        return data, self._dataset.label_ids[indices]
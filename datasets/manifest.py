@@ -0,0 +1,196 @@
+# Import libraries
+import os
+import pathlib
+import tempfile
+import time
+import zipfile
+from typing import NamedTuple
+
+import numpy as np
+
+# Import from other modules
+from datasets.utils import MANIFEST_MTIME_RESOLUTION
+
+
+class Manifest(NamedTuple):
+    """
+    Result of scanning the root directory of a dataset
+
+    Paths are relative to the root, files are sorted by class and then by
+    name, so the order does not depend on the filesystem.
+
+    Attributes:
+        classes (tuple[str, ...]): The sorted names of the class directories.
+        paths (list[str]): The path of every file relative to the root.
+        label_ids (np.ndarray): The label id of every file.
+        sizes (np.ndarray): The size of every file in bytes, empty if the
+            files were not stat'ed.
+        mtimes (np.ndarray): The modification time of every file in
+            nanoseconds, empty if the files were not stat'ed.
+        dir_mtimes (np.ndarray): The modification times of the root and of
+            every class directory in nanoseconds.
+        scanned_at (int): The time the scan started in nanoseconds.
+    """
+
+    classes: tuple[str, ...]
+    paths: list[str]
+    label_ids: np.ndarray
+    sizes: np.ndarray
+    mtimes: np.ndarray
+    dir_mtimes: np.ndarray
+    scanned_at: int
+
+
+def _sorted_entries(path: str) -> list[os.DirEntry]:
+    """
+    Returns the entries of a directory sorted by name.
+
+    Args:
+        path (str): The directory to be listed.
+
+    Returns:
+        list[os.DirEntry]: The sorted entries.
+    """
+    with os.scandir(path) as entries:
+        return sorted(entries, key=lambda entry: entry.name)
+
+
+def scan_directory(root: str, *, stat: bool = False) -> Manifest:
+    """
+    Scans the class directories in root in a single pass with os.scandir.
+
+    The type of every entry comes from the directory listing, so without stat
+    no file is stat'ed on filesystems that report it. Entries in root that are
+    not directories and entries in the class directories that are not files
+    are skipped.
+
+    Args:
+        root (str): The root directory of the dataset.
+        stat (bool): Whether the size and modification time of every file are
+            collected, as needed to write a manifest.
+
+    Returns:
+        Manifest: The classes, paths and label ids of the files.
+    """
+    # Changes after this time may be missed by the scan
+    scanned_at = time.time_ns()
+
+    # The classes are the directories in root, numbered in sorted order
+    class_dirs = [entry for entry in _sorted_entries(root) if entry.is_dir()]
+    classes = tuple(entry.name for entry in class_dirs)
+
+    # Directory modification times tell later scans whether anything changed
+    dir_mtimes = [pathlib.Path(root).stat().st_mtime_ns]
+    paths, label_ids, sizes, mtimes = [], [], [], []
+    for label_id, class_dir in enumerate(class_dirs):
+        dir_mtimes.append(class_dir.stat().st_mtime_ns)
+
+        # Collect the files of the class, joining the paths as strings since a
+        # Path per file would cost more than listing the directory
+        for entry in _sorted_entries(class_dir.path):
+            if entry.is_file():
+                paths.append(os.path.join(class_dir.name, entry.name))  # noqa: PTH118
+                label_ids.append(label_id)
+                if stat:
+                    file_stat = entry.stat()
+                    sizes.append(file_stat.st_size)
+                    mtimes.append(file_stat.st_mtime_ns)
+
+    return Manifest(
+        classes=classes,
+        paths=paths,
+        label_ids=np.array(label_ids, dtype=np.int32),
+        sizes=np.array(sizes, dtype=np.int64),
+        mtimes=np.array(mtimes, dtype=np.int64),
+        dir_mtimes=np.array(dir_mtimes, dtype=np.int64),
+        scanned_at=scanned_at,
+    )
+
+
+def write_manifest(path: str, manifest: Manifest) -> None:
+    """
+    Writes a manifest to a file.
+
+    The file is written under a temporary name and renamed when complete, so
+    concurrent readers never see a partial manifest.
+
+    Args:
+        path (str): The path of the manifest file, outside of the root.
+        manifest (Manifest): The manifest to be written.
+    """
+    # Create the parent directory of the manifest
+    manifest_path = pathlib.Path(path)
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Write the arrays under a temporary name and rename the complete file
+    handle, temp_path = tempfile.mkstemp(dir=manifest_path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(handle, "wb") as file:
+            np.savez(
+                file,
+                classes=np.array(manifest.classes, dtype=str),
+                paths=np.array(manifest.paths, dtype=str),
+                label_ids=manifest.label_ids,
+                sizes=manifest.sizes,
+                mtimes=manifest.mtimes,
+                dir_mtimes=manifest.dir_mtimes,
+                scanned_at=np.int64(manifest.scanned_at),
+            )
+        pathlib.Path(temp_path).replace(manifest_path)
+    except BaseException:
+        pathlib.Path(temp_path).unlink(missing_ok=True)
+        raise
+
+
+def read_manifest(path: str, root: str) -> Manifest | None:
+    """
+    Reads a manifest if it still describes the root directory.
+
+    Adding, removing or renaming a file or class directory changes the
+    modification time of its parent directory. The manifest is therefore
+    reused when the root and the class directories have the modification
+    times stored in it, which costs one stat per class instead of a walk.
+
+    Modification times have a coarse resolution, so a file added right after
+    the scan may not change them. A manifest is only trusted for directories
+    last modified at least MANIFEST_MTIME_RESOLUTION seconds before its scan.
+
+    Args:
+        path (str): The path of the manifest file.
+        root (str): The root directory of the dataset.
+
+    Returns:
+        Manifest | None: The stored manifest, None if there is no readable
+            manifest or the directories changed since it was written.
+    """
+    # A missing or unreadable manifest is rebuilt
+    try:
+        with np.load(path, allow_pickle=False) as stored:
+            manifest = Manifest(
+                classes=tuple(str(name) for name in stored["classes"]),
+                paths=[str(file) for file in stored["paths"]],
+                label_ids=stored["label_ids"],
+                sizes=stored["sizes"],
+                mtimes=stored["mtimes"],
+                dir_mtimes=stored["dir_mtimes"],
+                scanned_at=int(stored["scanned_at"]),
+            )
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+        return None
+
+    # Compare the modification times of the directories
+    root_path = pathlib.Path(root)
+    dirs = [root_path, *(root_path / name for name in manifest.classes)]
+    try:
+        dir_mtimes = [directory.stat().st_mtime_ns for directory in dirs]
+    except OSError:
+        return None
+    if dir_mtimes != manifest.dir_mtimes.tolist():
+        return None
+
+    # Directories modified around the scan may have changed unnoticed
+    resolution = int(MANIFEST_MTIME_RESOLUTION * 1e9)
+    if max(dir_mtimes) > manifest.scanned_at - resolution:
+        return None
+
+    return manifest
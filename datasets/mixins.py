@@ -1,26 +1,62 @@
 # Import libraries
+import asyncio
 import pathlib
 from abc import abstractmethod
+from collections.abc import AsyncIterator, Callable, Iterable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from copy import deepcopy
+from typing import ClassVar, TypeVar
 
-import cv2
-import librosa
 import numpy as np
 
 # Import from other modules
-from datasets.baseclasses import DataTransform
+from datasets.baseclasses import BaseDataset, DataTransform, TransformedLoading
+from datasets.cache import (
+    CacheInfo,
+    DiskCache,
+    FileVersion,
+    LRUCache,
+    file_version,
+)
 from datasets.exceptions import (
     AudioNotFoundError,
     ImageNotFoundError,
     InvalidTransformError,
 )
+from datasets.index import LabeledTable, PackedStrings
+from datasets.instrumentation import Instrumentation
+from datasets.loader import COLLATE_FN, default_collate
+from datasets.prefetch import PrefetchIterator
 from datasets.transform import (
     CenterCropTransform,
+    ComposeTransform,
     RandomAudioCropTransform,
     SpectrogramTransform,
     SquareErasingTransform,
 )
-from datasets.utils import DATA_RETURN_TYPES, GETITEM_RETURN_TYPE
+from datasets.utils import (
+    BATCH_RETURN_TYPE,
+    DATA_RETURN_TYPES,
+    DEFAULT_RES_TYPE,
+    DEFAULT_SR,
+    EXECUTOR_TYPES,
+    GETITEM_RETURN_TYPE,
+    IMAGE_REDUCTIONS,
+    INVALID_EXECUTOR_MSG,
+    INVALID_REDUCTION_MSG,
+    INVALID_RES_TYPE_MSG,
+    INVALID_S_T_MSG,
+    INVALID_WORKERS_MSG,
+    PACKED_DATA_FILE,
+    PACKED_INDEX_FILE,
+    PACKED_TYPE_MSG,
+    RES_TYPES,
+    SEED,
+    readonly,
+    seed_thread,
+)
+
+T = TypeVar("T")
 
 
 class EagerMixin:
@@ -30,8 +66,63 @@ class EagerMixin:
 
     # Define attributes
     _root: str
-    _data: list[GETITEM_RETURN_TYPE]
+    _data: LabeledTable[DATA_RETURN_TYPES]
+    _paths: PackedStrings
+    _versions: list[FileVersion | None]
+    _feature_keys: tuple[DataTransform | None, list[str | None]] | None
+    _classes: tuple[str, ...]
+    _label_ids: np.ndarray
+    _scan: Callable[[], PackedStrings]
     _transform: DataTransform | None
+    _num_workers: int
+    _executor: str
+    _readonly: bool
+    _feature_store: LRUCache | DiskCache | None
+    _feature_stage: tuple[DataTransform, LRUCache | DiskCache] | None
+    _instrumentation: Instrumentation | None
+    _mark: Callable[[str, DATA_RETURN_TYPES | bytes | None], None]
+    _load_data: Callable[[str], DATA_RETURN_TYPES]
+    _feature_key: Callable[[str, DataTransform, FileVersion | None], str | None]
+    _load_features: Callable[
+        [
+            str | None,
+            Callable[[], DATA_RETURN_TYPES],
+            DataTransform,
+            LRUCache | DiskCache,
+        ],
+        DATA_RETURN_TYPES,
+    ]
+
+    def __init__(
+        self,
+        *args,
+        num_workers: int = 0,
+        executor: str = "thread",
+        readonly: bool = False,
+        **kwargs,
+    ) -> None:
+        """
+        Initializes the EagerMixin.
+
+        Args:
+            num_workers (int): The number of workers used to decode the files
+                in load(). With 0 the files are decoded one after another.
+            executor (str): The type of pool used when num_workers is greater
+                than 0, either "thread" or "process".
+            readonly (bool): Whether the loaded arrays are made read-only and
+                returned without copying them. Otherwise every access returns
+                a deep copy.
+
+        Raises:
+            ValueError: If num_workers is negative or executor is not valid.
+        """
+        # Check and set the worker configuration before the data is loaded
+        self._check_valid_workers(num_workers, executor)
+        self._num_workers = num_workers
+        self._executor = executor
+        self._readonly = readonly
+
+        super().__init__(*args, **kwargs)
 
     @abstractmethod
     def _load_single_data(self, path: str) -> DATA_RETURN_TYPES:
@@ -45,29 +136,214 @@ class EagerMixin:
             DATA_RETURN_TYPES: The loaded data item.
         """
 
-    def load(self) -> None:
+    @staticmethod
+    def _check_valid_workers(num_workers: int, executor: str | Executor) -> None:
+        """
+        Checks if the given worker configuration is valid.
+
+        Args:
+            num_workers (int): The number of workers.
+            executor (str | Executor): The type of pool or an existing pool.
+
+        Raises:
+            ValueError: If num_workers is negative or executor is not valid.
+        """
+        # Raise exception if the number of workers is negative
+        if num_workers < 0:
+            raise ValueError(INVALID_WORKERS_MSG)
+
+        # Raise exception if the executor is neither a pool nor a known type
+        if not isinstance(executor, Executor) and executor not in EXECUTOR_TYPES:
+            raise ValueError(INVALID_EXECUTOR_MSG.format(EXECUTOR_TYPES, executor))
+
+    def load(
+        self, num_workers: int | None = None, executor: str | Executor | None = None
+    ) -> None:
         """
         Loads the data from the root directory into _data.
 
+        The files are decoded in parallel when num_workers is greater than 0 or
+        when an existing executor is given. The order of _data does not depend
+        on the number of workers, and the first file that fails to decode raises
+        its exception just as in the serial case.
+
+        Args:
+            num_workers (int | None): The number of workers, defaults to the
+                value given at construction.
+            executor (str | Executor | None): "thread", "process" or an existing
+                executor, defaults to the value given at construction.
+                An existing executor is used as is and is not shut down.
+
         Returns:
             None
+
+        Raises:
+            ValueError: If num_workers is negative or executor is not valid.
         """
-        # Convert to pathlib path
-        root_path = pathlib.Path(self._root)
+        # Fall back to the worker configuration given at construction
+        num_workers = self._num_workers if num_workers is None else num_workers
+        executor = self._executor if executor is None else executor
+        self._check_valid_workers(num_workers, executor)
+
+        # Drop previously loaded data so a reload does not duplicate it
+        # and so it is not sent along to process workers
+        self._data = LabeledTable([], np.empty(0, dtype=np.int32), ())
+        self._versions = []
+        self._feature_keys = None
+
+        # Collect the paths and label ids (names of directories in root)
+        paths = self._scan()
+
+        # With a feature store, keep the version of every decoded file
+        if self._feature_store is None:
+            data = self._decode(paths, self._load_data, num_workers, executor)
+        else:
+            versioned = self._decode(paths, self._load_versioned, num_workers, executor)
+            self._versions = [version for version, _ in versioned]
+            data = [datapoint for _, datapoint in versioned]
 
-        # Iterate over labels (names of directories in root)
-        for label in root_path.iterdir():
-            # Iterate over files in label
-            for file in label.iterdir():
-                # If file is a file
-                if file.is_file():
-                    # Append to loaded data and label to _data
-                    self._data.append((self._load_single_data(str(file)), label.name))
+        # In read-only mode, protect the data from changes by callers
+        if self._readonly:
+            data = [readonly(datapoint) for datapoint in data]
+
+        # Store loaded data and label ids in _data, and the paths for the features
+        self._data = LabeledTable(data, self._label_ids, self._classes)
+        self._paths = paths
+
+    def _load_versioned(
+        self, path: str
+    ) -> tuple[FileVersion | None, DATA_RETURN_TYPES]:
+        """
+        Loads a single data point together with the version of its file.
+
+        The file is read after its version, so a change during the decoding
+        gives a version older than the data, which is never served again.
+
+        Args:
+            path (str): The path to the data point to be loaded.
+
+        Returns:
+            tuple[FileVersion | None, DATA_RETURN_TYPES]: The version, None if
+                the file cannot be accessed, and the loaded data point.
+        """
+        try:
+            version = file_version(path)
+        except OSError:
+            version = None
+        return version, self._load_data(path)
+
+    def _feature_key_at(self, index: int, transform: DataTransform) -> str | None:
+        """
+        Returns the feature store key of the data point at the given index.
+
+        The keys are computed from the versions read in load(), once per
+        transform, so the files are not accessed again.
+
+        Args:
+            index (int): The index of the data point.
+            transform (DataTransform): The transform of the feature store.
+
+        Returns:
+            str | None: The key, None if the file could not be accessed.
+        """
+        # Compute the keys of all data points when the transform changed
+        if self._feature_keys is None or self._feature_keys[0] is not transform:
+            keys = [
+                None if version is None else self._feature_key(path, transform, version)
+                for path, version in zip(self._paths, self._versions, strict=True)
+            ]
+            self._feature_keys = (transform, keys)
+
+        return self._feature_keys[1][index]
+
+    def _decode(
+        self,
+        paths: Sequence[str],
+        load: Callable[[str], T],
+        num_workers: int,
+        executor: str | Executor,
+    ) -> list[T]:
+        """
+        Decodes the given paths with the chosen strategy, see load().
+
+        Args:
+            paths (Sequence[str]): The paths of the files to decode.
+            load (Callable[[str], T]): The function decoding one path.
+            num_workers (int): The number of workers.
+            executor (str | Executor): "thread", "process" or an existing
+                executor.
+
+        Returns:
+            list[T]: The decoded data in the order of paths.
+        """
+        # Use the given executor, map keeps the order of the paths
+        if isinstance(executor, Executor):
+            return list(executor.map(load, paths))
+
+        # Decode one after another on the calling thread
+        if num_workers == 0:
+            return [load(path) for path in paths]
+
+        return self._load_in_pool(paths, load, num_workers, executor)
+
+    def _load_in_pool(
+        self,
+        paths: Sequence[str],
+        load: Callable[[str], T],
+        num_workers: int,
+        executor: str,
+    ) -> list[T]:
+        """
+        Decodes the given paths in a newly created pool.
+
+        Args:
+            paths (Sequence[str]): The paths of the files to decode.
+            load (Callable[[str], T]): The function decoding one path.
+            num_workers (int): The number of workers in the pool.
+            executor (str): The type of pool, either "thread" or "process".
+
+        Returns:
+            list[T]: The decoded data in the order of paths.
+        """
+        # Processes pay for every task in pickling, so send them in chunks
+        if executor == "process":
+            pool = ProcessPoolExecutor(max_workers=num_workers)
+            chunksize = max(1, len(paths) // (num_workers * 4))
+        else:
+            pool = ThreadPoolExecutor(max_workers=num_workers)
+            chunksize = 1
+
+        # Cancel the remaining files as soon as one of them fails
+        try:
+            return list(pool.map(load, paths, chunksize=chunksize))
+        finally:
+            pool.shutdown(cancel_futures=True)
 
     def __getitem__(self, index: int) -> GETITEM_RETURN_TYPE:
         """
         Returns the data point at the given index.
 
+        With instrumentation, the time and bytes of every stage are recorded.
+
+        Args:
+            index (int): The index of the data point to be retrieved.
+
+        Returns:
+            GETITEM_RETURN_TYPE: The data point at the given index.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        # Record the stages of the data point when instrumented
+        if self._instrumentation is not None:
+            return self._instrumentation.record(index, self._get_item, index)
+
+        return self._get_item(index)
+
+    def _get_item(self, index: int) -> GETITEM_RETURN_TYPE:
+        """
+        Returns the data point at the given index, see __getitem__.
+
         Args:
             index (int): The index of the data point to be retrieved.
 
@@ -83,22 +359,90 @@ class EagerMixin:
             # Get data and label
             data, label = self._data[index]
 
+            # Serve the output of a deterministic transform from the store
+            stage = self._feature_stage
+            if stage is not None:
+                key = self._feature_key_at(index, stage[0])
+                return self._load_features(key, lambda: data, *stage), label
+
             # Apply transform on data only and return transformed data and label
-            return (self._transform.process(data), label)
+            data = self._transform.process(data)
+            self._mark("transform", data)
+            return data, label
+
+        # Read-only data cannot be changed, so it is returned without a copy
+        if self._readonly:
+            return self._data[index]
 
         # Return a copy of the data
-        return deepcopy(self._data[index])
+        data, label = deepcopy(self._data[index])
+        self._mark("copy", data)
+        return data, label
 
 
 class LazyMixin:
     """
     Lazy Mixin
+
+    Besides __getitem__, the data points can be awaited with aget and
+    abatches. These decode in a pool of async_workers threads, so the event
+    loop is never blocked and at most async_workers files are decoded at once.
     """
 
     # Define attributes
     _root: str
-    _data: list[tuple[str, str]]
+    _data: LabeledTable[str]
+    _classes: tuple[str, ...]
+    _label_ids: np.ndarray
+    label_ids: np.ndarray
+    __len__: Callable[[], int]
+    _scan: Callable[[], PackedStrings]
     _transform: DataTransform | None
+    _cache: LRUCache | None
+    _disk_cache: DiskCache | None
+    _feature_stage: tuple[DataTransform, LRUCache | DiskCache] | None
+    _instrumentation: Instrumentation | None
+    _mark: Callable[[str, DATA_RETURN_TYPES | bytes | None], None]
+    _load_data: Callable[[str], DATA_RETURN_TYPES]
+    _load_transformed: Callable[[str], DATA_RETURN_TYPES]
+    _feature_key: Callable[[str, DataTransform, FileVersion | None], str | None]
+    _load_features: Callable[
+        [
+            str | None,
+            Callable[[], DATA_RETURN_TYPES],
+            DataTransform,
+            LRUCache | DiskCache,
+        ],
+        DATA_RETURN_TYPES,
+    ]
+
+    def __init__(
+        self,
+        *args,
+        cache: LRUCache | None = None,
+        async_workers: int = 4,
+        **kwargs,
+    ) -> None:
+        """
+        Initializes the LazyMixin.
+
+        Args:
+            cache (LRUCache | None): The in-memory cache of decoded data points,
+                placed in front of the transform. None disables caching.
+            async_workers (int): The maximum number of data points that aget
+                and abatches decode at the same time.
+
+        Raises:
+            ValueError: If async_workers is less than or equal to 0.
+        """
+        if async_workers <= 0:
+            raise ValueError(INVALID_S_T_MSG.format("async_workers", "0"))
+
+        self._cache = cache
+        self._async_workers = async_workers
+        self._async_executor: ThreadPoolExecutor | None = None
+
+        super().__init__(*args, **kwargs)
 
     @abstractmethod
     def _load_single_data(self, path: str) -> DATA_RETURN_TYPES:
@@ -112,30 +456,57 @@ class LazyMixin:
             DATA_RETURN_TYPES: The loaded data item.
         """
 
+    @property
+    def cache_info(self) -> CacheInfo | None:
+        """
+        Returns the counters and size of the cache.
+
+        Returns:
+            CacheInfo | None: The counters and size, None if caching is disabled.
+        """
+        if self._cache is None:
+            return None
+        return self._cache.info
+
     def load(self) -> None:
         """
         Loads the data from the root directory into _data.
 
+        Only the paths are stored, in a packed string table, together with the
+        label id of every path.
+
         Returns:
             None
         """
-
-        # Convert to pathlib path
-        root_path = pathlib.Path(self._root)
-
-        # Iterate over labels (names of directories in root)
-        for label in root_path.iterdir():
-            # Iterate over files in label
-            for file in label.iterdir():
-                # If file is a file
-                if file.is_file():
-                    # Append file path and label to _data
-                    self._data.append((str(file), label.name))
+        # Store the paths and label ids (names of directories in root) in _data
+        paths = self._scan()
+        self._data = LabeledTable(paths, self._label_ids, self._classes)
 
     def __getitem__(self, index: int) -> GETITEM_RETURN_TYPE:
         """
         Returns the data point at the given index.
 
+        With instrumentation, the time and bytes of every stage are recorded.
+
+        Args:
+            index (int): The index of the data point to be retrieved.
+
+        Returns:
+            GETITEM_RETURN_TYPE: The data point at the given index.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        # Record the stages of the data point when instrumented
+        if self._instrumentation is not None:
+            return self._instrumentation.record(index, self._get_item, index)
+
+        return self._get_item(index)
+
+    def _get_item(self, index: int) -> GETITEM_RETURN_TYPE:
+        """
+        Returns the data point at the given index, see __getitem__.
+
         Args:
             index (int): The index of the data point to be retrieved.
 
@@ -149,23 +520,397 @@ class LazyMixin:
         # Get path and label
         path, label = self._data[index]
 
+        # Serve the output of a deterministic transform from the store,
+        # only decoding the data point when it is not stored yet
+        stage = self._feature_stage
+        if stage is not None:
+            key = self._feature_key(path, stage[0], None)
+            data = self._load_features(key, lambda: self._load_cached(path), *stage)
+            return data, label
+
+        # Without caches, decode only the part of the data the transform keeps
+        if (
+            self._transform is not None
+            and self._cache is None
+            and self._disk_cache is None
+        ):
+            return self._load_transformed(path), label
+
         # Load data
-        data = self._load_single_data(path)
+        data = self._load_cached(path)
 
         # If transform is not None, apply transform
         if self._transform is not None:
             # Return transformed data and label
-            return (self._transform.process(data), label)
+            data = self._transform.process(data)
+            self._mark("transform", data)
+            return data, label
 
         # Return data and label
         return data, label
 
+    def _load_cached(self, path: str) -> DATA_RETURN_TYPES:
+        """
+        Loads a single data item through the cache, if there is one.
+
+        Args:
+            path (str): The path to the data item.
+
+        Returns:
+            DATA_RETURN_TYPES: The loaded data item, read-only if it is cached.
+        """
+        # Without a cache, always load the data
+        if self._cache is None:
+            return self._load_data(path)
+
+        # Load and store the data if it is not cached yet
+        data = self._cache.get(path)
+        if data is None:
+            data = self._cache.put(path, self._load_data(path))
+        else:
+            self._mark("cache", data)
+
+        return data
+
+    def prefetch(
+        self: BaseDataset,
+        indices: Iterable[int] | None = None,
+        prefetch: int = 8,
+        num_workers: int = 2,
+        *,
+        seed: int = SEED,
+        epoch: int = 0,
+    ) -> PrefetchIterator:
+        """
+        Returns an iterator that loads the next data points in the background.
+
+        Args:
+            indices (Iterable[int] | None): The indices to be returned in order,
+                defaults to every index of the dataset.
+            prefetch (int): The maximum number of data points loaded ahead.
+            num_workers (int): The number of background workers.
+            seed (int): The seed of the random streams.
+            epoch (int): The epoch of the random streams.
+
+        Returns:
+            PrefetchIterator: The iterator over the data points.
+        """
+        return PrefetchIterator(
+            self, indices, prefetch, num_workers, seed=seed, epoch=epoch
+        )
+
+    def _get_async_executor(self) -> ThreadPoolExecutor:
+        """
+        Returns the threads of aget and abatches, created on first use.
+
+        Every thread draws random numbers from its own generator.
+
+        Returns:
+            ThreadPoolExecutor: The threads decoding the data points.
+        """
+        if self._async_executor is None:
+            seeds = iter(np.random.SeedSequence(SEED).spawn(self._async_workers))
+            self._async_executor = ThreadPoolExecutor(
+                max_workers=self._async_workers,
+                initializer=seed_thread,
+                initargs=(seeds,),
+            )
+        return self._async_executor
+
+    async def aget(self, index: int) -> GETITEM_RETURN_TYPE:
+        """
+        Returns the data point at the given index without blocking the loop.
+
+        Args:
+            index (int): The index of the data point to be retrieved.
+
+        Returns:
+            GETITEM_RETURN_TYPE: The data point at the given index.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_async_executor(), self.__getitem__, index
+        )
+
+    async def abatches(
+        self,
+        batch_size: int,
+        indices: Iterable[int] | None = None,
+        collate_fn: COLLATE_FN | None = None,
+    ) -> AsyncIterator[BATCH_RETURN_TYPE]:
+        """
+        Returns the data points in batches without blocking the loop.
+
+        The data points of a batch are decoded concurrently, and the next batch
+        is decoded while the current one is being used.
 
-class AudioMixin:
+        Args:
+            batch_size (int): The number of data points per batch.
+            indices (Iterable[int] | None): The indices to be returned in order,
+                defaults to every index of the dataset.
+            collate_fn (COLLATE_FN | None): The function combining a list of
+                data points into a batch, defaults to default_collate.
+
+        Yields:
+            BATCH_RETURN_TYPE: The collated data and the label ids of every
+                batch, see classes for their names.
+
+        Raises:
+            ValueError: If batch_size is less than or equal to 0.
+        """
+        if batch_size <= 0:
+            raise ValueError(INVALID_S_T_MSG.format("batch_size", "0"))
+
+        # Split the indices into batches
+        indices = list(range(len(self)) if indices is None else indices)
+        batches = [
+            indices[start : start + batch_size]
+            for start in range(0, len(indices), batch_size)
+        ]
+        collate_fn = default_collate if collate_fn is None else collate_fn
+        loop = asyncio.get_running_loop()
+
+        async def load_batch(batch: list[int]) -> BATCH_RETURN_TYPE:
+            # Decode the data points concurrently and collate them off the loop
+            samples = await asyncio.gather(*(self.aget(index) for index in batch))
+            data = await loop.run_in_executor(
+                self._get_async_executor(),
+                collate_fn,
+                [sample[0] for sample in samples],
+            )
+            return data, self.label_ids[batch]
+
+        # Load the next batch while the current one is returned
+        if not batches:
+            return
+        pending = asyncio.ensure_future(load_batch(batches[0]))
+        try:
+            for i in range(len(batches)):
+                current = pending
+                if i + 1 < len(batches):
+                    pending = asyncio.ensure_future(load_batch(batches[i + 1]))
+                yield await current
+        finally:
+            # Stop loading ahead when the consumer stops early, the last batch
+            # is already done
+            pending.cancel()
+
+    async def aclose(self) -> None:
+        """
+        Stops the threads of aget and abatches once their work is done.
+
+        They are started again by the next call of aget or abatches.
+        """
+        executor, self._async_executor = self._async_executor, None
+        if executor is not None:
+            await asyncio.to_thread(executor.shutdown)
+
+    def __getstate__(self) -> dict:
+        """
+        Returns the state for pickling, without the threads of aget.
+
+        Returns:
+            dict: The state of the dataset.
+        """
+        state = self.__dict__.copy()
+        state["_async_executor"] = None
+        return state
+
+
+class PackedMixin:
+    """
+    Packed Mixin
+
+    Reads a dataset written by datasets.packed.pack_dataset. Data points are
+    returned as read-only views into a memory map of the packed file.
+    """
+
+    # Define attributes
+    _root: str
+    _data: np.ndarray
+    _classes: tuple[str, ...]
+    _label_ids: np.ndarray
+    _transform: DataTransform | None
+    _data_type: str
+    _instrumentation: Instrumentation | None
+    _mark: Callable[[str, DATA_RETURN_TYPES | bytes | None], None]
+
+    def load(self) -> None:
+        """
+        Loads the index of the packed dataset and maps the packed file.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the packed data is of another data type.
+        """
+        # Convert to pathlib path
+        root_path = pathlib.Path(self._root)
+
+        # Read the index into compact arrays
+        with np.load(root_path / PACKED_INDEX_FILE, allow_pickle=False) as index:
+            self._offsets = index["offsets"]
+            self._shapes = index["shapes"]
+            self._ndims = index["ndims"]
+            labels = index["labels"]
+            self._sampling_rates = index["sampling_rates"]
+            self._dtype = np.dtype(str(index["dtype"]))
+
+        # Number the labels like _scan, in sorted order
+        classes, label_ids = np.unique(labels, return_inverse=True)
+        self._classes = tuple(str(name) for name in classes)
+        self._label_ids = label_ids.astype(np.int32)
+
+        # Audio is packed with a sampling rate, images are not
+        packed_type = "image" if np.isnan(self._sampling_rates).all() else "audio"
+        if len(self._offsets) > 0 and packed_type != self._data_type:
+            raise ValueError(
+                PACKED_TYPE_MSG.format(self._root, packed_type, self._data_type)
+            )
+
+        # Map the packed file, an empty file cannot be mapped
+        data_path = root_path / PACKED_DATA_FILE
+        if data_path.stat().st_size > 0:
+            self._data = np.memmap(data_path, dtype=np.uint8, mode="r")
+        else:
+            self._data = np.empty(0, dtype=np.uint8)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of data points in the dataset.
+
+        Returns:
+            int: The number of data points in the dataset.
+        """
+        return len(self._offsets)
+
+    def __getitem__(self, index: int) -> GETITEM_RETURN_TYPE:
+        """
+        Returns the data point at the given index.
+
+        With instrumentation, the time and bytes of every stage are recorded.
+
+        Args:
+            index (int): The index of the data point to be retrieved.
+
+        Returns:
+            GETITEM_RETURN_TYPE: The data point at the given index.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        # Record the stages of the data point when instrumented
+        if self._instrumentation is not None:
+            return self._instrumentation.record(index, self._get_item, index)
+
+        return self._get_item(index)
+
+    def _get_item(self, index: int) -> GETITEM_RETURN_TYPE:
+        """
+        Returns the data point at the given index, see __getitem__.
+
+        Args:
+            index (int): The index of the data point to be retrieved.
+
+        Returns:
+            GETITEM_RETURN_TYPE: The data point at the given index.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        # Create a read-only view of the data point without copying it
+        shape = tuple(self._shapes[index, : self._ndims[index]])
+        data = np.ndarray(
+            shape, dtype=self._dtype, buffer=self._data, offset=self._offsets[index]
+        )
+
+        # Audio also returns its sampling rate
+        if self._data_type == "audio":
+            data = (data, float(self._sampling_rates[index]))
+        self._mark("map", data)
+
+        # If transform is not None, apply transform
+        if self._transform is not None:
+            data = self._transform.process(data)
+            self._mark("transform", data)
+            return data, self._label(index)
+
+        # Return data and label
+        return data, self._label(index)
+
+    def _label(self, index: int) -> str:
+        """
+        Returns the name of the class of the data point at the given index.
+
+        Args:
+            index (int): The index of the data point.
+
+        Returns:
+            str: The name of the class.
+        """
+        return self._classes[self._label_ids[index]]
+
+
+class AudioMixin(TransformedLoading):
     """
     Audio Mixin
     """
 
+    # Define the data type
+    _data_type = "audio"
+
+    # Define attributes
+    _transform: DataTransform | None
+    _mark: Callable[[str, DATA_RETURN_TYPES | bytes | None], None]
+
+    def __init__(
+        self,
+        *args,
+        sr: float | None = DEFAULT_SR,
+        mono: bool = True,
+        res_type: str = DEFAULT_RES_TYPE,
+        **kwargs,
+    ) -> None:
+        """
+        Initializes the AudioMixin.
+
+        Args:
+            sr (float | None): The sampling rate the audio is resampled to.
+                None keeps the native sampling rate of every file and skips
+                resampling.
+            mono (bool): Whether multichannel audio is mixed down to mono.
+                Otherwise multichannel audio has the shape (channels, samples).
+            res_type (str): The resampling method, one of RES_TYPES. The soxr
+                methods trade quality ("soxr_vhq") for speed ("soxr_qq").
+
+        Raises:
+            ValueError: If sr is less than or equal to 0 or res_type is not valid.
+        """
+        if sr is not None and sr <= 0:
+            raise ValueError(INVALID_S_T_MSG.format("sr", "0"))
+        if res_type not in RES_TYPES:
+            raise ValueError(INVALID_RES_TYPE_MSG.format(RES_TYPES, res_type))
+
+        self._sr = sr
+        self._mono = mono
+        self._res_type = res_type
+
+        super().__init__(*args, **kwargs)
+
+    @property
+    def _load_params(self) -> dict[str, object]:
+        """
+        Returns the parameters that influence what _load_single_data returns.
+
+        Returns:
+            dict[str, object]: The sampling rate, mono and resampling method.
+        """
+        return {"sr": self._sr, "mono": self._mono, "res_type": self._res_type}
+
     def _load_single_data(self, path: str) -> tuple[np.ndarray, float]:
         """
         Loads a single audio data item from the given path.
@@ -180,11 +925,76 @@ class AudioMixin:
             AudioNotFoundError: If the audio file is not found.
         """
 
-        # Try to load audio, if not succesful then raise Exception
+        # Import the decoder on first use, so importing datasets stays fast
+        import librosa  # noqa: PLC0415
+
+        # Try to load audio at its native rate, if not succesful then raise
+        # Exception. The file is read while it is decoded.
+        try:
+            audio, sr = librosa.load(path, sr=None, mono=self._mono)
+        except FileNotFoundError as exception:
+            raise AudioNotFoundError(path) from exception
+        self._mark("decode", audio)
+
+        # Resample like librosa.load, as a stage of its own
+        if self._sr is not None:
+            audio = librosa.resample(
+                audio, orig_sr=sr, target_sr=self._sr, res_type=self._res_type
+            )
+            sr = self._sr
+            self._mark("resample", audio)
+
+        # Return audio and sampling rate
+        return audio, sr
+
+    def _load_transformed(self, path: str) -> DATA_RETURN_TYPES:
+        """
+        Loads and transforms a single audio data item.
+
+        For a random audio crop, reads the duration from the file header,
+        selects the crop and decodes only that window, so memory and I/O scale
+        with t instead of the file.
+
+        Args:
+            path (str): The path to the audio data item.
+
+        Returns:
+            DATA_RETURN_TYPES: The transformed audio data item.
+
+        Raises:
+            AudioNotFoundError: If the audio file is not found.
+        """
+        # Other transforms need the whole audio
+        transform = self._transform
+        if not isinstance(transform, RandomAudioCropTransform):
+            return super()._load_transformed(path)
+
+        # Import the decoder on first use
+        import librosa  # noqa: PLC0415
+
+        # Select the window from the duration in the header
         try:
-            audio, sr = librosa.load(path)
+            offset = transform.select_offset(librosa.get_duration(path=path))
         except FileNotFoundError as exception:
             raise AudioNotFoundError(path) from exception
+        self._mark("header", None)
+
+        # Audio not longer than t is returned whole
+        if offset is None:
+            return self._load_single_data(path)
+
+        # Decode the window and fix rounding of the frame range to t * sr samples
+        audio, sr = librosa.load(
+            path,
+            sr=self._sr,
+            mono=self._mono,
+            offset=offset,
+            duration=transform.t,
+            res_type=self._res_type,
+        )
+        self._mark("decode", audio)
+        audio = librosa.util.fix_length(audio, size=round(transform.t * sr))
+        self._mark("transform", audio)
 
         # Return audio and sampling rate
         return audio, sr
@@ -193,12 +1003,20 @@ class AudioMixin:
         """
         Checks if the given transform is valid for audio data.
 
+        A composition is valid if all of its transforms are valid.
+
         Args:
             transform (DataTransform | None): The transform to be checked.
 
         Raises:
             InvalidTransform: If the transform is not valid for audio data.
         """
+        # Check every transform of a composition
+        if isinstance(transform, ComposeTransform):
+            for inner in transform.transforms:
+                self._check_valid_transform(inner)
+            return
+
         # Raise exception if transform is not valid for audio
         if transform is not None and not isinstance(
             transform, (RandomAudioCropTransform, SpectrogramTransform)
@@ -211,6 +1029,61 @@ class ImageMixin:
     Image Mixin
     """
 
+    # Define the data type
+    _data_type = "image"
+
+    # Define attributes
+    _mark: Callable[[str, DATA_RETURN_TYPES | bytes | None], None]
+
+    # Name of the OpenCV decoding flag per reduction factor
+    _imread_flags: ClassVar[dict[int, str]] = {
+        1: "IMREAD_COLOR",
+        2: "IMREAD_REDUCED_COLOR_2",
+        4: "IMREAD_REDUCED_COLOR_4",
+        8: "IMREAD_REDUCED_COLOR_8",
+    }
+
+    def __init__(
+        self,
+        *args,
+        reduction: int = 1,
+        size: tuple[int, int] | None = None,
+        **kwargs,
+    ) -> None:
+        """
+        Initializes the ImageMixin.
+
+        Args:
+            reduction (int): The factor the resolution is reduced by while
+                decoding, one of IMAGE_REDUCTIONS. Reduced JPEG decoding skips
+                most of the work, other formats are reduced after decoding.
+            size (tuple[int, int] | None): The (height, width) images are
+                resized to after decoding. None keeps the decoded size.
+
+        Raises:
+            ValueError: If reduction is not valid or size is less than or
+                equal to 0.
+        """
+        if reduction not in IMAGE_REDUCTIONS:
+            raise ValueError(INVALID_REDUCTION_MSG.format(IMAGE_REDUCTIONS, reduction))
+        if size is not None and min(size) <= 0:
+            raise ValueError(INVALID_S_T_MSG.format("size", "0"))
+
+        self._reduction = reduction
+        self._size = None if size is None else (int(size[0]), int(size[1]))
+
+        super().__init__(*args, **kwargs)
+
+    @property
+    def _load_params(self) -> dict[str, object]:
+        """
+        Returns the parameters that influence what _load_single_data returns.
+
+        Returns:
+            dict[str, object]: The reduction factor and the target size.
+        """
+        return {"reduction": self._reduction, "size": self._size}
+
     def _load_single_data(self, path: str) -> np.ndarray:
         """
         Loads a single image data item from the given path.
@@ -225,29 +1098,54 @@ class ImageMixin:
             ImageNotFoundError: If the image file is not found.
         """
 
-        # Read data
-        image = cv2.imread(path)
+        # Import the decoder on first use, so importing datasets stays fast
+        import cv2  # noqa: PLC0415
+
+        # Read the file, if not succesful then raise Exception
+        try:
+            buffer = np.frombuffer(pathlib.Path(path).read_bytes(), dtype=np.uint8)
+        except OSError as exception:
+            raise ImageNotFoundError(path) from exception
+        self._mark("read", buffer)
+
+        # Decode data at the reduced resolution
+        flag = getattr(cv2, self._imread_flags[self._reduction])
+        image = cv2.imdecode(buffer, flag) if buffer.size > 0 else None
 
         # If image is None, raise Exception
         if image is None:
             raise ImageNotFoundError(path)
+        self._mark("decode", image)
 
-        # Convert image to RGB
-        converted_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        # Resize before the conversion, so fewer pixels are converted
+        if self._size is not None and image.shape[:2] != self._size:
+            height, width = self._size
+            image = cv2.resize(image, (width, height), interpolation=cv2.INTER_AREA)
+            self._mark("resize", image)
 
-        # Return numpy array of image
-        return np.array(converted_image)
+        # Convert image to RGB in place and return it
+        image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=image)
+        self._mark("convert", image)
+        return image
 
     def _check_valid_transform(self, transform: DataTransform | None) -> None:
         """
         Checks if the given transform is valid for image data.
 
+        A composition is valid if all of its transforms are valid.
+
         Args:
             transform (DataTransform | None): The transform to be checked.
 
         Raises:
             InvalidTransform: If the transform is not valid for image data.
         """
+        # Check every transform of a composition
+        if isinstance(transform, ComposeTransform):
+            for inner in transform.transforms:
+                self._check_valid_transform(inner)
+            return
+
         # Raise exception if transform is not valid for image
         if transform is not None and not isinstance(
             transform, (SquareErasingTransform, CenterCropTransform)
@@ -0,0 +1,612 @@
+# Import libraries
+import contextlib
+import multiprocessing
+import pickle
+import queue
+import signal
+import weakref
+from collections import deque
+from collections.abc import Iterator
+from multiprocessing.shared_memory import SharedMemory
+from types import TracebackType
+from typing import TYPE_CHECKING, Self, cast
+
+import numpy as np
+
+# Import from other modules
+from datasets.baseclasses import BaseDataset
+from datasets.loader import COLLATE_FN, BatchLoader
+from datasets.utils import (
+    BATCH_RETURN_TYPE,
+    DATA_RETURN_TYPES,
+    INVALID_S_T_MSG,
+    SEED,
+    WORKER_DIED_MSG,
+    WORKER_POLL_INTERVAL,
+    WORKER_SHUTDOWN_TIMEOUT,
+    WORKERS_STOPPED_MSG,
+)
+
+# The contexts of the start methods and their processes, ForkContext does not
+# exist on Windows
+if TYPE_CHECKING:
+    from multiprocessing.context import (
+        DefaultContext,
+        ForkContext,
+        ForkServerContext,
+        SpawnContext,
+    )
+    from multiprocessing.process import BaseProcess
+
+
+def _picklable(exception: BaseException) -> BaseException:
+    """
+    Returns the exception if it survives pickling, else a RuntimeError.
+
+    Args:
+        exception (BaseException): The exception raised in a worker.
+
+    Returns:
+        BaseException: An exception that can be sent to the main process.
+    """
+    # Only bytes pickled here are loaded again
+    try:
+        pickle.loads(pickle.dumps(exception))  # noqa: S301
+    except (pickle.PickleError, AttributeError, TypeError):
+        return RuntimeError(f"{type(exception).__name__}: {exception}")
+    return exception
+
+
+def _write_batch(
+    block: SharedMemory, slot: int | None, slot_bytes: int, data: DATA_RETURN_TYPES
+) -> tuple[tuple | None, DATA_RETURN_TYPES | None]:
+    """
+    Writes the array of a batch into a slot of shared memory.
+
+    Args:
+        block (SharedMemory): The shared memory of the worker.
+        slot (int | None): The slot to write to, None if no slot is free.
+        slot_bytes (int): The size of a slot in bytes.
+        data (DATA_RETURN_TYPES): The collated data of the batch.
+
+    Returns:
+        tuple[tuple | None, DATA_RETURN_TYPES | None]: The shape, dtype and
+            sampling rate of the array in the slot and None, or None and the
+            data itself if it does not fit or is not an array.
+    """
+    # Split audio into the array and sampling rate
+    match data:
+        case (array, sr):
+            pass
+        case _:
+            array, sr = data, None
+
+    # Other data and batches larger than a slot are pickled instead
+    if (
+        slot is None
+        or not isinstance(array, np.ndarray)
+        or array.dtype.hasobject
+        or array.nbytes > slot_bytes
+    ):
+        return None, data
+
+    # Copy the array into the slot
+    target = np.ndarray(
+        array.shape, array.dtype, buffer=block.buf, offset=slot * slot_bytes
+    )
+    target[...] = array
+    return (array.shape, array.dtype.str, sr), None
+
+
+def _release(
+    _block: SharedMemory, buffer: memoryview, free: deque[int], slot: int
+) -> None:
+    """
+    Gives a slot back to its worker once the batch viewing it is collected.
+
+    NumPy does not keep the buffer of a batch exported, so this call holds it
+    instead. While it is exported, the shared memory cannot be unmapped. The
+    block is held as well, so it is only closed once the buffer is released.
+
+    Args:
+        _block (SharedMemory): The shared memory of the worker, only held.
+        buffer (memoryview): The memory of the slot.
+        free (deque[int]): The free slots of the worker.
+        slot (int): The slot of the batch.
+    """
+    buffer.release()
+    free.append(slot)
+
+
+def _worker_loop(
+    loader: BatchLoader,
+    block_name: str,
+    slot_bytes: int,
+    tasks: multiprocessing.Queue,
+    results: multiprocessing.Queue,
+) -> None:
+    """
+    Loads the batches of the tasks until it receives None.
+
+    Args:
+        loader (BatchLoader): The loader with the dataset, collate function
+            and seed of the ProcessBatchLoader.
+        block_name (str): The name of the shared memory of the worker.
+        slot_bytes (int): The size of a slot in bytes.
+        tasks (multiprocessing.Queue): The tasks of the worker.
+        results (multiprocessing.Queue): The results of all workers.
+    """
+    # The main process handles interrupts and stops the workers
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    block = SharedMemory(name=block_name)
+
+    try:
+        while (task := tasks.get()) is not None:
+            run, epoch, batch, indices, slot = task
+
+            # Send exceptions to the main process, which raises them in order.
+            # The worker runs the loader of its ProcessBatchLoader
+            try:
+                data, labels = loader._load_batch(epoch, batch, indices)  # noqa: SLF001
+                meta, payload = _write_batch(block, slot, slot_bytes, data)
+            except Exception as exception:  # noqa: BLE001
+                results.put((run, batch, slot, None, None, _picklable(exception)))
+                continue
+
+            results.put((run, batch, slot, meta, payload, labels))
+    finally:
+        # Do not wait for results nobody will read on shutdown
+        results.cancel_join_thread()
+        block.close()
+
+
+class ProcessBatchLoader(BatchLoader):
+    """
+    Process Batch Loader
+
+    Loads and collates the batches of a dataset in worker processes, so
+    decoding and transforms are not limited by the GIL.
+
+    Every worker owns a ring of slots in shared memory, created by the main
+    process. A worker writes the array of a finished batch into a free slot
+    and the main process returns a view of that slot without copying or
+    pickling it. The slot is given back to the worker once the batch is
+    garbage collected. If no slot is free, because batches are kept around,
+    or a batch does not fit, the batch is pickled instead.
+
+    The workers are started on the first iteration and kept for the next
+    epochs. A worker that dies raises a RuntimeError and stops the others.
+    The random streams are the same as in BatchLoader, so the batches do not
+    depend on the number of workers.
+
+    Attributes:
+        num_workers (int): The number of worker processes.
+        slots (int): The number of slots of every worker.
+        slot_bytes (int | None): The size of a slot in bytes.
+
+    Methods:
+        __iter__(): Returns an iterator over the batches of one epoch.
+        close(): Stops the workers and frees the shared memory.
+    """
+
+    def __init__(  # noqa: PLR0913 - the options after * are keyword-only
+        self,
+        dataset: BaseDataset,
+        batch_size: int = 1,
+        *,
+        shuffle: bool = False,
+        drop_last: bool = False,
+        collate_fn: COLLATE_FN | None = None,
+        seed: int = SEED,
+        num_workers: int = 2,
+        slots: int = 2,
+        slot_bytes: int | None = None,
+        context: str | None = None,
+    ) -> None:
+        """
+        Initializes the ProcessBatchLoader class.
+
+        Args:
+            dataset (BaseDataset): The dataset to be batched.
+            batch_size (int): The number of data points per batch.
+            shuffle (bool): Whether the order is shuffled every epoch.
+            drop_last (bool): Whether the last incomplete batch is dropped.
+            collate_fn (COLLATE_FN | None): The function combining a list of
+                data points into a batch, defaults to default_collate.
+            seed (int): The seed of the random streams of every epoch.
+            num_workers (int): The number of worker processes.
+            slots (int): The number of batches every worker can have ready.
+            slot_bytes (int | None): The size of a slot in bytes, defaults to
+                twice the size of a batch of copies of the first data point.
+            context (str | None): The multiprocessing start method, such as
+                "fork" or "spawn", defaults to the one of the platform. With
+                "spawn" the dataset and collate_fn must be picklable.
+
+        Raises:
+            ValueError: If batch_size, num_workers, slots or slot_bytes is less
+                than or equal to 0.
+        """
+        super().__init__(
+            dataset,
+            batch_size,
+            shuffle=shuffle,
+            drop_last=drop_last,
+            collate_fn=collate_fn,
+            seed=seed,
+        )
+
+        if num_workers <= 0:
+            raise ValueError(INVALID_S_T_MSG.format("num_workers", "0"))
+        if slots <= 0:
+            raise ValueError(INVALID_S_T_MSG.format("slots", "0"))
+        if slot_bytes is not None and slot_bytes <= 0:
+            raise ValueError(INVALID_S_T_MSG.format("slot_bytes", "0"))
+
+        self._num_workers = num_workers
+        self._slots = slots
+        self._slot_bytes = slot_bytes
+        self._context = cast(
+            "DefaultContext | ForkContext | ForkServerContext | SpawnContext",
+            multiprocessing.get_context(context),
+        )
+
+        # Workers, their queues and shared memory, created on the first epoch
+        self._processes: list[BaseProcess] = []
+        self._tasks: list[multiprocessing.Queue] = []
+        self._results: multiprocessing.Queue | None = None
+        self._blocks: list[SharedMemory] = []
+        self._free: list[deque[int]] = []
+
+        # Results of abandoned epochs carry an older run and are dropped
+        self._run = 0
+
+    @property
+    def num_workers(self) -> int:
+        """
+        Returns the number of worker processes.
+
+        Returns:
+            int: The number of worker processes.
+        """
+        return self._num_workers
+
+    @property
+    def slots(self) -> int:
+        """
+        Returns the number of slots of every worker.
+
+        Returns:
+            int: The number of slots of every worker.
+        """
+        return self._slots
+
+    @property
+    def slot_bytes(self) -> int | None:
+        """
+        Returns the size of a slot in bytes.
+
+        Returns:
+            int | None: The size of a slot, None until the workers are started.
+        """
+        return self._slot_bytes
+
+    def _start(self) -> None:
+        """
+        Creates the shared memory and starts the workers.
+        """
+        # Size the slots after the first data point, leaving room for longer
+        # data points, without decoding a whole batch in the main process
+        if self._slot_bytes is None:
+            data, _ = self._load_batch(0, 0, np.arange(1))
+            array = data[0] if isinstance(data, tuple) else data
+            nbytes = getattr(array, "nbytes", 0) * self._batch_size
+            self._slot_bytes = max(2 * nbytes, 1)
+
+        # The workers only need the batching parameters of this loader
+        loader = BatchLoader(
+            self._dataset, collate_fn=self._collate_fn, seed=self._seed
+        )
+
+        self._results = self._context.Queue()
+        for _ in range(self._num_workers):
+            block = SharedMemory(create=True, size=self._slots * self._slot_bytes)
+            tasks = self._context.Queue()
+            process = self._context.Process(
+                target=_worker_loop,
+                args=(loader, block.name, self._slot_bytes, tasks, self._results),
+                daemon=True,
+            )
+            process.start()
+
+            self._blocks.append(block)
+            self._tasks.append(tasks)
+            self._free.append(deque(range(self._slots)))
+            self._processes.append(process)
+
+    def _check_workers(self) -> None:
+        """
+        Raises an exception if a worker died.
+
+        Raises:
+            RuntimeError: If a worker is no longer alive.
+        """
+        for process in self._processes:
+            if not process.is_alive():
+                pid, exitcode = process.pid, process.exitcode
+                self.close()
+                raise RuntimeError(WORKER_DIED_MSG.format(pid, exitcode))
+
+    def _receive(self) -> tuple:
+        """
+        Returns the next result of the current run.
+
+        Raises:
+            RuntimeError: If a worker died.
+
+        Returns:
+            tuple: The batch number, worker, slot, meta, payload and labels.
+        """
+        # The loader may have been closed during the epoch
+        results = self._results
+        if results is None:
+            raise RuntimeError(WORKERS_STOPPED_MSG)
+
+        while True:
+            # Check the workers whenever no result arrives for a while
+            try:
+                run, batch, slot, meta, payload, labels = results.get(
+                    timeout=WORKER_POLL_INTERVAL
+                )
+            except queue.Empty:
+                self._check_workers()
+                continue
+
+            # Results of an abandoned epoch give their slot back
+            worker = batch % self._num_workers
+            if run != self._run:
+                if slot is not None:
+                    self._free[worker].append(slot)
+                continue
+
+            return batch, worker, slot, meta, payload, labels
+
+    def _unpack(
+        self,
+        worker: int,
+        slot: int | None,
+        meta: tuple | None,
+        payload: DATA_RETURN_TYPES | None,
+    ) -> DATA_RETURN_TYPES:
+        """
+        Returns the data of a batch as a view of its slot.
+
+        Args:
+            worker (int): The worker of the batch.
+            slot (int | None): The slot of the batch.
+            meta (tuple | None): The shape, dtype and sampling rate of the array
+                in the slot, None if the data was pickled.
+            payload (DATA_RETURN_TYPES | None): The pickled data, None if it is
+                in the slot.
+
+        Returns:
+            DATA_RETURN_TYPES: The collated data.
+
+        Raises:
+            RuntimeError: If the shared memory of the worker was freed.
+        """
+        # Pickled data leaves the slot unused
+        if payload is not None:
+            if slot is not None:
+                self._free[worker].append(slot)
+            return payload
+
+        # Else the array is in the slot, unless the loader was closed
+        block = self._blocks[worker]
+        if meta is None or slot is None or block.buf is None or not self._slot_bytes:
+            raise RuntimeError(WORKERS_STOPPED_MSG)
+
+        # View the slot through its own memoryview, which keeps the memory
+        # mapped even if the loader is closed while the batch is still used
+        shape, dtype, sr = meta
+        buffer = memoryview(block.buf)[slot * self._slot_bytes :]
+        array = np.ndarray(shape, dtype, buffer=buffer)
+
+        # Give the slot back once the batch is garbage collected
+        weakref.finalize(array, _release, block, buffer, self._free[worker], slot)
+
+        return array if sr is None else (array, sr)
+
+    def _submit(self, epoch: int, batch: int, indices: np.ndarray) -> None:
+        """
+        Sends a batch to its worker, with a free slot if there is one.
+
+        Args:
+            epoch (int): The number of the epoch.
+            batch (int): The number of the batch in the epoch.
+            indices (np.ndarray): The indices of the data points of the batch.
+        """
+        worker = batch % self._num_workers
+        free = self._free[worker]
+        slot = free.popleft() if free else None
+        self._tasks[worker].put((self._run, epoch, batch, indices, slot))
+
+    def _submit_many(
+        self, epoch: int, batches: Iterator[tuple[int, np.ndarray]], count: int
+    ) -> int:
+        """
+        Sends up to count batches to their workers.
+
+        Args:
+            epoch (int): The number of the epoch.
+            batches (Iterator[tuple[int, np.ndarray]]): The numbers and indices
+                of the batches not sent yet.
+            count (int): The maximum number of batches to send.
+
+        Returns:
+            int: The number of batches sent.
+        """
+        sent = 0
+        for batch, indices in batches:
+            self._submit(epoch, batch, indices)
+            sent += 1
+            if sent == count:
+                break
+        return sent
+
+    def _collect(self, batch: int, ready: dict[int, list]) -> BATCH_RETURN_TYPE:
+        """
+        Waits for the given batch and returns it.
+
+        Args:
+            batch (int): The number of the batch in the epoch.
+            ready (dict[int, list]): The results received ahead of their turn,
+                per batch number.
+
+        Returns:
+            BATCH_RETURN_TYPE: The collated data and the label ids.
+
+        Raises:
+            RuntimeError: If a worker died.
+        """
+        # Keep the results that arrive before the given batch
+        while batch not in ready:
+            number, *result = self._receive()
+            ready[number] = result
+        worker, slot, meta, payload, labels = ready.pop(batch)
+
+        # Raise exceptions of the workers in order
+        if isinstance(labels, BaseException):
+            if slot is not None:
+                self._free[worker].append(slot)
+            raise labels
+
+        return self._unpack(worker, slot, meta, payload), labels
+
+    def _abandon(self, ready: dict[int, list]) -> None:
+        """
+        Ends the current run, giving back the slots of results not returned.
+
+        Results of this run that are still in flight are dropped on arrival.
+
+        Args:
+            ready (dict[int, list]): The results received but not returned.
+        """
+        self._run += 1
+
+        # Slots of stopped workers no longer exist
+        if not self._processes:
+            return
+        for worker, slot, *_ in ready.values():
+            if slot is not None:
+                self._free[worker].append(slot)
+
+    def _iter_epoch(self, epoch: int) -> Iterator[BATCH_RETURN_TYPE]:
+        """
+        Returns an iterator over the batches of the given epoch.
+
+        Args:
+            epoch (int): The number of the epoch.
+
+        Returns:
+            Iterator[BATCH_RETURN_TYPE]: The collated data and the label ids
+                of every batch.
+
+        Raises:
+            RuntimeError: If a worker died.
+        """
+        # An empty dataset has no batches, nor a data point to size the slots
+        if len(self._dataset) == 0:
+            return
+        if not self._processes:
+            self._start()
+
+        # Keep every slot of every worker busy
+        batches = enumerate(self._batch_indices(epoch))
+        in_flight = self._num_workers * self._slots
+        submitted, returned = 0, 0
+        ready: dict[int, list] = {}
+
+        try:
+            while True:
+                # Submit batches until enough are in flight or none are left
+                missing = in_flight - (submitted - returned)
+                if missing > 0:
+                    submitted += self._submit_many(epoch, batches, missing)
+
+                # Stop once every batch has been returned
+                if returned == submitted:
+                    return
+
+                # Return the next batch in order, without holding it here, so
+                # its slot is given back as soon as the caller drops it
+                returned += 1
+                yield self._collect(returned - 1, ready)
+        finally:
+            self._abandon(ready)
+
+    def close(self) -> None:
+        """
+        Stops the workers and frees the shared memory.
+
+        Batches returned before stay readable until they are garbage collected.
+        Iterating again starts new workers.
+        """
+        # Closing twice is a no-op
+        if not self._processes:
+            return
+
+        # Ask the workers to stop
+        for tasks in self._tasks:
+            tasks.put(None)
+
+        # Workers do not wait for their unread results, so they stop after
+        # their current batch, else they are terminated
+        for process in self._processes:
+            process.join(WORKER_SHUTDOWN_TIMEOUT)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+        queues = [*self._tasks]
+        if self._results is not None:
+            queues.append(self._results)
+        for queue_ in queues:
+            queue_.cancel_join_thread()
+            queue_.close()
+
+        # Free the shared memory, batches still in use keep it mapped until
+        # they are garbage collected
+        for block in self._blocks:
+            with contextlib.suppress(BufferError):
+                block.close()
+            block.unlink()
+
+        self._processes, self._tasks, self._blocks, self._free = [], [], [], []
+        self._results = None
+
+    def __enter__(self) -> Self:
+        """
+        Returns the loader for use in a with statement.
+
+        Returns:
+            ProcessBatchLoader: The loader itself.
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """
+        Stops the workers when leaving a with statement.
+        """
+        self.close()
+
+    def __del__(self) -> None:
+        """
+        Stops the workers when the loader is garbage collected.
+        """
+        # The constructor may have failed before the workers were defined
+        if getattr(self, "_processes", None):
+            self.close()
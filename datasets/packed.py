@@ -0,0 +1,87 @@
+# Import libraries
+import pathlib
+
+import numpy as np
+
+# Import from other modules
+from datasets.baseclasses import BaseDataset
+from datasets.utils import (
+    PACKED_ALIGNMENT,
+    PACKED_DATA_FILE,
+    PACKED_DTYPE_MSG,
+    PACKED_INDEX_FILE,
+    PACKED_TRANSFORM_MSG,
+)
+
+
+def pack_dataset(dataset: BaseDataset, target: str) -> None:
+    """
+    Packs the data points of a dataset into a single file plus an index.
+
+    All arrays are written uncompressed, one after another, to data.bin in the
+    target directory. index.npz stores the offset, shape, label and sampling
+    rate of every data point, so the packed dataset classes can return views
+    into a memory map of data.bin instead of decoding files.
+
+    Args:
+        dataset (BaseDataset): The dataset to be packed, without a transform.
+        target (str): The directory to write the packed dataset to.
+
+    Raises:
+        ValueError: If the dataset has a transform or the data points do not
+            share one dtype.
+    """
+    # Random transforms would be frozen into the pack
+    if dataset.transform is not None:
+        raise ValueError(PACKED_TRANSFORM_MSG)
+
+    target_path = pathlib.Path(target)
+    target_path.mkdir(parents=True, exist_ok=True)
+
+    # Index of every data point
+    offsets, shapes, labels, sampling_rates = [], [], [], []
+    dtype = None
+
+    # Write the arrays one after another, aligned to PACKED_ALIGNMENT bytes
+    with (target_path / PACKED_DATA_FILE).open("wb") as file:
+        for index in range(len(dataset)):
+            data, label = dataset[index]
+
+            # Split audio into the waveform and sampling rate
+            if isinstance(data, tuple):
+                array, sr = data
+            else:
+                array, sr = data, np.nan
+
+            # All data points share the dtype of the first one
+            if dtype is None:
+                dtype = array.dtype
+            elif array.dtype != dtype:
+                raise ValueError(PACKED_DTYPE_MSG.format(dtype, array.dtype))
+
+            # Pad up to the alignment and write the array
+            file.write(bytes(-file.tell() % PACKED_ALIGNMENT))
+            offsets.append(file.tell())
+            file.write(np.ascontiguousarray(array).tobytes())
+
+            # Store the index entry
+            shapes.append(array.shape)
+            labels.append(label)
+            sampling_rates.append(sr)
+
+    # Shapes of different lengths are padded, ndims tells how many are used
+    ndims = np.array([len(shape) for shape in shapes], dtype=np.int64)
+    padded_shapes = np.zeros((len(shapes), ndims.max(initial=0)), dtype=np.int64)
+    for i, shape in enumerate(shapes):
+        padded_shapes[i, : len(shape)] = shape
+
+    # Write the index
+    np.savez(
+        target_path / PACKED_INDEX_FILE,
+        offsets=np.array(offsets, dtype=np.int64),
+        shapes=padded_shapes,
+        ndims=ndims,
+        labels=np.array(labels, dtype=str),
+        sampling_rates=np.array(sampling_rates, dtype=np.float64),
+        dtype=np.array(str(dtype or np.uint8)),
+    )
@@ -0,0 +1,243 @@
+# Import libraries
+from collections import deque
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import TracebackType
+from typing import Self
+
+# Import from other modules
+from datasets.baseclasses import BaseDataset
+from datasets.utils import (
+    GETITEM_RETURN_TYPE,
+    INVALID_S_T_MSG,
+    SAMPLE_STREAM,
+    SEED,
+    rng_scope,
+    spawn_rng,
+)
+
+
+class PrefetchIterator:
+    """
+    Prefetch Iterator
+
+    Returns the data points of a dataset in order, while background workers
+    load and transform the next data points into a bounded queue.
+
+    Every data point is transformed with its own random stream, spawned from
+    the seed, the epoch and its index, so the workers never share a generator
+    and the result does not depend on the number of workers.
+
+    Attributes:
+        dataset (BaseDataset): The dataset to be iterated.
+        prefetch (int): The maximum number of data points loaded ahead.
+        num_workers (int): The number of background workers.
+        seed (int): The seed of the random streams.
+        epoch (int): The epoch of the random streams.
+
+    Methods:
+        __next__(): Returns the next data point.
+        close(): Stops the background workers.
+    """
+
+    def __init__(  # noqa: PLR0913 - the options after * are keyword-only
+        self,
+        dataset: BaseDataset,
+        indices: Iterable[int] | None = None,
+        prefetch: int = 8,
+        num_workers: int = 2,
+        *,
+        seed: int = SEED,
+        epoch: int = 0,
+    ) -> None:
+        """
+        Initializes the PrefetchIterator class.
+
+        Args:
+            dataset (BaseDataset): The dataset to be iterated.
+            indices (Iterable[int] | None): The indices to be returned in order,
+                defaults to every index of the dataset.
+            prefetch (int): The maximum number of data points loaded ahead of
+                the consumer. The workers wait once the queue is full.
+            num_workers (int): The number of background workers.
+            seed (int): The seed of the random streams.
+            epoch (int): The epoch of the random streams, change it to get
+                different random transforms.
+
+        Raises:
+            ValueError: If prefetch or num_workers is less than or equal to 0.
+        """
+        if prefetch <= 0:
+            raise ValueError(INVALID_S_T_MSG.format("prefetch", "0"))
+        if num_workers <= 0:
+            raise ValueError(INVALID_S_T_MSG.format("num_workers", "0"))
+
+        self._dataset = dataset
+        self._prefetch = prefetch
+        self._num_workers = num_workers
+        self._seed = seed
+        self._epoch = epoch
+
+        # Indices still to be submitted and data points loading in order
+        self._indices = iter(range(len(dataset)) if indices is None else indices)
+        self._queue: deque[Future[GETITEM_RETURN_TYPE]] = deque()
+
+        # Start the workers and fill the queue
+        self._executor = ThreadPoolExecutor(max_workers=num_workers)
+        self._closed = False
+        self._fill()
+
+    @property
+    def dataset(self) -> BaseDataset:
+        """
+        Returns the dataset to be iterated.
+
+        Returns:
+            BaseDataset: The dataset to be iterated.
+        """
+        return self._dataset
+
+    @property
+    def prefetch(self) -> int:
+        """
+        Returns the maximum number of data points loaded ahead.
+
+        Returns:
+            int: The maximum number of data points loaded ahead.
+        """
+        return self._prefetch
+
+    @property
+    def num_workers(self) -> int:
+        """
+        Returns the number of background workers.
+
+        Returns:
+            int: The number of background workers.
+        """
+        return self._num_workers
+
+    @property
+    def seed(self) -> int:
+        """
+        Returns the seed of the random streams.
+
+        Returns:
+            int: The seed of the random streams.
+        """
+        return self._seed
+
+    @property
+    def epoch(self) -> int:
+        """
+        Returns the epoch of the random streams.
+
+        Returns:
+            int: The epoch of the random streams.
+        """
+        return self._epoch
+
+    def _get_item(self, index: int) -> GETITEM_RETURN_TYPE:
+        """
+        Returns a data point, transformed with its own random stream.
+
+        Args:
+            index (int): The index of the data point.
+
+        Returns:
+            GETITEM_RETURN_TYPE: The data point and its label.
+        """
+        rng = spawn_rng(self._seed, self._epoch, SAMPLE_STREAM, index)
+        with rng_scope(rng):
+            return self._dataset[index]
+
+    def _fill(self) -> None:
+        """
+        Submits data points until the queue holds prefetch of them.
+        """
+        # Submit the next indices until the queue is full or none are left
+        while len(self._queue) < self._prefetch:
+            index = next(self._indices, None)
+            if index is None:
+                return
+            self._queue.append(self._executor.submit(self._get_item, index))
+
+    def __iter__(self) -> Self:
+        """
+        Returns the iterator itself.
+
+        Returns:
+            PrefetchIterator: The iterator itself.
+        """
+        return self
+
+    def __next__(self) -> GETITEM_RETURN_TYPE:
+        """
+        Returns the next data point.
+
+        Exceptions raised while loading a data point, such as AudioNotFoundError
+        or ImageNotFoundError, are raised here in order and stop the workers.
+
+        Returns:
+            GETITEM_RETURN_TYPE: The next data point.
+
+        Raises:
+            StopIteration: If all data points have been returned.
+        """
+        # Stop once everything has been returned
+        if self._closed or not self._queue:
+            self.close()
+            raise StopIteration
+
+        # Wait for the oldest data point, stop the workers if it failed
+        try:
+            item = self._queue.popleft().result()
+        except BaseException:
+            self.close()
+            raise
+
+        # Make room for the next data point and return
+        self._fill()
+        return item
+
+    def close(self) -> None:
+        """
+        Stops the background workers and drops the data points not returned yet.
+        """
+        # Closing twice is a no-op
+        if self._closed:
+            return
+        self._closed = True
+
+        # Cancel the waiting data points and wait for the running ones
+        self._queue.clear()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> Self:
+        """
+        Returns the iterator for use in a with statement.
+
+        Returns:
+            PrefetchIterator: The iterator itself.
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """
+        Stops the background workers when leaving a with statement.
+        """
+        self.close()
+
+    def __del__(self) -> None:
+        """
+        Stops the background workers when the iterator is garbage collected.
+        """
+        # The constructor may have failed before the executor existed
+        if hasattr(self, "_executor"):
+            self._closed = True
+            self._executor.shutdown(wait=False, cancel_futures=True)
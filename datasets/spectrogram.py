@@ -0,0 +1,150 @@
+# Import libraries
+from functools import lru_cache
+
+import numpy as np
+
+# Import from other modules
+from datasets.utils import INVALID_S_T_MSG, readonly
+
+
+@lru_cache(maxsize=32)
+def mel_basis(sr: float, n_fft: int, n_mels: int) -> np.ndarray:
+    """
+    Returns the mel filterbank, built once per set of parameters.
+
+    Args:
+        sr (float): The sampling rate of the audio.
+        n_fft (int): The length of the FFT window.
+        n_mels (int): The number of mel bands.
+
+    Returns:
+        np.ndarray: The read-only filterbank of shape (n_mels, 1 + n_fft // 2).
+    """
+    # Import librosa on first use, so importing datasets stays fast
+    import librosa  # noqa: PLC0415
+
+    return readonly(librosa.filters.mel(sr=sr, n_fft=n_fft, n_mels=n_mels))
+
+
+@lru_cache(maxsize=32)
+def stft_window(n_fft: int) -> np.ndarray:
+    """
+    Returns the periodic Hann window, built once per window length.
+
+    Args:
+        n_fft (int): The length of the FFT window.
+
+    Returns:
+        np.ndarray: The read-only window of shape (n_fft,).
+    """
+    # Import librosa on first use
+    import librosa  # noqa: PLC0415
+
+    window = librosa.filters.get_window("hann", n_fft, fftbins=True)
+    return readonly(window.astype(np.float32))
+
+
+class MelSpectrogramEngine:
+    """
+    Mel Spectrogram Engine
+
+    Computes power mel spectrograms like librosa.feature.melspectrogram with
+    its defaults (centered frames padded with zeros, Hann window, power 2 and
+    Slaney mel filters). The filterbank and window are cached per parameters
+    and all clips of a batch are framed and transformed in one FFT call.
+
+    Attributes:
+        n_fft (int): The length of the FFT window.
+        hop_length (int): The number of samples between frames.
+        n_mels (int): The number of mel bands.
+
+    Methods:
+        compute(audio, sr): Returns the mel spectrograms of the audio.
+    """
+
+    def __init__(
+        self, n_fft: int = 2048, hop_length: int = 512, n_mels: int = 128
+    ) -> None:
+        """
+        Initializes the MelSpectrogramEngine class.
+
+        Args:
+            n_fft (int): The length of the FFT window.
+            hop_length (int): The number of samples between frames.
+            n_mels (int): The number of mel bands.
+
+        Raises:
+            ValueError: If any of the parameters is less than or equal to 0.
+        """
+        for name, value in (
+            ("n_fft", n_fft),
+            ("hop_length", hop_length),
+            ("n_mels", n_mels),
+        ):
+            if value <= 0:
+                raise ValueError(INVALID_S_T_MSG.format(name, "0"))
+
+        self._n_fft = n_fft
+        self._hop_length = hop_length
+        self._n_mels = n_mels
+
+    @property
+    def n_fft(self) -> int:
+        """
+        Returns the length of the FFT window.
+
+        Returns:
+            int: The length of the FFT window.
+        """
+        return self._n_fft
+
+    @property
+    def hop_length(self) -> int:
+        """
+        Returns the number of samples between frames.
+
+        Returns:
+            int: The number of samples between frames.
+        """
+        return self._hop_length
+
+    @property
+    def n_mels(self) -> int:
+        """
+        Returns the number of mel bands.
+
+        Returns:
+            int: The number of mel bands.
+        """
+        return self._n_mels
+
+    def compute(self, audio: np.ndarray, sr: float) -> np.ndarray:
+        """
+        Returns the mel spectrograms of the audio.
+
+        Args:
+            audio (np.ndarray): The audio of shape (..., T). Leading axes, such
+                as a batch of equal-length clips or channels, are computed at once.
+            sr (float): The sampling rate of the audio.
+
+        Returns:
+            np.ndarray: The mel spectrograms of shape (..., n_mels, frames).
+        """
+        # Import SciPy on first use, like librosa
+        import scipy.fft  # noqa: PLC0415
+
+        # Center the frames by padding half a window of zeros on both sides
+        pad = [(0, 0)] * (audio.ndim - 1) + [(self._n_fft // 2, self._n_fft // 2)]
+        padded = np.pad(audio, pad)
+
+        # Frame all clips without copying, shape (..., frames, n_fft)
+        frames = np.lib.stride_tricks.sliding_window_view(padded, self._n_fft, axis=-1)
+        frames = frames[..., :: self._hop_length, :]
+
+        # Window the frames and compute the power spectrum in one FFT
+        spectrum = scipy.fft.rfft(frames * stft_window(self._n_fft), axis=-1)
+        power = np.abs(spectrum) ** 2
+
+        # Apply the mel filterbank, shape (..., n_mels, frames)
+        basis = mel_basis(float(sr), self._n_fft, self._n_mels)
+        return np.einsum("...tf,mf->...mt", power, basis, optimize=True)
@@ -1,10 +1,54 @@
 # Import libaries
+from collections.abc import Iterable
+
 import numpy as np
-from librosa.feature import melspectrogram
 
 # Import from other modules
 from datasets.baseclasses import DataTransform
-from datasets.utils import INVALID_S_T_MSG, RNG
+from datasets.exceptions import InvalidTransformError
+from datasets.spectrogram import MelSpectrogramEngine
+from datasets.utils import DATA_RETURN_TYPES, INVALID_S_T_MSG, get_rng
+
+
+def _image_batch(transform: DataTransform, batch: DATA_RETURN_TYPES) -> np.ndarray:
+    """
+    Returns the batch of images given to an image transform.
+
+    Args:
+        transform (DataTransform): The image transform.
+        batch (DATA_RETURN_TYPES): The batch to be processed.
+
+    Returns:
+        np.ndarray: The batch of images of shape (N, H, W, C).
+
+    Raises:
+        InvalidTransformError: If the batch is a batch of audio.
+    """
+    if isinstance(batch, tuple):
+        raise InvalidTransformError(transform, "audio")
+    return batch
+
+
+def _audio_batch(
+    transform: DataTransform, batch: DATA_RETURN_TYPES
+) -> tuple[np.ndarray, float]:
+    """
+    Returns the batch of audio given to an audio transform.
+
+    Args:
+        transform (DataTransform): The audio transform.
+        batch (DATA_RETURN_TYPES): The batch to be processed.
+
+    Returns:
+        tuple[np.ndarray, float]: The audio of shape (N, ..., T) and the
+            sampling rate.
+
+    Raises:
+        InvalidTransformError: If the batch is a batch of images.
+    """
+    if not isinstance(batch, tuple):
+        raise InvalidTransformError(transform, "image")
+    return batch
 
 
 class SquareErasingTransform(DataTransform):
@@ -16,6 +60,9 @@ class SquareErasingTransform(DataTransform):
 
     Methods:
         process(data): Processes the data and returns the transformed data.
+        erase(data, inplace): Erases a random square, optionally in place.
+        process_batch(batch): Processes a batch of images at once.
+        erase_batch(batch, inplace): Erases a square per image of a batch.
     """
 
     def __init__(self, s: int) -> None:
@@ -43,6 +90,16 @@ class SquareErasingTransform(DataTransform):
         """
         return self._s
 
+    @property
+    def params(self) -> dict[str, object]:
+        """
+        Returns the parameters that influence the output of the transform.
+
+        Returns:
+            dict[str, object]: The size of the square.
+        """
+        return {"s": self._s}
+
     def process(self, data: np.ndarray) -> np.ndarray:
         """
         Processes the data and returns the transformed data.
@@ -50,23 +107,38 @@ class SquareErasingTransform(DataTransform):
         Args:
             data (np.ndarray): The data to be processed.
 
+        Returns:
+            np.ndarray: The transformed data.
+        """
+        return self.erase(data, inplace=False)
+
+    def erase(self, data: np.ndarray, *, inplace: bool) -> np.ndarray:
+        """
+        Erases a random square of the data.
+
+        Args:
+            data (np.ndarray): The data to be processed.
+            inplace (bool): Whether the square is erased in the given data
+                instead of a copy. Only safe if no one else uses the data.
+
         Returns:
             np.ndarray: The transformed data.
         """
 
         # Pick s which is an integer between 1 and self._s
-        s = RNG.integers(1, self._s + 1)
+        rng = get_rng()
+        s = rng.integers(1, self._s + 1)
 
-        # Create a copy of the data
-        data_copy = data.copy()
+        # Create a copy of the data, unless it can be changed in place
+        data_copy = data if inplace else data.copy()
 
         # If the shape of the data is less than s, return the data
         if data.shape[0] < s or data.shape[1] < s:
             return data_copy
 
         # Pick a random location to erase
-        x = RNG.integers(0, data.shape[1] - s + 1)
-        y = RNG.integers(0, data.shape[0] - s + 1)
+        x = rng.integers(0, data.shape[1] - s + 1)
+        y = rng.integers(0, data.shape[0] - s + 1)
 
         # Erase the square
         data_copy[y : y + s, x : x + s] = 0
@@ -74,6 +146,64 @@ class SquareErasingTransform(DataTransform):
         # Return the transformed data
         return data_copy
 
+    def process_batch(self, batch: DATA_RETURN_TYPES) -> DATA_RETURN_TYPES:
+        """
+        Processes a batch of images of shape (N, H, W, C) at once.
+
+        Args:
+            batch (DATA_RETURN_TYPES): The batch to be processed.
+
+        Returns:
+            DATA_RETURN_TYPES: The transformed batch.
+
+        Raises:
+            InvalidTransformError: If the batch is a batch of audio.
+        """
+        return self.erase_batch(_image_batch(self, batch), inplace=False)
+
+    def erase_batch(self, batch: np.ndarray, *, inplace: bool) -> np.ndarray:
+        """
+        Erases a random square of every image of a batch of shape (N, H, W, C).
+
+        Every image gets its own random square, drawn in a single call and
+        erased with a single boolean mask over the batch.
+
+        Args:
+            batch (np.ndarray): The batch to be processed.
+            inplace (bool): Whether the squares are erased in the given batch
+                instead of a copy. Only safe if no one else uses the batch.
+
+        Returns:
+            np.ndarray: The transformed batch.
+        """
+        n, h, w = batch.shape[:3]
+
+        # Draw the size and relative location of every square at once
+        size_u, y_u, x_u = get_rng().random((3, n))
+        s = 1 + (size_u * self._s).astype(np.intp)
+
+        # Squares larger than the image leave it unchanged, like process
+        valid = (s <= h) & (s <= w)
+        y = (y_u * np.maximum(h - s + 1, 1)).astype(np.intp)
+        x = (x_u * np.maximum(w - s + 1, 1)).astype(np.intp)
+
+        # Build the (N, H, W) mask of all squares by broadcasting
+        rows = np.arange(h)[None, :, None]
+        cols = np.arange(w)[None, None, :]
+        y, x, s = y[:, None, None], x[:, None, None], s[:, None, None]
+        mask = (
+            valid[:, None, None]
+            & (rows >= y)
+            & (rows < y + s)
+            & (cols >= x)
+            & (cols < x + s)
+        )
+
+        # Erase the squares of a copy and return
+        batch_copy = batch if inplace else batch.copy()
+        batch_copy[mask] = 0
+        return batch_copy
+
 
 class CenterCropTransform(DataTransform):
     """
@@ -112,6 +242,26 @@ class CenterCropTransform(DataTransform):
         """
         return self._s
 
+    @property
+    def deterministic(self) -> bool:
+        """
+        Returns whether the output only depends on the input and the params.
+
+        Returns:
+            bool: True, the crop is always taken from the center.
+        """
+        return True
+
+    @property
+    def params(self) -> dict[str, object]:
+        """
+        Returns the parameters that influence the output of the transform.
+
+        Returns:
+            dict[str, object]: The size of the crop.
+        """
+        return {"s": self._s}
+
     def process(self, data: np.ndarray) -> np.ndarray:
         """
         Processes the data and returns the transformed data.
@@ -131,26 +281,58 @@ class CenterCropTransform(DataTransform):
             return data.copy()
 
         # Find the centre of the data and each half of it
-        h, w = data.shape
+        h, w = data.shape[:2]
         mid_h, mid_w = h // 2, w // 2
         s_half = self._s // 2
 
         # Crop the data
         return data[mid_h - s_half : mid_h + s_half, mid_w - s_half : mid_w + s_half]
 
+    def process_batch(self, batch: DATA_RETURN_TYPES) -> DATA_RETURN_TYPES:
+        """
+        Processes a batch of images of shape (N, H, W, C) at once.
+
+        All images share their size, so the crop is a single slice of the batch.
+
+        Args:
+            batch (DATA_RETURN_TYPES): The batch to be processed.
+
+        Returns:
+            DATA_RETURN_TYPES: The transformed batch.
+
+        Raises:
+            InvalidTransformError: If the batch is a batch of audio.
+        """
+        batch = _image_batch(self, batch)
+
+        # If the shape of the images is less than s, return a copy of the batch
+        h, w = batch.shape[1:3]
+        if h < self._s or w < self._s:
+            return batch.copy()
+
+        # Find the centre of the images and each half of the crop
+        mid_h, mid_w = h // 2, w // 2
+        s_half = self._s // 2
+
+        # Crop all images at once
+        return batch[
+            :, mid_h - s_half : mid_h + s_half, mid_w - s_half : mid_w + s_half
+        ]
+
 
 class RandomAudioCropTransform(DataTransform):
     """
     Random Audio Crop Transform
 
     Attributes:
-        t (int): The duration of the audio to be cropped.
+        t (float): The duration of the audio to be cropped.
 
     Methods:
+        select_offset(duration): Returns a random start of the crop in seconds.
         process(data): Processes the data and returns the transformed data.
     """
 
-    def __init__(self, t: int) -> None:
+    def __init__(self, t: float) -> None:
         """
         Initializes the RandomAudioCropTransform class.
 
@@ -160,7 +342,7 @@ class RandomAudioCropTransform(DataTransform):
         Raises:
             ValueError: If t is less than or equal to 0.
         """
-        if t >= 0:
+        if t <= 0:
             raise ValueError(INVALID_S_T_MSG.format("t", "0"))
 
         self._t = t
@@ -175,6 +357,37 @@ class RandomAudioCropTransform(DataTransform):
         """
         return self._t
 
+    @property
+    def params(self) -> dict[str, object]:
+        """
+        Returns the parameters that influence the output of the transform.
+
+        Returns:
+            dict[str, object]: The duration of the crop.
+        """
+        return {"t": self._t}
+
+    def select_offset(self, duration: float) -> float | None:
+        """
+        Returns a random start of the crop, before the audio is decoded.
+
+        Lets a loader decode only the cropped window of a file instead of the
+        whole file. The start is uniform over the valid starts like in process.
+
+        Args:
+            duration (float): The duration of the audio in seconds.
+
+        Returns:
+            float | None: The start of the crop in seconds, None if the audio is
+                not longer than t and is returned whole.
+        """
+        # Audio not longer than t is not cropped
+        if duration <= self._t:
+            return None
+
+        # Select a random starting point
+        return float(get_rng().uniform(0, duration - self._t))
+
     def process(self, data: tuple[np.ndarray, float]) -> tuple[np.ndarray, float]:
         """
         Processes the data and returns the transformed data.
@@ -193,15 +406,52 @@ class RandomAudioCropTransform(DataTransform):
         # Get audio and sampling rate
         audio, sr = data
 
+        # Samples are on the last axis, multichannel audio has channels first
+        length = audio.shape[-1]
+        crop_length = round(self._t * sr)
+
         # If the length of the audio is less than t * sr, return a copy of the audio
-        if audio.shape[0] < self._t * sr:
+        if length < crop_length:
             return audio.copy(), sr
 
         # Select a random starting point
-        start = RNG.integers(0, int(audio.shape[0] - self._t * sr))
+        start = get_rng().integers(0, length - crop_length + 1)
 
         # Cropt the data and return
-        return audio[start : start + self._t * sr], sr
+        return audio[..., start : start + crop_length], sr
+
+    def process_batch(self, batch: DATA_RETURN_TYPES) -> DATA_RETURN_TYPES:
+        """
+        Processes a batch of audio of shape (N, ..., T) at once.
+
+        Every data point gets its own random start, drawn in a single call,
+        and all windows are gathered with a single fancy index.
+
+        Args:
+            batch (DATA_RETURN_TYPES): The batch to be processed.
+
+        Returns:
+            DATA_RETURN_TYPES: The transformed batch.
+
+        Raises:
+            InvalidTransformError: If the batch is a batch of images.
+        """
+        # Get audio and sampling rate
+        audio, sr = _audio_batch(self, batch)
+        length = audio.shape[-1]
+        crop_length = round(self._t * sr)
+
+        # If the length of the audio is less than t * sr, return a copy of the audio
+        if length < crop_length:
+            return audio.copy(), sr
+
+        # Select a random starting point per data point
+        starts = get_rng().integers(0, length - crop_length + 1, size=audio.shape[0])
+
+        # Gather the window of every data point and channel
+        index = starts[:, None] + np.arange(crop_length)
+        index = index.reshape(audio.shape[0], *[1] * (audio.ndim - 2), crop_length)
+        return np.take_along_axis(audio, index, axis=-1), sr
 
 
 class SpectrogramTransform(DataTransform):
@@ -209,17 +459,86 @@ class SpectrogramTransform(DataTransform):
     Spectrogram Transform
 
     Attributes:
-        s (float): The size of the square to be erased.
+        n_fft (int): The length of the FFT window.
+        hop_length (int): The number of samples between frames.
+        n_mels (int): The number of mel bands.
 
     Methods:
         process(data): Processes the data and returns the transformed data.
+        process_batch(batch): Processes a batch of audio at once.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self, n_fft: int = 2048, hop_length: int = 512, n_mels: int = 128
+    ) -> None:
         """
         Initializes the SpectrogramTransform class.
+
+        The defaults match librosa.feature.melspectrogram.
+
+        Args:
+            n_fft (int): The length of the FFT window.
+            hop_length (int): The number of samples between frames.
+            n_mels (int): The number of mel bands.
+
+        Raises:
+            ValueError: If any of the parameters is less than or equal to 0.
+        """
+        self._engine = MelSpectrogramEngine(n_fft, hop_length, n_mels)
+
+    @property
+    def n_fft(self) -> int:
+        """
+        Returns the length of the FFT window.
+
+        Returns:
+            int: The length of the FFT window.
+        """
+        return self._engine.n_fft
+
+    @property
+    def hop_length(self) -> int:
+        """
+        Returns the number of samples between frames.
+
+        Returns:
+            int: The number of samples between frames.
+        """
+        return self._engine.hop_length
+
+    @property
+    def n_mels(self) -> int:
+        """
+        Returns the number of mel bands.
+
+        Returns:
+            int: The number of mel bands.
+        """
+        return self._engine.n_mels
+
+    @property
+    def deterministic(self) -> bool:
+        """
+        Returns whether the output only depends on the input and the params.
+
+        Returns:
+            bool: True, the spectrogram has no random parameters.
+        """
+        return True
+
+    @property
+    def params(self) -> dict[str, object]:
+        """
+        Returns the parameters that influence the output of the transform.
+
+        Returns:
+            dict[str, object]: The window length, hop length and mel bands.
         """
-        return
+        return {
+            "n_fft": self.n_fft,
+            "hop_length": self.hop_length,
+            "n_mels": self.n_mels,
+        }
 
     def process(self, data: tuple[np.ndarray, float]) -> tuple[np.ndarray, float]:
         """
@@ -236,4 +555,202 @@ class SpectrogramTransform(DataTransform):
         audio, sr = data
 
         # Return mel spectogram and sampling rate
-        return melspectrogram(y=audio, sr=sr), sr
+        return self._engine.compute(audio, sr), sr
+
+    def process_batch(self, batch: DATA_RETURN_TYPES) -> DATA_RETURN_TYPES:
+        """
+        Processes a batch of audio of shape (N, ..., T) at once.
+
+        The spectrograms of all data points are computed in a single FFT.
+
+        Args:
+            batch (DATA_RETURN_TYPES): The batch to be processed.
+
+        Returns:
+            DATA_RETURN_TYPES: The mel spectrograms of shape
+                (N, ..., n_mels, frames) and the sampling rate.
+
+        Raises:
+            InvalidTransformError: If the batch is a batch of images.
+        """
+        return self.process(_audio_batch(self, batch))
+
+
+class ComposeTransform(DataTransform):
+    """
+    Compose Transform
+
+    Applies a chain of transforms one after another. The chain is planned once
+    at construction: nested compositions are flattened, and every stage that
+    can work in place is marked. At runtime such a stage changes its input
+    in place when it was allocated by an earlier stage of the chain, instead
+    of copying it again. A center crop followed by a square erasing is fused
+    into one stage, which copies only the cropped window once and erases it
+    in place, so the chain allocates a single output of the size of the crop.
+
+    Attributes:
+        transforms (tuple[DataTransform, ...]): The transforms in order.
+
+    Methods:
+        process(data): Processes the data and returns the transformed data.
+        process_batch(batch): Processes a collated batch of data.
+    """
+
+    def __init__(self, transforms: Iterable[DataTransform]) -> None:
+        """
+        Initializes the ComposeTransform class.
+
+        Args:
+            transforms (Iterable[DataTransform]): The transforms in order.
+
+        Raises:
+            ValueError: If no transform is given.
+        """
+        # Flatten nested compositions so they are planned as one chain
+        flat = []
+        for transform in transforms:
+            if isinstance(transform, ComposeTransform):
+                flat.extend(transform.transforms)
+            else:
+                flat.append(transform)
+
+        if not flat:
+            raise ValueError(INVALID_S_T_MSG.format("number of transforms", "0"))
+
+        self._transforms = tuple(flat)
+        self._stages = self._plan(self._transforms)
+
+    @staticmethod
+    def _plan(
+        transforms: tuple[DataTransform, ...],
+    ) -> tuple[tuple[DataTransform | None, DataTransform], ...]:
+        """
+        Groups the transforms into the stages that are run one after another.
+
+        A center crop directly followed by a square erasing forms one fused
+        stage, every other transform forms a stage on its own.
+
+        Args:
+            transforms (tuple[DataTransform, ...]): The transforms in order.
+
+        Returns:
+            tuple[tuple[DataTransform | None, DataTransform], ...]: The center
+                crop of a fused stage, or None, and the transform of each stage.
+        """
+        stages: list[tuple[DataTransform | None, DataTransform]] = []
+        for transform in transforms:
+            if (
+                isinstance(transform, SquareErasingTransform)
+                and stages
+                and stages[-1][0] is None
+                and isinstance(stages[-1][1], CenterCropTransform)
+            ):
+                stages[-1] = (stages[-1][1], transform)
+            else:
+                stages.append((None, transform))
+
+        return tuple(stages)
+
+    @property
+    def transforms(self) -> tuple[DataTransform, ...]:
+        """
+        Returns the transforms in order.
+
+        Returns:
+            tuple[DataTransform, ...]: The transforms in order.
+        """
+        return self._transforms
+
+    @property
+    def deterministic(self) -> bool:
+        """
+        Returns whether the output only depends on the input and the params.
+
+        Returns:
+            bool: True if all transforms are deterministic.
+        """
+        return all(transform.deterministic for transform in self._transforms)
+
+    @property
+    def params(self) -> dict[str, object]:
+        """
+        Returns the parameters that influence the output of the transform.
+
+        Returns:
+            dict[str, object]: The name and parameters of every transform.
+        """
+        return {
+            "transforms": [
+                [type(transform).__name__, transform.params]
+                for transform in self._transforms
+            ]
+        }
+
+    @staticmethod
+    def _owned(data: DATA_RETURN_TYPES, source: DATA_RETURN_TYPES) -> bool:
+        """
+        Returns whether data was allocated inside the chain.
+
+        Such data shares no memory with the input of the chain, so it can be
+        changed in place without changing the data of the caller.
+
+        Args:
+            data (DATA_RETURN_TYPES): The output of a stage.
+            source (DATA_RETURN_TYPES): The input of the chain.
+
+        Returns:
+            bool: Whether data can be changed in place.
+        """
+        array = data[0] if isinstance(data, tuple) else data
+        source = source[0] if isinstance(source, tuple) else source
+        return array.flags.writeable and not np.may_share_memory(array, source)
+
+    def process(self, data: DATA_RETURN_TYPES) -> DATA_RETURN_TYPES:
+        """
+        Processes the data and returns the transformed data.
+
+        Args:
+            data (DATA_RETURN_TYPES): The data to be processed.
+
+        Returns:
+            DATA_RETURN_TYPES: The transformed data.
+        """
+        source = data
+        for crop, transform in self._stages:
+            # Crop to a view first, so only the window is copied
+            if crop is not None:
+                data = crop.process(data)
+
+            # Erase in place if an earlier stage allocated the data
+            if isinstance(transform, SquareErasingTransform) and isinstance(
+                data, np.ndarray
+            ):
+                data = transform.erase(data, inplace=self._owned(data, source))
+            else:
+                data = transform.process(data)
+
+        return data
+
+    def process_batch(self, batch: DATA_RETURN_TYPES) -> DATA_RETURN_TYPES:
+        """
+        Processes a collated batch of data and returns the transformed batch.
+
+        Every transform processes the whole batch with its process_batch.
+
+        Args:
+            batch (DATA_RETURN_TYPES): The batch to be processed.
+
+        Returns:
+            DATA_RETURN_TYPES: The transformed batch.
+        """
+        source = batch
+        for transform in self._transforms:
+            # Erase in place if an earlier transform allocated the batch
+            if isinstance(transform, SquareErasingTransform) and isinstance(
+                batch, np.ndarray
+            ):
+                batch = transform.erase_batch(batch, inplace=self._owned(batch, source))
+            else:
+                batch = transform.process_batch(batch)
+
+        return batch
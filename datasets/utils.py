@@ -1,17 +1,189 @@
 # Import libraries
+import threading
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager
+
 import numpy as np
 
 # Specify complex type hints
 DATA_RETURN_TYPES = np.ndarray | tuple[np.ndarray, float]
 GETITEM_RETURN_TYPE = tuple[DATA_RETURN_TYPES, str]
 
-# Random Number Generator.
-# Set seed to 42 for now for reproducibility
-# There is no other way to set this number generator globally in main.py
-RNG = np.random.default_rng(seed=42)
+# Default seed of the random number generators, 42 for reproducibility
+SEED = 42
+
+# Random Number Generator used outside of the loaders
+RNG = np.random.default_rng(seed=SEED)
+
+# Keys of the random streams of an epoch: the order, data points and batches
+ORDER_STREAM, SAMPLE_STREAM, BATCH_STREAM = 0, 1, 2
+
+# Generators of the loaders, per thread
+_THREAD_RNG = threading.local()
+
+# Default audio loading, the defaults of librosa.load
+DEFAULT_SR = 22050
+DEFAULT_RES_TYPE = "soxr_hq"
+
+# Resampling methods available with the installed dependencies: soxr from the
+# best quality to the fastest, then the resamplers of SciPy
+RES_TYPES = (
+    "soxr_vhq",
+    "soxr_hq",
+    "soxr_mq",
+    "soxr_lq",
+    "soxr_qq",
+    "polyphase",
+    "fft",
+    "scipy",
+)
+
+# Image reduction factors supported by the reduced decoding of OpenCV
+IMAGE_REDUCTIONS = (1, 2, 4, 8)
 
 # File not found message
 INVALID_FILE_ERROR = 'Directory not found: "{}"'
 
 # Invalid param message
 INVALID_S_T_MSG = "{} must be greater than {}"
+
+# Invalid resampling method message
+INVALID_RES_TYPE_MSG = 'res_type must be one of {}, got "{}"'
+
+# Invalid image reduction message
+INVALID_REDUCTION_MSG = 'reduction must be one of {}, got "{}"'
+
+# Valid executor types for parallel loading
+EXECUTOR_TYPES = ("thread", "process")
+
+# Invalid worker configuration messages
+INVALID_WORKERS_MSG = "num_workers must be greater than or equal to 0"
+INVALID_EXECUTOR_MSG = 'executor must be one of {}, got "{}"'
+
+# Batch type hints
+BATCH_RETURN_TYPE = tuple[DATA_RETURN_TYPES, np.ndarray]
+
+# Mixed sampling rate message
+MIXED_SR_MSG = "Cannot collate audio with different sampling rates: {}"
+
+
+def get_rng() -> np.random.Generator:
+    """
+    Returns the random number generator of the current thread.
+
+    Transforms draw their random numbers from it. Inside rng_scope it is the
+    generator of that scope, otherwise the shared RNG.
+
+    Returns:
+        np.random.Generator: The random number generator.
+    """
+    return getattr(_THREAD_RNG, "rng", RNG)
+
+
+def spawn_rng(seed: int, *key: int) -> np.random.Generator:
+    """
+    Returns an independent random number generator for the given key.
+
+    The stream only depends on the seed and the key, such as (epoch, index),
+    so it is the same whichever worker or process creates it.
+
+    Args:
+        seed (int): The seed shared by all streams.
+        *key (int): The key of the stream, see np.random.SeedSequence.spawn_key.
+
+    Returns:
+        np.random.Generator: The random number generator.
+    """
+    return np.random.default_rng(np.random.SeedSequence(seed, spawn_key=key))
+
+
+@contextmanager
+def rng_scope(rng: np.random.Generator) -> Generator[np.random.Generator]:
+    """
+    Makes rng the generator returned by get_rng in the current thread.
+
+    Other threads keep their own generator, so they never share one.
+
+    Args:
+        rng (np.random.Generator): The random number generator.
+
+    Yields:
+        np.random.Generator: The random number generator.
+    """
+    previous = getattr(_THREAD_RNG, "rng", None)
+    _THREAD_RNG.rng = rng
+    try:
+        yield rng
+    finally:
+        # Restore the generator of an enclosing scope
+        if previous is None:
+            del _THREAD_RNG.rng
+        else:
+            _THREAD_RNG.rng = previous
+
+
+def seed_thread(seeds: Iterator[np.random.SeedSequence]) -> None:
+    """
+    Gives the current thread its own generator, seeded with the next seed.
+
+    Used as the initializer of thread pools, so that every worker thread
+    draws from its own stream instead of sharing RNG.
+
+    Args:
+        seeds (Iterator[np.random.SeedSequence]): The seeds of the threads.
+    """
+    _THREAD_RNG.rng = np.random.default_rng(next(seeds))
+
+
+def readonly[D: DATA_RETURN_TYPES](data: D) -> D:
+    """
+    Marks the arrays of a data point as read-only in place.
+
+    Args:
+        data (D): An image or an (audio, sampling rate) tuple.
+
+    Returns:
+        D: The same data point.
+    """
+    array = data[0] if isinstance(data, tuple) else data
+    array.flags.writeable = False
+    return data
+
+
+def data_nbytes(data: DATA_RETURN_TYPES) -> int:
+    """
+    Returns the number of bytes held by the arrays of a data point.
+
+    Args:
+        data (DATA_RETURN_TYPES): An image or an (audio, sampling rate) tuple.
+
+    Returns:
+        int: The number of bytes of the array.
+    """
+    array = data[0] if isinstance(data, tuple) else data
+    return array.nbytes
+
+
+# Packed dataset files, alignment of every data point in bytes and messages
+PACKED_DATA_FILE = "data.bin"
+PACKED_INDEX_FILE = "index.npz"
+PACKED_ALIGNMENT = 64
+PACKED_TRANSFORM_MSG = "Cannot pack a dataset with a transform, remove it first"
+PACKED_DTYPE_MSG = "Cannot pack data points of different dtypes: {} and {}"
+PACKED_TYPE_MSG = 'Packed dataset at "{}" contains {} data, not {} data'
+
+# Manifest: seconds within which a directory change may not update its
+# modification time
+MANIFEST_MTIME_RESOLUTION = 2.0
+
+# Instrumentation: edges of the stage time histograms in seconds, ten bins per
+# decade from 1 us to 100 s
+STAGE_HISTOGRAM_EDGES = np.geomspace(1e-6, 1e2, 81)
+STAGE_HISTOGRAM_EDGES.flags.writeable = False
+
+# Process loader: seconds between checks of the workers, seconds to wait for
+# the workers to stop and messages
+WORKER_POLL_INTERVAL = 0.1
+WORKER_SHUTDOWN_TIMEOUT = 5.0
+WORKER_DIED_MSG = "Worker process {} exited unexpectedly with exit code {}"
+WORKERS_STOPPED_MSG = "The workers were stopped, the loader was closed during the epoch"
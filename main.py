@@ -1,11 +1,13 @@
-# Import libraries to display image and audio
-import matplotlib as mpl
-import matplotlib.pyplot as plt
+# Import libraries, the libraries to display image and audio are imported
+# by the functions that use them, so the demonstrations start fast
+import argparse
+import time
+from collections.abc import Callable
+
 import numpy as np
-import soundfile as sf
-from librosa.display import specshow
 
 # Import Datasets
+from datasets.baseclasses import DataTransform
 from datasets.dataset import (
     EagerAudioDataset,
     EagerImageDataset,
@@ -14,20 +16,36 @@ from datasets.dataset import (
 )
 
 # Import Transforms
-from datasets.transform import SpectrogramTransform, SquareErasingTransform
-
-try:
-    import sounddevice as sd
-
-    SOUND_AVAILABLE = True
-except OSError:
-    SOUND_AVAILABLE = False
-
+from datasets.transform import (
+    CenterCropTransform,
+    RandomAudioCropTransform,
+    SpectrogramTransform,
+    SquareErasingTransform,
+)
 
 # Paths to audio and image datasets
 AUDIO_DATASET_PATH = "data/audio_dataset"
 IMAGE_DATASET_PATH = "data/image_dataset"
 
+# Dataset classes that can be profiled, with their data type
+PROFILE_DATASETS = {
+    "EagerAudioDataset": ("audio", EagerAudioDataset),
+    "LazyAudioDataset": ("audio", LazyAudioDataset),
+    "EagerImageDataset": ("image", EagerImageDataset),
+    "LazyImageDataset": ("image", LazyImageDataset),
+}
+
+# Transforms that can be profiled, with the data type they accept
+PROFILE_TRANSFORMS: dict[
+    str, tuple[str | None, Callable[[argparse.Namespace], DataTransform | None]]
+] = {
+    "none": (None, lambda _: None),
+    "random_crop": ("audio", lambda args: RandomAudioCropTransform(t=args.seconds)),
+    "spectrogram": ("audio", lambda _: SpectrogramTransform()),
+    "center_crop": ("image", lambda args: CenterCropTransform(s=args.size)),
+    "square_erasing": ("image", lambda args: SquareErasingTransform(s=args.size)),
+}
+
 
 def main() -> None:
     """
@@ -41,9 +59,18 @@ def play_audio(audio: tuple[np.ndarray, float], label: str, loader_type: str) ->
     """
     Plays an audio using sounddevice or saves it to a file
     """
+    import soundfile as sf  # noqa: PLC0415
+
+    # Sounddevice is only available with a PortAudio library
+    try:
+        import sounddevice as sd  # noqa: PLC0415
+
+        sound_available = True
+    except OSError:
+        sound_available = False
 
     # Play the audio if possible, else save to wav file
-    if SOUND_AVAILABLE:
+    if sound_available:
         try:
             sd.play(audio[0], samplerate=audio[1])
         except sd.PortAudioError:
@@ -60,6 +87,8 @@ def display_image(image: np.ndarray, label: str, loader_type: str) -> None:
     """
     Displays an image using matplotlib.pyplot or saves it to a file
     """
+    import matplotlib as mpl  # noqa: PLC0415
+    import matplotlib.pyplot as plt  # noqa: PLC0415
 
     # Plot the figure
     plt.clf()
@@ -214,6 +243,10 @@ def transform_on_audio() -> None:
     transformation and prints the first data point from the loaded dataset.
 
     """
+    import matplotlib as mpl  # noqa: PLC0415
+    import matplotlib.pyplot as plt  # noqa: PLC0415
+    from librosa.display import specshow  # noqa: PLC0415
+
     print("EAGER AUDIO DATASET LOADER WITH TRANSFORM")
 
     # Load the transform
@@ -250,21 +283,178 @@ def transform_on_audio() -> None:
     plt.close()
 
 
+def run_epochs(args: argparse.Namespace) -> tuple[float, list[float]]:
+    """
+    Instantiates the chosen dataset and iterates over it for a number of epochs.
+
+    Args:
+        args (argparse.Namespace): The arguments of the profile command.
+
+    Returns:
+        tuple[float, list[float]]: The time to instantiate (load) the dataset
+            and the time of every epoch, in seconds.
+    """
+    from datasets.loader import BatchLoader  # noqa: PLC0415
+
+    # Instantiate the dataset, which loads it
+    data_type, loader = PROFILE_DATASETS[args.dataset]
+    default_root = AUDIO_DATASET_PATH if data_type == "audio" else IMAGE_DATASET_PATH
+    root = args.root or default_root
+    transform = PROFILE_TRANSFORMS[args.transform][1](args)
+    start = time.perf_counter()
+    dataset = loader(root=root, transform=transform)
+    load_s = time.perf_counter() - start
+
+    # Iterate over the data points, or over batches if a batch size is given
+    epoch_s = []
+    for _ in range(args.epochs):
+        start = time.perf_counter()
+        if args.batch_size > 0:
+            for _ in BatchLoader(dataset, batch_size=args.batch_size):
+                pass
+        else:
+            for index in range(len(dataset)):
+                dataset[index]
+        epoch_s.append(time.perf_counter() - start)
+
+    return load_s, epoch_s
+
+
+def profile(args: argparse.Namespace) -> None:
+    """
+    Profiles the chosen dataset and transform and prints the hotspots.
+
+    With cProfile, every call is counted and the report is sorted by args.sort.
+    With the sampling profiler, the overhead is lower and the stacks can be
+    written in the folded format of flamegraph tools.
+
+    Args:
+        args (argparse.Namespace): The arguments of the profile command.
+    """
+    # Profile with cProfile and print the functions with the most time
+    if args.profiler == "cprofile":
+        import cProfile  # noqa: PLC0415
+        import pstats  # noqa: PLC0415
+
+        profiler = cProfile.Profile()
+        load_s, epoch_s = profiler.runcall(run_epochs, args)
+        pstats.Stats(profiler).sort_stats(args.sort).print_stats(args.top)
+        if args.output is not None:
+            profiler.dump_stats(args.output)
+
+    # Else sample the stacks and print the frames with the most samples
+    else:
+        from benchmarks.profiler import SamplingProfiler  # noqa: PLC0415
+
+        with SamplingProfiler(args.interval, all_threads=args.all_threads) as sampler:
+            load_s, epoch_s = run_epochs(args)
+        total = max(sum(sampler.samples.values()), 1)
+        print(f"{'self':>7} {'total':>7}  frame")
+        for frame, own, inclusive in sampler.hotspots(args.top):
+            print(f"{own / total:7.1%} {inclusive / total:7.1%}  {frame}")
+        if args.stacks is not None:
+            sampler.write_folded(args.stacks)
+
+    # Print the timings
+    print(f"load {load_s:.3f} s, epochs " + ", ".join(f"{s:.3f} s" for s in epoch_s))
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parses the command line.
+
+    Without a command, the demonstrations are run.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Demonstrates the datasets, or profiles one of them."
+    )
+    commands = parser.add_subparsers(dest="command")
+    parser_profile = commands.add_parser(
+        "profile",
+        help="profile a dataset and transform over a number of epochs",
+        description="Runs a dataset and transform over a number of epochs under "
+        "a profiler and prints the hotspots.",
+    )
+    parser_profile.add_argument("dataset", choices=tuple(PROFILE_DATASETS))
+    parser_profile.add_argument(
+        "--transform", choices=tuple(PROFILE_TRANSFORMS), default="none"
+    )
+    parser_profile.add_argument("--root", help="defaults to the bundled dataset")
+    parser_profile.add_argument("--epochs", type=int, default=3)
+    parser_profile.add_argument(
+        "--batch-size", type=int, default=0, help="iterate in batches if above 0"
+    )
+    parser_profile.add_argument(
+        "--size", type=int, default=64, help="s of the image transforms"
+    )
+    parser_profile.add_argument(
+        "--seconds", type=float, default=0.5, help="t of the audio crop"
+    )
+    parser_profile.add_argument(
+        "--profiler", choices=("cprofile", "sample"), default="cprofile"
+    )
+    parser_profile.add_argument(
+        "--sort",
+        choices=("cumulative", "tottime", "calls"),
+        default="cumulative",
+        help="order of the cProfile report",
+    )
+    parser_profile.add_argument("--top", type=int, default=25)
+    parser_profile.add_argument(
+        "--output", help="write the cProfile statistics to this file"
+    )
+    parser_profile.add_argument(
+        "--interval", type=float, default=0.001, help="seconds between samples"
+    )
+    parser_profile.add_argument(
+        "--all-threads", action="store_true", help="sample the worker threads too"
+    )
+    parser_profile.add_argument(
+        "--stacks", help="write the sampled stacks in the folded flamegraph format"
+    )
+    args = parser.parse_args()
+
+    # Check the combinations that argparse cannot check
+    if args.command == "profile":
+        transform_type = PROFILE_TRANSFORMS[args.transform][0]
+        if transform_type not in (None, PROFILE_DATASETS[args.dataset][0]):
+            parser.error(f"{args.transform} is not a transform for {args.dataset}")
+        if args.profiler == "cprofile" and args.stacks is not None:
+            parser.error("--stacks requires --profiler sample")
+        if args.profiler == "sample" and args.output is not None:
+            parser.error("--output requires --profiler cprofile")
+        if args.epochs <= 0:
+            parser.error("--epochs must be greater than 0")
+
+    return args
+
+
 if __name__ == "__main__":
-    # Run Eager Audio Loader
-    eager_audio_dataset()
+    args = parse_args()
+
+    # Profile a dataset if requested
+    if args.command == "profile":
+        profile(args)
+
+    # Else run the demonstrations
+    else:
+        # Run Eager Audio Loader
+        eager_audio_dataset()
 
-    # Run Lazy Audio Loader
-    lazy_audio_dataset()
+        # Run Lazy Audio Loader
+        lazy_audio_dataset()
 
-    # Run Eager Image Loader
-    eager_image_dataset()
+        # Run Eager Image Loader
+        eager_image_dataset()
 
-    # Run Lazy Image Loader
-    lazy_image_dataset()
+        # Run Lazy Image Loader
+        lazy_image_dataset()
 
-    # Run Eager Image Loader with a transformation
-    transform_on_image()
+        # Run Eager Image Loader with a transformation
+        transform_on_image()
 
-    # Run Eager Audio Loader with a transformation
-    transform_on_audio()
+        # Run Eager Audio Loader with a transformation
+        transform_on_audio()
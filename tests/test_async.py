@@ -0,0 +1,133 @@
+# Import libraries
+import asyncio
+import threading
+import time
+import unittest
+
+import numpy as np
+
+# Import from other modules
+from datasets.dataset import LazyAudioDataset, LazyImageDataset
+from datasets.loader import BatchLoader
+
+
+class TestAsyncAccess(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests the asyncio access to lazy datasets
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up the test
+        """
+
+        # Set root
+        self.root = "tests/test_datasets/loading_dataset"
+
+        # Set up the test
+        super().setUp()
+
+    async def test_aget(self) -> None:
+        """
+        Tests that aget returns the same data points as __getitem__
+        """
+
+        # Loop through the lazy loaders
+        for loader_type, loader in (
+            ("audio", LazyAudioDataset),
+            ("image", LazyImageDataset),
+        ):
+            dataset = loader(root=f"{self.root}/{loader_type}_dataset")
+
+            # Await all data points at once
+            items = await asyncio.gather(
+                *(dataset.aget(i) for i in range(len(dataset)))
+            )
+
+            # Assert that every data point matches __getitem__
+            for i, (data, label) in enumerate(items):
+                expected_data, expected_label = dataset[i]
+                if loader_type == "audio":
+                    self.assertTrue(np.array_equal(data[0], expected_data[0]))
+                else:
+                    self.assertTrue(np.array_equal(data, expected_data))
+                self.assertEqual(label, expected_label)
+
+            # Out of range indices raise in the caller
+            with self.assertRaises(IndexError):
+                await dataset.aget(len(dataset))
+            await dataset.aclose()
+
+    async def test_abatches(self) -> None:
+        """
+        Tests that abatches returns the batches of BatchLoader
+        """
+        dataset = LazyImageDataset(root=f"{self.root}/image_dataset")
+        batches = [batch async for batch in dataset.abatches(1)]
+        expected = list(BatchLoader(dataset, batch_size=1))
+
+        # Assert that the batches match in order
+        self.assertEqual(len(batches), len(expected))
+        for (data, labels), (expected_data, expected_labels) in zip(
+            batches, expected, strict=True
+        ):
+            self.assertTrue(np.array_equal(data, expected_data))
+            self.assertTrue(np.array_equal(labels, expected_labels))
+
+        # Invalid batch sizes raise a ValueError
+        with self.assertRaises(ValueError):
+            await anext(dataset.abatches(0))
+        await dataset.aclose()
+
+    async def test_concurrency_limit(self) -> None:
+        """
+        Tests that decoding is limited to async_workers and does not block the loop
+        """
+        dataset = LazyImageDataset(root=f"{self.root}/image_dataset", async_workers=2)
+
+        # Count the files decoded at the same time
+        active, peak = 0, 0
+        lock = threading.Lock()
+        load = dataset._load_single_data
+
+        def slow_load(path: str) -> np.ndarray:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+            return load(path)
+
+        dataset._load_single_data = slow_load
+
+        # The loop keeps running while six data points are decoded
+        ticks = 0
+
+        async def tick() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker = asyncio.create_task(tick())
+        await asyncio.gather(*(dataset.aget(i % len(dataset)) for i in range(6)))
+        ticker.cancel()
+
+        # Assert that at most two files were decoded at once
+        self.assertEqual(peak, 2)
+        self.assertGreater(ticks, 5)
+        await dataset.aclose()
+
+    def test_invalid_async_workers(self) -> None:
+        """
+        Tests that a non-positive number of async workers raises a ValueError
+        """
+        with self.assertRaises(ValueError):
+            LazyImageDataset(root=f"{self.root}/image_dataset", async_workers=0)
+
+
+# Run the tests
+if __name__ == "__main__":
+    unittest.main()
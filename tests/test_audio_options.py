@@ -0,0 +1,85 @@
+# Import libraries
+import pathlib
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+import soundfile as sf
+
+# Import from other modules
+from datasets.dataset import EagerAudioDataset, LazyAudioDataset
+
+
+class TestAudioOptions(unittest.TestCase):
+    """
+    Tests the sampling rate, mono and resampling options of the audio datasets
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up the test
+        """
+
+        # Set root, the test files have a native sampling rate of 32728 Hz
+        self.root = "tests/test_datasets/loading_dataset/audio_dataset"
+        self.native_sr = 32728
+
+        # Set up the test
+        super().setUp()
+
+    def test_native_sampling_rate(self) -> None:
+        """
+        Tests that sr=None keeps the native sampling rate
+        """
+        for loader in (EagerAudioDataset, LazyAudioDataset):
+            dataset = loader(root=self.root, sr=None)
+            (audio, sr), _ = dataset[0]
+            self.assertEqual(sr, self.native_sr)
+            self.assertEqual(audio.ndim, 1)
+
+    def test_target_sampling_rate(self) -> None:
+        """
+        Tests that an explicit sampling rate resamples with any resampler
+        """
+
+        # The default resampler and a fast one give the same length
+        (native, _), _ = LazyAudioDataset(root=self.root, sr=None)[0]
+        for res_type in ("soxr_hq", "soxr_qq"):
+            dataset = LazyAudioDataset(root=self.root, sr=8000, res_type=res_type)
+            (audio, sr), _ = dataset[0]
+            self.assertEqual(sr, 8000)
+            expected = np.ceil(native.shape[0] * 8000 / self.native_sr)
+            self.assertEqual(audio.shape[0], expected)
+
+    def test_multichannel(self) -> None:
+        """
+        Tests that mono=False keeps the channels of multichannel audio
+        """
+
+        # Write a stereo file of one second
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        pathlib.Path(f"{directory}/stereo").mkdir()
+        stereo = np.zeros((8000, 2), dtype=np.float32)
+        sf.write(f"{directory}/stereo/stereo.wav", stereo, 8000)
+
+        # Channels come first, mono mixes them down
+        (audio, _), _ = LazyAudioDataset(root=directory, sr=None, mono=False)[0]
+        self.assertEqual(audio.shape, (2, 8000))
+        (audio, _), _ = LazyAudioDataset(root=directory, sr=None)[0]
+        self.assertEqual(audio.shape, (8000,))
+
+    def test_invalid_options(self) -> None:
+        """
+        Tests that invalid options raise a ValueError
+        """
+        with self.assertRaises(ValueError):
+            LazyAudioDataset(root=self.root, sr=0)
+        with self.assertRaises(ValueError):
+            LazyAudioDataset(root=self.root, res_type="nearest")
+
+
+# Run the tests
+if __name__ == "__main__":
+    unittest.main()
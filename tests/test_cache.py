@@ -0,0 +1,105 @@
+# Import libraries
+import unittest
+
+import numpy as np
+
+# Import from other modules
+from datasets.cache import LRUCache
+from datasets.dataset import LazyAudioDataset, LazyImageDataset
+
+
+class TestLRUCache(unittest.TestCase):
+    """
+    Tests the in-memory cache of decoded data points
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up the test
+        """
+
+        # Set root
+        self.root = "tests/test_datasets/loading_dataset"
+
+        # Set up the test
+        super().setUp()
+
+    def test_item_bound(self) -> None:
+        """
+        Tests that the least recently used entry is evicted
+        """
+
+        # Fill a cache of two items with three
+        cache = LRUCache(max_items=2)
+        cache.put("a", np.zeros(1))
+        cache.put("b", np.zeros(1))
+        cache.get("a")
+        cache.put("c", np.zeros(1))
+
+        # Assert that b was evicted and a and c are kept
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNotNone(cache.get("c"))
+        self.assertEqual(cache.info.evictions, 1)
+        self.assertEqual((cache.info.hits, cache.info.misses), (3, 1))
+
+    def test_byte_bound(self) -> None:
+        """
+        Tests that the cache stays under its byte bound
+        """
+
+        # Store three arrays of 8 bytes in a cache of 16 bytes
+        cache = LRUCache(max_bytes=16)
+        for key in "abc":
+            cache.put(key, (np.zeros(1), 22050))
+        self.assertEqual(cache.info.nbytes, 16)
+        self.assertEqual(len(cache), 2)
+
+        # Data larger than the cache is not stored
+        cache.put("d", np.zeros(3))
+        self.assertIsNone(cache.get("d"))
+
+    def test_invalid_bounds(self) -> None:
+        """
+        Tests that invalid bounds raise a ValueError
+        """
+        with self.assertRaises(ValueError):
+            LRUCache(max_items=0)
+        with self.assertRaises(ValueError):
+            LRUCache(max_bytes=-1)
+
+    def test_lazy_dataset_cache(self) -> None:
+        """
+        Tests that lazy datasets serve repeated accesses from the cache
+        """
+
+        # Loop through the lazy loaders
+        for loader_type, loader in (
+            ("audio", LazyAudioDataset),
+            ("image", LazyImageDataset),
+        ):
+            cached = loader(root=f"{self.root}/{loader_type}_dataset", cache=LRUCache())
+            uncached = loader(root=f"{self.root}/{loader_type}_dataset")
+
+            # Access every data point for two epochs
+            for _ in range(2):
+                for i in range(len(cached)):
+                    data, label = cached[i]
+                    expected_data, expected_label = uncached[i]
+                    if loader_type == "audio":
+                        data, expected_data = data[0], expected_data[0]
+                    self.assertTrue(np.array_equal(data, expected_data))
+                    self.assertEqual(label, expected_label)
+
+                    # Cached data cannot be changed by the caller
+                    self.assertFalse(data.flags.writeable)
+
+            # Assert that the second epoch only hit the cache
+            info = cached.cache_info
+            self.assertEqual((info.hits, info.misses), (len(cached), len(cached)))
+            self.assertIsNone(uncached.cache_info)
+
+
+# Run the tests
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+# Import libraries
+import os
+import pathlib
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+# Import from other modules
+from datasets.cache import DiskCache, file_key
+from datasets.dataset import (
+    EagerAudioDataset,
+    EagerImageDataset,
+    LazyAudioDataset,
+    LazyImageDataset,
+)
+
+
+class TestDiskCache(unittest.TestCase):
+    """
+    Tests the persistent cache of decoded data points
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up the test
+        """
+
+        # Set root and a temporary cache directory
+        self.root = "tests/test_datasets/loading_dataset"
+        self.directory = tempfile.mkdtemp()
+
+        # Define the loaders per data type
+        self.loaders = {
+            "audio": (EagerAudioDataset, LazyAudioDataset),
+            "image": (EagerImageDataset, LazyImageDataset),
+        }
+
+        # Set up the test
+        super().setUp()
+
+    def tearDown(self) -> None:
+        """
+        Remove the temporary cache directory
+        """
+        shutil.rmtree(self.directory)
+        super().tearDown()
+
+    def test_datasets_use_disk_cache(self) -> None:
+        """
+        Tests that cached data is written once and read back as a memory map
+        """
+
+        # Loop through the data types
+        for loader_type, (eager, lazy) in self.loaders.items():
+            dataset_path = f"{self.root}/{loader_type}_dataset"
+            cache = DiskCache(f"{self.directory}/{loader_type}")
+
+            # The eager dataset writes every data point, the lazy one reads them
+            expected = eager(root=dataset_path, disk_cache=cache)
+            cached = lazy(root=dataset_path, disk_cache=cache)
+            self.assertEqual(cache.info.items, len(expected))
+
+            # Assert that the cached data points equal the decoded ones
+            for i in range(len(cached)):
+                data, _ = cached[i]
+                path = cached._data[i][0]
+                expected_data = cached._load_single_data(path)
+                if loader_type == "audio":
+                    self.assertEqual(data[1], expected_data[1])
+                    data, expected_data = data[0], expected_data[0]
+                self.assertIsInstance(data, np.memmap)
+                self.assertTrue(np.array_equal(data, expected_data))
+
+            # Every lookup of the lazy dataset was a hit
+            self.assertEqual(cache.info.hits, len(cached))
+
+    def test_key_changes_with_file(self) -> None:
+        """
+        Tests that the key changes when the file or the parameters change
+        """
+
+        # Copy a file so it can be modified
+        source = next(pathlib.Path(f"{self.root}/image_dataset").rglob("*.png"))
+        path = shutil.copy(source, self.directory)
+        key = file_key(path)
+
+        # Different parameters and a new modification time change the key
+        self.assertNotEqual(key, file_key(path, sr=None))
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        self.assertNotEqual(key, file_key(path))
+
+    def test_clear(self) -> None:
+        """
+        Tests that clearing removes the stored data
+        """
+        cache = DiskCache(self.directory)
+        cache.put("key", (np.zeros(4, dtype=np.float32), 22050))
+        self.assertEqual(cache.get("key")[1], 22050)
+        cache.clear()
+        self.assertIsNone(cache.get("key"))
+        self.assertEqual(cache.info.items, 0)
+
+    def test_put_is_read_only(self) -> None:
+        """
+        Tests that put returns read-only data, like every later get
+        """
+        cache = DiskCache(self.directory)
+        image = cache.put("image", np.zeros((2, 2), dtype=np.uint8))
+        audio, _ = cache.put("audio", (np.zeros(4, dtype=np.float32), 22050))
+        self.assertFalse(image.flags.writeable)
+        self.assertFalse(audio.flags.writeable)
+        self.assertFalse(cache.get("image").flags.writeable)
+
+    def test_prune(self) -> None:
+        """
+        Tests that pruning removes the entries whose key is not kept
+        """
+        cache = DiskCache(self.directory)
+        cache.put("old", (np.zeros(4, dtype=np.float32), 22050))
+        cache.put("new", np.zeros(4, dtype=np.uint8))
+
+        # Only the entry that is not kept is removed, with its sampling rate
+        self.assertEqual(cache.prune(["new"]), 1)
+        self.assertIsNone(cache.get("old"))
+        self.assertIsNotNone(cache.get("new"))
+        self.assertEqual(os.listdir(self.directory), ["new.npy"])
+
+
+# Run the tests
+if __name__ == "__main__":
+    unittest.main()
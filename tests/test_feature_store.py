@@ -0,0 +1,149 @@
+# Import libraries
+import os
+import shutil
+import tempfile
+import unittest
+
+import cv2
+import numpy as np
+
+# Import from other modules
+from datasets.cache import DiskCache, LRUCache
+from datasets.dataset import (
+    EagerAudioDataset,
+    EagerImageDataset,
+    LazyAudioDataset,
+    LazyImageDataset,
+)
+from datasets.transform import (
+    CenterCropTransform,
+    RandomAudioCropTransform,
+    SpectrogramTransform,
+)
+
+
+class TestFeatureStore(unittest.TestCase):
+    """
+    Tests storing the outputs of deterministic transforms
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up the test
+        """
+
+        # Set root and a temporary directory
+        self.root = "tests/test_datasets/loading_dataset"
+        self.directory = tempfile.mkdtemp()
+
+        # Set up the test
+        super().setUp()
+
+    def tearDown(self) -> None:
+        """
+        Remove the temporary directory
+        """
+        shutil.rmtree(self.directory)
+        super().tearDown()
+
+    def test_in_memory_store(self) -> None:
+        """
+        Tests that spectrograms are computed once and then served from memory
+        """
+
+        # Access every data point twice
+        store = LRUCache()
+        dataset = EagerAudioDataset(
+            root=f"{self.root}/audio_dataset",
+            transform=SpectrogramTransform(),
+            feature_store=store,
+        )
+        first = [dataset[i][0][0] for i in range(len(dataset))]
+        second = [dataset[i][0][0] for i in range(len(dataset))]
+
+        # The second pass only hits and returns the same read-only arrays
+        self.assertEqual(store.info.misses, len(dataset))
+        self.assertEqual(store.info.hits, len(dataset))
+        for a, b in zip(first, second, strict=True):
+            self.assertIs(a, b)
+            self.assertFalse(a.flags.writeable)
+
+        # New transform parameters are computed again
+        dataset.transform = SpectrogramTransform(n_mels=64)
+        self.assertEqual(dataset[0][0][0].shape[0], 64)
+        self.assertEqual(store.info.misses, len(dataset) + 1)
+
+    def test_disk_store_and_changed_file(self) -> None:
+        """
+        Tests that a memory-mapped store recomputes features of changed files
+        """
+
+        # Copy the images so they can be changed
+        root = f"{self.directory}/images"
+        shutil.copytree(f"{self.root}/image_dataset", root)
+        store = DiskCache(f"{self.directory}/features")
+        transform = CenterCropTransform(s=32)
+        dataset = LazyImageDataset(root=root, transform=transform, feature_store=store)
+
+        # The features are stored and read back from disk
+        expected = transform.process(LazyImageDataset(root=root)[0][0])
+        dataset[0]
+        features, _ = dataset[0]
+        self.assertIsInstance(features, np.memmap)
+        self.assertTrue(np.array_equal(features, expected))
+        self.assertEqual(store.info.items, 1)
+
+        # Changing the file changes its key
+        path = dataset._data[0][0]
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        dataset[0]
+        self.assertEqual(store.info.items, 2)
+
+    def test_eager_store_after_changed_file(self) -> None:
+        """
+        Tests that an eager dataset stores its features under the version it
+        decoded, so a changed file is not served the old features
+        """
+        # Copy the images so they can be changed
+        root = f"{self.directory}/images"
+        shutil.copytree(f"{self.root}/image_dataset", root)
+        store = DiskCache(f"{self.directory}/features")
+        transform = CenterCropTransform(s=32)
+        eager = EagerImageDataset(root=root, transform=transform, feature_store=store)
+
+        # Invert the first image after the eager dataset decoded it
+        path = eager._paths[0]
+        cv2.imwrite(path, 255 - cv2.imread(path, cv2.IMREAD_UNCHANGED))
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        # The eager dataset still serves the features of the data it holds
+        old, _ = eager[0]
+
+        # A lazy dataset sharing the store gets the features of the new file
+        expected = transform.process(LazyImageDataset(root=root)[0][0])
+        new, _ = LazyImageDataset(root=root, transform=transform, feature_store=store)[
+            0
+        ]
+        self.assertTrue(np.array_equal(new, expected))
+        self.assertFalse(np.array_equal(new, old))
+        self.assertEqual(store.info.items, 2)
+
+    def test_random_transform_not_stored(self) -> None:
+        """
+        Tests that random transforms are applied every time
+        """
+        store = LRUCache()
+        dataset = LazyAudioDataset(
+            root=f"{self.root}/audio_dataset",
+            transform=RandomAudioCropTransform(t=0.5),
+            feature_store=store,
+        )
+        dataset[0]
+        self.assertEqual(len(store), 0)
+
+
+# Run the tests
+if __name__ == "__main__":
+    unittest.main()
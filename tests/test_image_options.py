@@ -0,0 +1,67 @@
+# Import libraries
+import unittest
+
+import cv2
+import numpy as np
+
+# Import from other modules
+from datasets.dataset import EagerImageDataset, LazyImageDataset
+
+
+class TestImageOptions(unittest.TestCase):
+    """
+    Tests the reduced and resized decoding of the image datasets
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up the test
+        """
+
+        # Set root, the test images are 128 by 128 pixels
+        self.root = "tests/test_datasets/loading_dataset/image_dataset"
+
+        # Set up the test
+        super().setUp()
+
+    def test_reduction(self) -> None:
+        """
+        Tests that the reduction factor divides the resolution
+        """
+        for loader in (EagerImageDataset, LazyImageDataset):
+            for reduction in (2, 4, 8):
+                image, _ = loader(root=self.root, reduction=reduction)[0]
+                self.assertEqual(image.shape, (128 // reduction, 128 // reduction, 3))
+
+    def test_size(self) -> None:
+        """
+        Tests that images are resized to (height, width) and converted to RGB
+        """
+
+        # Resize to a non square size
+        dataset = LazyImageDataset(root=self.root, size=(64, 32))
+        image, _ = dataset[0]
+        self.assertEqual(image.shape, (64, 32, 3))
+
+        # The result matches a resize of the full RGB image
+        path = dataset._data[0][0]
+        expected = cv2.resize(
+            cv2.cvtColor(cv2.imread(path), cv2.COLOR_BGR2RGB),
+            (32, 64),
+            interpolation=cv2.INTER_AREA,
+        )
+        self.assertTrue(np.array_equal(image, expected))
+
+    def test_invalid_options(self) -> None:
+        """
+        Tests that invalid options raise a ValueError
+        """
+        with self.assertRaises(ValueError):
+            LazyImageDataset(root=self.root, reduction=3)
+        with self.assertRaises(ValueError):
+            LazyImageDataset(root=self.root, size=(0, 32))
+
+
+# Run the tests
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+# Import libraries
+import unittest
+
+# Import from other modules
+from benchmarks.import_time import cold_import
+
+
+class TestImports(unittest.TestCase):
+    """
+    Tests that the heavy backends are only imported when they are used
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up the test
+        """
+
+        # Set root
+        self.root = "tests/test_datasets/loading_dataset"
+
+        # Set up the test
+        super().setUp()
+
+    def test_import_without_backends(self) -> None:
+        """
+        Tests that importing the package imports no backend
+        """
+        for module in ("datasets.dataset", "datasets.loader", "datasets.transform"):
+            _, backends = cold_import(f"import {module}")
+            self.assertEqual(backends, [], module)
+
+    def test_backend_per_data_type(self) -> None:
+        """
+        Tests that loading a data point imports only the backend of its type
+        """
+
+        # Image datasets import OpenCV but not librosa
+        _, backends = cold_import(
+            "from datasets.dataset import LazyImageDataset\n"
+            f"LazyImageDataset(root='{self.root}/image_dataset')[0]"
+        )
+        self.assertIn("cv2", backends)
+        self.assertNotIn("librosa", backends)
+
+        # Audio datasets import librosa but not OpenCV
+        _, backends = cold_import(
+            "from datasets.dataset import LazyAudioDataset\n"
+            f"LazyAudioDataset(root='{self.root}/audio_dataset')[0]"
+        )
+        self.assertIn("librosa", backends)
+        self.assertNotIn("cv2", backends)
+
+
+# Run the tests
+if __name__ == "__main__":
+    unittest.main()
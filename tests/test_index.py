@@ -0,0 +1,90 @@
+# Import libraries
+import unittest
+
+import numpy as np
+
+# Import from other modules
+from datasets.dataset import (
+    EagerAudioDataset,
+    EagerImageDataset,
+    LazyAudioDataset,
+    LazyImageDataset,
+)
+from datasets.index import LabeledTable, PackedStrings
+
+
+class TestIndex(unittest.TestCase):
+    """
+    Tests the class ids and the compact storage of paths and labels
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up the test
+        """
+
+        # Set root
+        self.root = "tests/test_datasets/loading_dataset"
+
+        # Define the loaders per data type
+        self.loaders = {
+            "audio": (EagerAudioDataset, LazyAudioDataset),
+            "image": (EagerImageDataset, LazyImageDataset),
+        }
+
+        # Set up the test
+        super().setUp()
+
+    def test_packed_strings(self) -> None:
+        """
+        Tests that packed strings are indexed like a list
+        """
+
+        # Include an empty and a non-ASCII string
+        strings = ["a/b.png", "", "ß/ü.wav"]
+        packed = PackedStrings(strings)
+
+        # Assert that indexing, negative indices and slices match the list
+        self.assertEqual(len(packed), len(strings))
+        self.assertEqual(list(packed), strings)
+        self.assertEqual(packed[-1], strings[-1])
+        self.assertEqual(packed[1:], strings[1:])
+        with self.assertRaises(IndexError):
+            packed[len(strings)]
+
+    def test_labeled_table(self) -> None:
+        """
+        Tests that a labeled table returns the item and the class name
+        """
+        table = LabeledTable(
+            PackedStrings(["x", "y"]), np.array([1, 0], np.int32), ("a", "b")
+        )
+        self.assertEqual(list(table), [("x", "b"), ("y", "a")])
+        with self.assertRaises(IndexError):
+            table[2]
+
+    def test_classes(self) -> None:
+        """
+        Tests that classes are numbered in sorted order by every loader
+        """
+
+        # Loop through the loaders
+        for loader_type, loaders in self.loaders.items():
+            for loader in loaders:
+                dataset = loader(root=f"{self.root}/{loader_type}_dataset")
+
+                # Assert the sorted classes and the mapping to their ids
+                self.assertEqual(dataset.classes, ("greninja", "pikachu"))
+                self.assertEqual(dataset.class_to_idx, {"greninja": 0, "pikachu": 1})
+
+                # Assert that the label ids match the labels of the data points
+                label_ids = dataset.label_ids
+                self.assertEqual(label_ids.dtype, np.int32)
+                self.assertFalse(label_ids.flags.writeable)
+                for i in range(len(dataset)):
+                    self.assertEqual(dataset.classes[label_ids[i]], dataset[i][1])
+
+
+# Run the tests
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+# Import libraries
+import threading
+import unittest
+
+import numpy as np
+
+# Import from other modules
+from datasets.dataset import EagerImageDataset, LazyAudioDataset, LazyImageDataset
+from datasets.instrumentation import Instrumentation, SampleTiming
+from datasets.transform import CenterCropTransform, SpectrogramTransform
+
+
+class TestInstrumentation(unittest.TestCase):
+    """
+    Tests the per-stage timing of __getitem__
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up the test
+        """
+
+        # Set root
+        self.root = "tests/test_datasets/loading_dataset"
+
+        # Set up the test
+        super().setUp()
+
+    def test_image_stages(self) -> None:
+        """
+        Tests that the stages of lazy images are recorded and summarized
+        """
+
+        # Collect the timings passed to the callback
+        timings: list[SampleTiming] = []
+        instrumentation = Instrumentation(callback=timings.append)
+        dataset = LazyImageDataset(
+            root=f"{self.root}/image_dataset",
+            transform=CenterCropTransform(s=16),
+            instrumentation=instrumentation,
+        )
+        for index in range(len(dataset)):
+            dataset[index]
+
+        # Every data point reports its stages in order, with their output size
+        self.assertEqual([timing.index for timing in timings], [0, 1])
+        stages = timings[0].stages
+        self.assertEqual(list(stages), ["read", "decode", "convert", "transform"])
+        self.assertEqual(stages["transform"].nbytes, 16 * 16 * 3)
+        self.assertLessEqual(
+            sum(stage.seconds for stage in stages.values()), timings[0].total_s
+        )
+
+        # The summary counts every data point and matches the histograms
+        summary = instrumentation.summary()
+        self.assertEqual(summary["total"].count, len(dataset))
+        self.assertEqual(summary["decode"].count, len(dataset))
+        self.assertEqual(instrumentation.histogram("decode").sum(), len(dataset))
+        self.assertLessEqual(summary["decode"].p50_s, summary["decode"].p99_s)
+
+        # Reset removes the recorded timings
+        instrumentation.reset()
+        self.assertEqual(instrumentation.summary(), {})
+
+    def test_audio_and_eager_stages(self) -> None:
+        """
+        Tests the stages of audio and of eager datasets
+        """
+
+        # Audio is decoded, resampled and transformed
+        instrumentation = Instrumentation()
+        dataset = LazyAudioDataset(
+            root=f"{self.root}/audio_dataset",
+            transform=SpectrogramTransform(),
+            instrumentation=instrumentation,
+        )
+        dataset[0]
+        self.assertEqual(
+            set(instrumentation.summary()), {"decode", "resample", "transform", "total"}
+        )
+
+        # Eager datasets only copy, the loading is not recorded
+        instrumentation = Instrumentation()
+        dataset = EagerImageDataset(
+            root=f"{self.root}/image_dataset", instrumentation=instrumentation
+        )
+        self.assertEqual(instrumentation.summary(), {})
+        dataset[0]
+        self.assertEqual(set(instrumentation.summary()), {"copy", "total"})
+
+    def test_threads(self) -> None:
+        """
+        Tests that data points returned by several threads are recorded apart
+        """
+        instrumentation = Instrumentation()
+        dataset = LazyImageDataset(
+            root=f"{self.root}/image_dataset", instrumentation=instrumentation
+        )
+
+        # Every thread returns every data point a number of times
+        def worker() -> None:
+            for _ in range(10):
+                for index in range(len(dataset)):
+                    dataset[index]
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Every stage ran once per data point
+        counts = {stage: s.count for stage, s in instrumentation.summary().items()}
+        self.assertEqual(set(counts.values()), {4 * 10 * len(dataset)})
+
+    def test_disabled(self) -> None:
+        """
+        Tests that the data points do not change with instrumentation
+        """
+        plain = LazyImageDataset(root=f"{self.root}/image_dataset")
+        instrumented = LazyImageDataset(
+            root=f"{self.root}/image_dataset", instrumentation=Instrumentation()
+        )
+        self.assertIsNone(plain.instrumentation)
+        self.assertTrue(np.array_equal(plain[0][0], instrumented[0][0]))
+
+
+# Run the tests
+if __name__ == "__main__":
+    unittest.main()
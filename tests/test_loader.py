@@ -0,0 +1,155 @@
+# Import libraries
+import unittest
+
+import numpy as np
+
+# Import from other modules
+from datasets.dataset import EagerAudioDataset, EagerImageDataset, LazyImageDataset
+from datasets.loader import (
+    BatchLoader,
+    collate_audio,
+    collate_images,
+    transform_collate,
+)
+from datasets.transform import CenterCropTransform, RandomAudioCropTransform
+
+
+class TestBatchLoader(unittest.TestCase):
+    """
+    Tests the batching of datasets
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up the test
+        """
+
+        # Set root
+        self.root = "tests/test_datasets/loading_dataset"
+
+        # Set up the test
+        super().setUp()
+
+    def test_len(self) -> None:
+        """
+        Tests the number of data points and batches
+        """
+
+        # Instantiate the dataset, it contains two images
+        dataset = LazyImageDataset(root=f"{self.root}/image_dataset")
+        self.assertEqual(len(dataset), len(dataset._data))
+
+        # Check the number of batches with and without dropping the last batch
+        self.assertEqual(len(BatchLoader(dataset, batch_size=3)), 1)
+        self.assertEqual(len(BatchLoader(dataset, batch_size=3, drop_last=True)), 0)
+        self.assertEqual(len(list(BatchLoader(dataset, batch_size=1))), 2)
+
+    def test_image_batches(self) -> None:
+        """
+        Tests that image batches are stacked in dataset order
+        """
+
+        # Batch all images at once
+        dataset = EagerImageDataset(root=f"{self.root}/image_dataset")
+        data, labels = next(iter(BatchLoader(dataset, batch_size=len(dataset))))
+
+        # Assert that the batch matches the data points in order
+        self.assertEqual(data.shape, (len(dataset), *dataset[0][0].shape))
+        self.assertTrue(np.array_equal(labels, dataset.label_ids))
+        for i in range(len(dataset)):
+            self.assertTrue(np.array_equal(data[i], dataset[i][0]))
+            self.assertEqual(dataset.classes[labels[i]], dataset[i][1])
+
+    def test_audio_batches(self) -> None:
+        """
+        Tests that audio batches are padded to the longest data point
+        """
+
+        # Batch all audio at once, shuffled
+        dataset = EagerAudioDataset(root=f"{self.root}/audio_dataset")
+        loader = BatchLoader(dataset, batch_size=len(dataset), shuffle=True)
+        (data, sr), labels = next(iter(loader))
+
+        # Assert the batch has the longest length and the shared sampling rate
+        lengths = [dataset[i][0][0].shape[0] for i in range(len(dataset))]
+        self.assertEqual(data.shape, (len(dataset), max(lengths)))
+        self.assertEqual(sr, dataset[0][0][1])
+        names = sorted(dataset.classes[label] for label in labels)
+        self.assertEqual(names, sorted(dataset[i][1] for i in range(2)))
+
+    def test_collate_functions(self) -> None:
+        """
+        Tests the collate functions on synthetic data
+        """
+
+        # Images are stacked
+        images = [np.full((2, 2, 3), i, dtype=np.uint8) for i in range(3)]
+        self.assertEqual(collate_images(images).shape, (3, 2, 2, 3))
+
+        # Audio is zero padded
+        audio, sr = collate_audio([(np.ones(2), 8000), (np.ones(4), 8000)])
+        self.assertTrue(np.array_equal(audio, [[1, 1, 0, 0], [1, 1, 1, 1]]))
+        self.assertEqual(sr, 8000)
+
+        # Different sampling rates cannot be collated
+        with self.assertRaises(ValueError):
+            collate_audio([(np.ones(2), 8000), (np.ones(2), 16000)])
+
+    def test_batch_transform(self) -> None:
+        """
+        Tests that a collate function can transform every batch at once
+        """
+
+        # Crop the center of every image in the batch
+        dataset = EagerImageDataset(root=f"{self.root}/image_dataset")
+        collate_fn = transform_collate(CenterCropTransform(s=32))
+        loader = BatchLoader(dataset, batch_size=2, collate_fn=collate_fn)
+        data, _ = next(iter(loader))
+        self.assertEqual(data.shape, (2, 32, 32, 3))
+
+    def test_reproducible_epochs(self) -> None:
+        """
+        Tests that random transforms are reproducible per seed and epoch
+        """
+
+        # Crop random windows of shuffled audio
+        dataset = EagerAudioDataset(
+            root=f"{self.root}/audio_dataset",
+            transform=RandomAudioCropTransform(t=0.5),
+        )
+
+        def epoch(loader: BatchLoader) -> tuple[np.ndarray, np.ndarray]:
+            (data, _), labels = next(iter(loader))
+            return data, labels
+
+        # The same seed gives the same epochs, and the epochs differ
+        first = BatchLoader(dataset, batch_size=len(dataset), shuffle=True)
+        second = BatchLoader(dataset, batch_size=len(dataset), shuffle=True)
+        first_epochs = [epoch(first), epoch(first)]
+        self.assertEqual(first.epoch, 2)
+        for data, labels in first_epochs:
+            expected_data, expected_labels = epoch(second)
+            self.assertTrue(np.array_equal(data, expected_data))
+            self.assertTrue(np.array_equal(labels, expected_labels))
+        self.assertFalse(np.array_equal(first_epochs[0][0], first_epochs[1][0]))
+
+        # Repeating an epoch repeats its random transforms
+        first.epoch = 1
+        self.assertTrue(np.array_equal(epoch(first)[0], first_epochs[1][0]))
+
+        # Another seed gives other random transforms
+        other = BatchLoader(dataset, batch_size=len(dataset), shuffle=True, seed=0)
+        self.assertFalse(np.array_equal(epoch(other)[0], first_epochs[0][0]))
+
+    def test_invalid_batch_size(self) -> None:
+        """
+        Tests that an invalid batch size raises a ValueError
+        """
+        dataset = LazyImageDataset(root=f"{self.root}/image_dataset")
+        with self.assertRaises(ValueError):
+            BatchLoader(dataset, batch_size=0)
+
+
+# Run the tests
+if __name__ == "__main__":
+    unittest.main()
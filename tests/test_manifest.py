@@ -0,0 +1,91 @@
+# Import libraries
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+# Import from other modules
+from datasets.dataset import EagerImageDataset, LazyAudioDataset, LazyImageDataset
+from datasets.manifest import read_manifest, scan_directory
+
+
+class TestManifest(unittest.TestCase):
+    """
+    Tests the deterministic scan of root and the reuse of the manifest
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up the test
+        """
+
+        # Set root and copy the image dataset to a temporary directory
+        self.root = "tests/test_datasets/loading_dataset"
+        self.directory = tempfile.mkdtemp()
+        self.dataset = f"{self.directory}/image_dataset"
+        self.manifest = f"{self.directory}/manifest.npz"
+        shutil.copytree(f"{self.root}/image_dataset", self.dataset)
+        self.age_directories()
+
+        # Set up the test
+        super().setUp()
+
+    def tearDown(self) -> None:
+        """
+        Remove the temporary directory
+        """
+        shutil.rmtree(self.directory)
+        super().tearDown()
+
+    def age_directories(self) -> None:
+        """
+        Sets the modification time of the copied directories to the past
+        """
+        for directory in [self.dataset, *scan_directory(self.dataset).classes]:
+            path = os.path.join(self.dataset, directory)
+            os.utime(path, ns=(0, os.stat(path).st_mtime_ns - 10**10))
+
+    def test_sorted_scan(self) -> None:
+        """
+        Tests that the files are sorted by class and name
+        """
+
+        # Loop through the data types
+        for loader_type in ("audio", "image"):
+            dataset = LazyAudioDataset if loader_type == "audio" else LazyImageDataset
+            paths = list(dataset(root=f"{self.root}/{loader_type}_dataset")._data.items)
+            self.assertEqual(paths, sorted(paths))
+
+    def test_manifest_reuse(self) -> None:
+        """
+        Tests that the manifest replaces the walk until root changes
+        """
+
+        # The first load walks root and writes the manifest
+        expected = LazyImageDataset(root=self.dataset, manifest=self.manifest)
+        manifest = read_manifest(self.manifest, self.dataset)
+        self.assertIsNotNone(manifest)
+        self.assertEqual(len(manifest.sizes), len(expected))
+
+        # Later loads of both kinds do not walk root
+        with mock.patch("datasets.baseclasses.scan_directory") as scan:
+            for loader in (LazyImageDataset, EagerImageDataset):
+                dataset = loader(root=self.dataset, manifest=self.manifest)
+                self.assertEqual(dataset.classes, expected.classes)
+                self.assertTrue(np.array_equal(dataset.label_ids, expected.label_ids))
+            scan.assert_not_called()
+
+        # Adding a file invalidates the manifest
+        path = expected._data.items[0]
+        directory, name = os.path.split(path)
+        shutil.copy(path, os.path.join(directory, f"copy_{name}"))
+        dataset = LazyImageDataset(root=self.dataset, manifest=self.manifest)
+        self.assertEqual(len(dataset), len(expected) + 1)
+
+
+# Run the tests
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+# Import libraries
+import mmap
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+# Import from other modules
+from datasets.dataset import EagerAudioDataset, LazyImageDataset
+from datasets.exceptions import ImageNotFoundError
+from datasets.loader import BatchLoader
+from datasets.multiprocess import ProcessBatchLoader
+from datasets.transform import RandomAudioCropTransform
+from datasets.utils import GETITEM_RETURN_TYPE
+
+
+class CrashingDataset(LazyImageDataset):
+    """
+    Dataset of which the workers die on the last data point
+    """
+
+    def __getitem__(self, index: int) -> GETITEM_RETURN_TYPE:
+        """
+        Exits the process on the last data point
+        """
+        if index == len(self) - 1:
+            os._exit(3)
+        return super().__getitem__(index)
+
+
+class TestProcessBatchLoader(unittest.TestCase):
+    """
+    Tests loading batches in worker processes
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up the test
+        """
+
+        # Set roots
+        self.root = "tests/test_datasets/loading_dataset"
+        self.exceptions_root = "tests/test_datasets/exceptions_dataset"
+
+        # Set up the test
+        super().setUp()
+
+    def test_same_batches(self) -> None:
+        """
+        Tests that the workers return the batches of BatchLoader in order
+        """
+
+        # Crop random windows of shuffled audio
+        dataset = EagerAudioDataset(
+            root=f"{self.root}/audio_dataset",
+            transform=RandomAudioCropTransform(t=0.5),
+        )
+        expected = list(BatchLoader(dataset, shuffle=True))
+
+        # Loop through different numbers of workers
+        for num_workers in (1, 3):
+            with ProcessBatchLoader(
+                dataset, shuffle=True, num_workers=num_workers
+            ) as loader:
+                batches = list(loader)
+
+            # Assert that every batch matches
+            self.assertEqual(len(batches), len(expected))
+            for ((data, sr), labels), ((expected_data, _), expected_labels) in zip(
+                batches, expected, strict=True
+            ):
+                self.assertTrue(np.array_equal(data, expected_data))
+                self.assertTrue(np.array_equal(labels, expected_labels))
+                self.assertEqual(sr, dataset[0][0][1])
+
+    def test_shared_memory_views(self) -> None:
+        """
+        Tests that batches are views of shared memory until no slot is free
+        """
+
+        # One worker with one slot
+        dataset = LazyImageDataset(root=f"{self.root}/image_dataset")
+        with ProcessBatchLoader(dataset, num_workers=1, slots=1) as loader:
+            # Without keeping batches every batch is a view of the slot
+            for data, _ in loader:
+                self.assertFalse(data.flags.owndata)
+                self.assertIsInstance(data.base, mmap.mmap)
+                del data
+
+            # Kept batches take the slot, so the next batch is pickled
+            batches = list(loader)
+            self.assertIsInstance(batches[0][0].base, mmap.mmap)
+            self.assertNotIsInstance(batches[1][0].base, mmap.mmap)
+
+            # Both batches keep their own data
+            for i, (data, labels) in enumerate(batches):
+                self.assertTrue(np.array_equal(data[0], dataset[i][0]))
+                self.assertEqual(dataset.classes[labels[0]], dataset[i][1])
+
+    def test_slot_size(self) -> None:
+        """
+        Tests that the slots hold twice a batch of copies of the first item
+        """
+        dataset = LazyImageDataset(root=f"{self.root}/image_dataset")
+        with ProcessBatchLoader(dataset, batch_size=2, num_workers=1) as loader:
+            next(iter(loader))
+            self.assertEqual(loader.slot_bytes, 2 * 2 * dataset[0][0].nbytes)
+
+    def test_empty_dataset(self) -> None:
+        """
+        Tests that an empty dataset has no batches, like in BatchLoader
+        """
+        with tempfile.TemporaryDirectory() as root:
+            os.mkdir(f"{root}/class_0")
+            dataset = LazyImageDataset(root=root)
+            with ProcessBatchLoader(dataset, batch_size=2) as loader:
+                self.assertEqual(list(loader), list(BatchLoader(dataset)))
+                self.assertEqual(list(loader), [])
+                self.assertIsNone(loader.slot_bytes)
+
+    def test_worker_exception(self) -> None:
+        """
+        Tests that exceptions of the workers are raised in the main process
+        """
+        dataset = LazyImageDataset(root=self.exceptions_root)
+        with (
+            ProcessBatchLoader(dataset, num_workers=2) as loader,
+            self.assertRaises(ImageNotFoundError),
+        ):
+            list(loader)
+
+    def test_worker_crash(self) -> None:
+        """
+        Tests that a worker that dies raises an exception and stops the others
+        """
+        dataset = CrashingDataset(root=f"{self.root}/image_dataset")
+        loader = ProcessBatchLoader(dataset, num_workers=2, slot_bytes=1)
+        with self.assertRaisesRegex(RuntimeError, "exit code 3"):
+            list(loader)
+        self.assertEqual(loader._processes, [])
+
+    def test_invalid_arguments(self) -> None:
+        """
+        Tests that invalid worker configurations raise a ValueError
+        """
+        dataset = LazyImageDataset(root=f"{self.root}/image_dataset")
+        for kwargs in ({"num_workers": 0}, {"slots": 0}, {"slot_bytes": 0}):
+            with self.assertRaises(ValueError):
+                ProcessBatchLoader(dataset, **kwargs)
+
+
+# Run the tests
+if __name__ == "__main__":
+    unittest.main()
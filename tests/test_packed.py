@@ -0,0 +1,99 @@
+# Import libraries
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+# Import from other modules
+from datasets.dataset import (
+    LazyAudioDataset,
+    LazyImageDataset,
+    PackedAudioDataset,
+    PackedImageDataset,
+)
+from datasets.packed import pack_dataset
+from datasets.transform import CenterCropTransform
+
+
+class TestPacked(unittest.TestCase):
+    """
+    Tests packing datasets into a single file and reading them back
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up the test
+        """
+
+        # Set root and a temporary target directory
+        self.root = "tests/test_datasets/loading_dataset"
+        self.target = tempfile.mkdtemp()
+
+        # Define the source and packed loader per data type
+        self.loaders = {
+            "audio": (LazyAudioDataset, PackedAudioDataset),
+            "image": (LazyImageDataset, PackedImageDataset),
+        }
+
+        # Set up the test
+        super().setUp()
+
+    def tearDown(self) -> None:
+        """
+        Remove the temporary target directory
+        """
+        shutil.rmtree(self.target)
+        super().tearDown()
+
+    def test_pack_round_trip(self) -> None:
+        """
+        Tests that the packed dataset returns the same data points as views
+        """
+
+        # Loop through the data types
+        for loader_type, (source_loader, packed_loader) in self.loaders.items():
+            source = source_loader(root=f"{self.root}/{loader_type}_dataset")
+            target = f"{self.target}/{loader_type}"
+            pack_dataset(source, target)
+            packed = packed_loader(root=target)
+
+            # Assert that every data point is equal and not writeable
+            self.assertEqual(len(packed), len(source))
+            for i in range(len(source)):
+                data, label = packed[i]
+                expected_data, expected_label = source[i]
+                if loader_type == "audio":
+                    self.assertEqual(data[1], expected_data[1])
+                    data, expected_data = data[0], expected_data[0]
+                self.assertTrue(np.array_equal(data, expected_data))
+                self.assertFalse(data.flags.writeable)
+                self.assertTrue(np.shares_memory(data, packed._data))
+                self.assertEqual(label, expected_label)
+
+            # Assert that the classes are numbered as in the source
+            self.assertEqual(packed.classes, source.classes)
+            self.assertTrue(np.array_equal(packed.label_ids, source.label_ids))
+
+    def test_wrong_type_and_transform(self) -> None:
+        """
+        Tests that packing with a transform and reading the wrong type fail
+        """
+
+        # A dataset with a transform cannot be packed
+        source = LazyImageDataset(
+            root=f"{self.root}/image_dataset", transform=CenterCropTransform(s=8)
+        )
+        with self.assertRaises(ValueError):
+            pack_dataset(source, self.target)
+
+        # Packed images cannot be read as audio
+        source.transform = None
+        pack_dataset(source, self.target)
+        with self.assertRaises(ValueError):
+            PackedAudioDataset(root=self.target)
+
+
+# Run the tests
+if __name__ == "__main__":
+    unittest.main()
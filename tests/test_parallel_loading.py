@@ -0,0 +1,109 @@
+# Import libraries
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+# Import from other modules
+from datasets.dataset import EagerAudioDataset, EagerImageDataset
+from datasets.exceptions import ImageNotFoundError
+
+
+class TestParallelLoading(unittest.TestCase):
+    """
+    Tests that parallel eager loading matches serial eager loading
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up the test
+        """
+
+        # Set roots
+        self.root = "tests/test_datasets/loading_dataset"
+        self.exceptions_root = "tests/test_datasets/exceptions_dataset"
+
+        # Define the loaders
+        self.eager_loader = {"audio": EagerAudioDataset, "image": EagerImageDataset}
+
+        # Set up the test
+        super().setUp()
+
+    def _assert_same_data(
+        self, expected_loader: object, actual_loader: object, data_type: str
+    ) -> None:
+        """
+        Asserts that two loaders hold the same data in the same order
+        """
+
+        # Assert that their length is equal
+        self.assertEqual(len(expected_loader._data), len(actual_loader._data))
+
+        # Loop through both and compare datapoint and label at every index
+        for (exp_data, exp_label), (act_data, act_label) in zip(
+            expected_loader._data, actual_loader._data, strict=True
+        ):
+            if data_type == "audio":
+                self.assertTrue(np.array_equal(exp_data[0], act_data[0]))
+                self.assertEqual(exp_data[1], act_data[1])
+            else:
+                self.assertTrue(np.array_equal(exp_data, act_data))
+            self.assertEqual(exp_label, act_label)
+
+    def test_pools_keep_order(self) -> None:
+        """
+        Tests that thread and process pools load the same data in the same order
+        """
+
+        # Loop through loaders
+        for loader_type, loader in self.eager_loader.items():
+            dataset_path = f"{self.root}/{loader_type}_dataset"
+            serial = loader(root=dataset_path)
+
+            # Loop through both pool types
+            for executor in ("thread", "process"):
+                parallel = loader(root=dataset_path, num_workers=2, executor=executor)
+                self._assert_same_data(serial, parallel, loader_type)
+
+    def test_existing_executor_and_reload(self) -> None:
+        """
+        Tests that load accepts an existing executor and reloading does not
+        duplicate the data
+        """
+
+        # Load serially, then reload with an existing pool
+        dataset_loader = EagerImageDataset(root=f"{self.root}/image_dataset")
+        serial_length = len(dataset_loader._data)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            dataset_loader.load(executor=pool)
+
+        # Assert that the data is not duplicated
+        self.assertEqual(serial_length, len(dataset_loader._data))
+
+    def test_parallel_exception(self) -> None:
+        """
+        Tests that a file failing in a worker raises the same exception
+        """
+
+        # Loop through both pool types
+        for executor in ("thread", "process"):
+            with self.assertRaises(ImageNotFoundError):
+                EagerImageDataset(
+                    root=self.exceptions_root, num_workers=2, executor=executor
+                )
+
+    def test_invalid_workers(self) -> None:
+        """
+        Tests that an invalid worker configuration raises a ValueError
+        """
+
+        # Check negative workers and an unknown executor
+        with self.assertRaises(ValueError):
+            EagerImageDataset(root=f"{self.root}/image_dataset", num_workers=-1)
+        with self.assertRaises(ValueError):
+            EagerImageDataset(root=f"{self.root}/image_dataset", executor="gpu")
+
+
+# Run the tests
+if __name__ == "__main__":
+    unittest.main()
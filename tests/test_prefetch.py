@@ -0,0 +1,111 @@
+# Import libraries
+import unittest
+
+import numpy as np
+
+# Import from other modules
+from datasets.dataset import LazyAudioDataset, LazyImageDataset
+from datasets.exceptions import ImageNotFoundError
+from datasets.prefetch import PrefetchIterator
+from datasets.transform import RandomAudioCropTransform
+
+
+class TestPrefetch(unittest.TestCase):
+    """
+    Tests the background prefetching of lazy datasets
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up the test
+        """
+
+        # Set roots
+        self.root = "tests/test_datasets/loading_dataset"
+        self.exceptions_root = "tests/test_datasets/exceptions_dataset"
+
+        # Set up the test
+        super().setUp()
+
+    def test_prefetch_order(self) -> None:
+        """
+        Tests that prefetching returns the same data points in the same order
+        """
+
+        # Loop through the lazy loaders
+        for loader_type, loader in (
+            ("audio", LazyAudioDataset),
+            ("image", LazyImageDataset),
+        ):
+            dataset = loader(root=f"{self.root}/{loader_type}_dataset")
+
+            # Prefetch in reversed order with a queue of one data point
+            indices = list(reversed(range(len(dataset))))
+            with dataset.prefetch(indices, prefetch=1, num_workers=2) as iterator:
+                prefetched = list(iterator)
+
+            # Assert that every data point matches __getitem__
+            self.assertEqual(len(prefetched), len(indices))
+            for index, (data, label) in zip(indices, prefetched, strict=True):
+                expected_data, expected_label = dataset[index]
+                if loader_type == "audio":
+                    self.assertTrue(np.array_equal(data[0], expected_data[0]))
+                else:
+                    self.assertTrue(np.array_equal(data, expected_data))
+                self.assertEqual(label, expected_label)
+
+    def test_reproducible_transforms(self) -> None:
+        """
+        Tests that random transforms do not depend on the number of workers
+        """
+
+        # Crop random windows of the audio with one and with four workers
+        dataset = LazyAudioDataset(
+            root=f"{self.root}/audio_dataset",
+            transform=RandomAudioCropTransform(t=0.5),
+        )
+        with dataset.prefetch(num_workers=1) as iterator:
+            serial = [data[0] for data, _ in iterator]
+        with dataset.prefetch(num_workers=4) as iterator:
+            parallel = [data[0] for data, _ in iterator]
+
+        # Assert that every data point got the same window
+        for a, b in zip(serial, parallel, strict=True):
+            self.assertTrue(np.array_equal(a, b))
+
+        # Another epoch gives other windows
+        with dataset.prefetch(num_workers=4, epoch=1) as iterator:
+            other = [data[0] for data, _ in iterator]
+        self.assertFalse(
+            all(np.array_equal(a, b) for a, b in zip(serial, other, strict=True))
+        )
+
+    def test_exception_and_close(self) -> None:
+        """
+        Tests that loading errors are raised in order and stop the iterator
+        """
+
+        # Iterate over a dataset of which the first data point fails
+        dataset = LazyImageDataset(root=self.exceptions_root)
+        iterator = PrefetchIterator(dataset)
+        with self.assertRaises(ImageNotFoundError):
+            next(iterator)
+
+        # Assert that the iterator is exhausted after the failure
+        with self.assertRaises(StopIteration):
+            next(iterator)
+
+    def test_invalid_arguments(self) -> None:
+        """
+        Tests that invalid queue sizes and worker counts raise a ValueError
+        """
+        dataset = LazyImageDataset(root=f"{self.root}/image_dataset")
+        with self.assertRaises(ValueError):
+            PrefetchIterator(dataset, prefetch=0)
+        with self.assertRaises(ValueError):
+            PrefetchIterator(dataset, num_workers=0)
+
+
+# Run the tests
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+# Import libraries
+import os
+import tempfile
+import time
+import unittest
+
+# Import from other modules
+from benchmarks.profiler import SamplingProfiler
+
+
+def busy(seconds: float) -> None:
+    """
+    Keeps the thread busy for a number of seconds.
+    """
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class TestSamplingProfiler(unittest.TestCase):
+    """
+    Tests the sampling profiler of the profile command
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up the test
+        """
+
+        # Set root
+        self.root = "tests/test_datasets/loading_dataset"
+
+        # Set up the test
+        super().setUp()
+
+    def test_samples(self) -> None:
+        """
+        Tests that the running function is the hotspot and the stacks fold
+        """
+        with SamplingProfiler(interval=0.001) as sampler:
+            busy(0.2)
+        self.assertGreater(sum(sampler.samples.values()), 0)
+
+        # The busy function is running in most samples
+        frame, own, total = sampler.hotspots(top=1)[0]
+        self.assertTrue(frame.startswith("busy (test_profiler.py:"))
+        self.assertEqual(own, total)
+
+        # Every folded line is the stack from the thread and a count
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "stacks.txt")
+            sampler.write_folded(path)
+            with open(path) as file:
+                lines = file.read().splitlines()
+        for line in lines:
+            stack, count = line.rsplit(" ", 1)
+            self.assertTrue(stack.startswith("MainThread;"))
+            self.assertGreater(int(count), 0)
+
+
+# Run the tests
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+# Import libraries
+import unittest
+
+import numpy as np
+
+# Import from other modules
+from datasets.dataset import EagerAudioDataset, EagerImageDataset
+
+
+class TestReadOnly(unittest.TestCase):
+    """
+    Tests the read-only access mode of the eager datasets
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up the test
+        """
+
+        # Set root
+        self.root = "tests/test_datasets/loading_dataset"
+
+        # Define the eager loaders
+        self.eager_loader = {"audio": EagerAudioDataset, "image": EagerImageDataset}
+
+        # Set up the test
+        super().setUp()
+
+    def test_readonly_getitem(self) -> None:
+        """
+        Tests that read-only data points are returned without a copy and cannot
+        be changed, while the default mode still returns writeable copies
+        """
+
+        # Loop through loaders
+        for loader_type, loader in self.eager_loader.items():
+            dataset_path = f"{self.root}/{loader_type}_dataset"
+            readonly_loader = loader(root=dataset_path, readonly=True)
+            copying_loader = loader(root=dataset_path)
+
+            # Loop through all data points
+            for i in range(len(readonly_loader)):
+                readonly_data = readonly_loader[i][0]
+                copied_data = copying_loader[i][0]
+                stored_data = readonly_loader._data[i][0]
+                if loader_type == "audio":
+                    readonly_data, copied_data = readonly_data[0], copied_data[0]
+                    stored_data = stored_data[0]
+
+                # The read-only mode returns the stored array itself
+                self.assertIs(readonly_data, stored_data)
+                self.assertTrue(np.array_equal(readonly_data, copied_data))
+                with self.assertRaises(ValueError):
+                    readonly_data[0] = 0
+
+                # The default mode returns a writeable copy
+                self.assertTrue(copied_data.flags.writeable)
+                self.assertIsNot(copied_data, copying_loader._data[i][0])
+
+
+# Run the tests
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+# Import libraries
+import unittest
+
+import librosa
+import numpy as np
+
+# Import from other modules
+from datasets.dataset import LazyAudioDataset
+from datasets.spectrogram import MelSpectrogramEngine, mel_basis
+from datasets.transform import SpectrogramTransform
+
+
+class TestSpectrogram(unittest.TestCase):
+    """
+    Tests the batched mel spectrogram engine against librosa
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up the test
+        """
+
+        # Set root and a batch of random clips
+        self.root = "tests/test_datasets/loading_dataset"
+        self.batch = np.random.default_rng(0).standard_normal((3, 6000))
+        self.batch = self.batch.astype(np.float32)
+
+        # Set up the test
+        super().setUp()
+
+    def assert_close(self, actual: np.ndarray, expected: np.ndarray) -> None:
+        """
+        Asserts that two spectrograms are equal within float32 precision
+        """
+        self.assertEqual(actual.shape, expected.shape)
+        self.assertTrue(np.allclose(actual, expected, atol=1e-5 * expected.max()))
+
+    def test_matches_librosa(self) -> None:
+        """
+        Tests that batches and single clips match librosa.feature.melspectrogram
+        """
+        for n_fft, hop_length, n_mels in ((2048, 512, 128), (512, 128, 40)):
+            engine = MelSpectrogramEngine(n_fft, hop_length, n_mels)
+            expected = librosa.feature.melspectrogram(
+                y=self.batch,
+                sr=16000,
+                n_fft=n_fft,
+                hop_length=hop_length,
+                n_mels=n_mels,
+            )
+            self.assert_close(engine.compute(self.batch, 16000), expected)
+            self.assert_close(engine.compute(self.batch[0], 16000), expected[0])
+
+    def test_transform(self) -> None:
+        """
+        Tests the transform on real audio and on a batch
+        """
+
+        # The transform of a data point matches librosa
+        dataset = LazyAudioDataset(root=f"{self.root}/audio_dataset")
+        audio, sr = dataset[0][0]
+        dataset.transform = SpectrogramTransform()
+        spectrogram, _ = dataset[0][0]
+        self.assert_close(spectrogram, librosa.feature.melspectrogram(y=audio, sr=sr))
+
+        # The batch matches the data points
+        transform = SpectrogramTransform(n_fft=512, hop_length=256, n_mels=64)
+        batch, _ = transform.process_batch((self.batch, 16000))
+        self.assertEqual(batch.shape, (3, 64, 24))
+        self.assert_close(batch[2], transform.process((self.batch[2], 16000))[0])
+
+    def test_cached_basis(self) -> None:
+        """
+        Tests that the filterbank is built once per parameters and read-only
+        """
+        engine = MelSpectrogramEngine(n_fft=256, hop_length=64, n_mels=20)
+        engine.compute(self.batch, 8000)
+        hits = mel_basis.cache_info().hits
+        engine.compute(self.batch, 8000)
+        self.assertEqual(mel_basis.cache_info().hits, hits + 1)
+        self.assertFalse(mel_basis(8000.0, 256, 20).flags.writeable)
+
+    def test_invalid_parameters(self) -> None:
+        """
+        Tests that invalid parameters raise a ValueError
+        """
+        with self.assertRaises(ValueError):
+            MelSpectrogramEngine(n_fft=0)
+        with self.assertRaises(ValueError):
+            SpectrogramTransform(n_mels=0)
+
+
+# Run the tests
+if __name__ == "__main__":
+    unittest.main()
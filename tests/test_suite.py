@@ -0,0 +1,112 @@
+# Import libraries
+import contextlib
+import io
+import json
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+# Import from other modules
+from benchmarks import suite
+from benchmarks.synthetic import make_synthetic_dataset
+
+
+class TestSuite(unittest.TestCase):
+    """
+    Tests the results and the JSON output of the benchmark suite
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up the test
+        """
+
+        # Set root to a temporary directory and the options of a tiny dataset
+        self.root = tempfile.mkdtemp()
+        self.options = {
+            "classes": 2,
+            "files_per_class": 2,
+            "image_size": 16,
+            "audio_seconds": 0.1,
+            "sr": 8000,
+        }
+
+        # Set up the test
+        super().setUp()
+
+    def tearDown(self) -> None:
+        """
+        Remove the temporary directory
+        """
+        shutil.rmtree(self.root)
+        super().tearDown()
+
+    def test_run_case(self) -> None:
+        """
+        Tests that a case measures every data point of every epoch
+        """
+        make_synthetic_dataset(
+            self.root, "image", classes=2, files_per_class=2, image_size=(16, 16)
+        )
+        case = suite.run_case(
+            self.root, "LazyImageDataset", "center_crop", self.options, epochs=2
+        )
+
+        # The case names itself and reports positive measurements
+        self.assertEqual(case["dataset"], "LazyImageDataset")
+        self.assertEqual(case["transform"], "center_crop")
+        self.assertEqual(case["items"], 4)
+        for key in ("load_s", "first_item_ms", "p50_us", "items_per_s"):
+            self.assertGreater(case[key], 0)
+        self.assertGreaterEqual(case["p99_us"], case["p50_us"])
+        self.assertGreater(case["peak_rss_mb"], 0)
+
+    def test_json_output_and_compare(self) -> None:
+        """
+        Tests that the JSON output holds every case and compares to itself
+        """
+        output = f"{self.root}/results.json"
+        argv = [
+            "suite.py",
+            "--classes=1",
+            "--files-per-class=2",
+            "--image-size=16",
+            "--epochs=1",
+            f"--output={output}",
+        ]
+
+        # Only measure one dataset class, every case runs in a new process
+        datasets = {"LazyImageDataset": suite.DATASETS["LazyImageDataset"]}
+        with (
+            mock.patch.object(sys, "argv", argv),
+            mock.patch.dict(suite.DATASETS, datasets, clear=True),
+            contextlib.redirect_stdout(io.StringIO()),
+        ):
+            suite.main()
+        with open(output) as file:
+            results = json.load(file)
+
+        # The results can be compared across commits and machines
+        self.assertEqual(
+            set(results), {"commit", "python", "numpy", "options", "results"}
+        )
+        self.assertEqual(results["options"]["epochs"], 1)
+        cases = [(case["dataset"], case["transform"]) for case in results["results"]]
+        expected = [("LazyImageDataset", name) for name in suite.TRANSFORMS["image"]]
+        self.assertEqual(cases, expected)
+
+        # Comparing a run to itself prints ratios of one
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            suite.compare(results["results"], output)
+        lines = stdout.getvalue().splitlines()
+        self.assertEqual(len(lines), len(expected))
+        for line in lines:
+            self.assertEqual(line.count("x 1.00"), 3)
+
+
+# Run the tests
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+# Import libraries
+import filecmp
+import shutil
+import tempfile
+import unittest
+
+# Import from other modules
+from benchmarks.synthetic import make_synthetic_dataset
+from datasets.dataset import LazyAudioDataset, LazyImageDataset
+
+
+class TestSynthetic(unittest.TestCase):
+    """
+    Tests the generator of synthetic datasets
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up the test
+        """
+
+        # Set root to a temporary directory
+        self.root = tempfile.mkdtemp()
+
+        # Set up the test
+        super().setUp()
+
+    def tearDown(self) -> None:
+        """
+        Remove the temporary directory
+        """
+        shutil.rmtree(self.root)
+        super().tearDown()
+
+    def test_layout(self) -> None:
+        """
+        Tests that the datasets load the generated files with their options
+        """
+
+        # Images have the requested size
+        make_synthetic_dataset(
+            f"{self.root}/image",
+            "image",
+            classes=3,
+            files_per_class=2,
+            image_size=(24, 32),
+        )
+        dataset = LazyImageDataset(root=f"{self.root}/image")
+        self.assertEqual(len(dataset), 6)
+        self.assertEqual(dataset.classes, ("class_0000", "class_0001", "class_0002"))
+        self.assertEqual(dataset[0][0].shape, (24, 32, 3))
+
+        # Audio has the requested duration and sampling rate
+        make_synthetic_dataset(
+            f"{self.root}/audio", "audio", classes=2, files_per_class=1, sr=8000
+        )
+        (audio, sr), _ = LazyAudioDataset(root=f"{self.root}/audio", sr=None)[0]
+        self.assertEqual((audio.shape[0], sr), (8000, 8000))
+
+    def test_reproducible(self) -> None:
+        """
+        Tests that the files do not depend on the number of workers
+        """
+        for num_workers in (0, 2):
+            written = make_synthetic_dataset(
+                f"{self.root}/{num_workers}",
+                "image",
+                classes=2,
+                files_per_class=3,
+                num_workers=num_workers,
+            )
+            self.assertEqual(written, 6)
+        comparison = filecmp.dircmp(
+            f"{self.root}/0/class_0001", f"{self.root}/2/class_0001"
+        )
+        _, mismatch, errors = filecmp.cmpfiles(
+            comparison.left, comparison.right, comparison.common_files, shallow=False
+        )
+        self.assertEqual((mismatch, errors), ([], []))
+        self.assertEqual(len(comparison.common_files), 3)
+
+    def test_invalid_options(self) -> None:
+        """
+        Tests that invalid options raise a ValueError
+        """
+        for kwargs in ({"classes": 0}, {"image_format": "bmp"}, {"num_workers": -1}):
+            with self.assertRaises(ValueError):
+                make_synthetic_dataset(self.root, "image", **kwargs)
+        with self.assertRaises(ValueError):
+            make_synthetic_dataset(self.root, "video")
+
+
+# Run the tests
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,243 @@
+# Import libraries
+import unittest
+from unittest import mock
+
+import numpy as np
+
+# Import from other modules
+from datasets.cache import LRUCache
+from datasets.dataset import LazyAudioDataset, LazyImageDataset
+from datasets.exceptions import InvalidTransformError
+from datasets.transform import (
+    CenterCropTransform,
+    ComposeTransform,
+    RandomAudioCropTransform,
+    SpectrogramTransform,
+    SquareErasingTransform,
+)
+from datasets.utils import RNG
+
+
+class TestTransform(unittest.TestCase):
+    """
+    Tests the transforms and how datasets expose them
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up the test
+        """
+
+        # Set root
+        self.root = "tests/test_datasets/loading_dataset"
+
+        # Set up the test
+        super().setUp()
+
+    def test_transform_snapshot(self) -> None:
+        """
+        Tests that the transform getter returns an independent shallow copy
+        """
+
+        # Attach a transform with some large cached state
+        transform = SquareErasingTransform(s=4)
+        transform._cached = np.zeros(1000)
+        dataset = LazyImageDataset(root=f"{self.root}/image_dataset")
+        dataset.transform = transform
+
+        # The snapshot is a different object sharing the cached state
+        snapshot = dataset.transform
+        self.assertIsNot(snapshot, dataset._transform)
+        self.assertIs(snapshot._cached, transform._cached)
+        self.assertEqual(snapshot.s, transform.s)
+
+        # Changing the snapshot does not change the transform of the dataset
+        snapshot._s = 2
+        self.assertEqual(dataset._transform.s, 4)
+
+        # No transform returns None
+        dataset.transform = None
+        self.assertIsNone(dataset.transform)
+
+    def test_random_audio_crop(self) -> None:
+        """
+        Tests that the random audio crop returns exactly t * sr samples
+        """
+
+        # Crop a quarter of a second of every channel
+        transform = RandomAudioCropTransform(t=0.25)
+        audio, sr = transform.process((np.ones((2, 8000)), 8000))
+        self.assertEqual(audio.shape, (2, 2000))
+        self.assertEqual(sr, 8000)
+
+        # Audio shorter than t is returned whole and the offset is None
+        audio, _ = transform.process((np.ones(100), 8000))
+        self.assertEqual(audio.shape, (100,))
+        self.assertIsNone(transform.select_offset(0.25))
+        self.assertLessEqual(transform.select_offset(1.0), 0.75)
+
+        # t must be positive
+        with self.assertRaises(ValueError):
+            RandomAudioCropTransform(t=0)
+
+    def test_partial_audio_decode(self) -> None:
+        """
+        Tests that lazy audio datasets decode only the cropped window
+        """
+
+        # Decode the full audio and the window starting at 0.25 seconds
+        root = f"{self.root}/audio_dataset"
+        (full, sr), _ = LazyAudioDataset(root=root, sr=None)[0]
+        transform = RandomAudioCropTransform(t=0.5)
+        dataset = LazyAudioDataset(root=root, transform=transform, sr=None)
+        with (
+            mock.patch.object(RandomAudioCropTransform, "select_offset") as offset,
+            mock.patch.object(RandomAudioCropTransform, "process") as process,
+        ):
+            offset.return_value = 0.25
+            (audio, crop_sr), _ = dataset[0]
+
+        # The window matches the full audio and the full audio was not cropped
+        start = int(0.25 * sr)
+        self.assertEqual(crop_sr, sr)
+        self.assertEqual(audio.shape, (round(0.5 * sr),))
+        self.assertTrue(np.allclose(audio, full[start : start + audio.shape[0]]))
+        process.assert_not_called()
+
+        # With a cache the full audio is decoded and cropped instead
+        dataset = LazyAudioDataset(root=root, transform=transform, cache=LRUCache())
+        (audio, crop_sr), _ = dataset[0]
+        self.assertEqual(audio.shape, (round(0.5 * crop_sr),))
+
+    def test_process_batch_images(self) -> None:
+        """
+        Tests the vectorized image transforms against the per-sample ones
+        """
+
+        # A batch of four white images
+        batch = np.full((4, 16, 12, 3), 255, dtype=np.uint8)
+
+        # Every image gets one erased square of at most s by s pixels
+        erased = SquareErasingTransform(s=5).process_batch(batch)
+        self.assertEqual(erased.shape, batch.shape)
+        self.assertTrue((batch == 255).all())
+        for image in erased:
+            rows, cols = np.nonzero((image == 0).all(axis=-1))
+            side = rows.max() - rows.min() + 1
+            self.assertEqual(side, cols.max() - cols.min() + 1)
+            self.assertLessEqual(side, 5)
+            self.assertEqual(len(rows), side * side)
+
+        # Cropping the batch equals cropping every image
+        batch = np.arange(4 * 16 * 12 * 3).reshape(4, 16, 12, 3)
+        transform = CenterCropTransform(s=8)
+        cropped = transform.process_batch(batch)
+        expected = np.stack([transform.process(image) for image in batch])
+        self.assertTrue(np.array_equal(cropped, expected))
+        self.assertEqual(cropped.shape, (4, 8, 8, 3))
+
+    def test_process_batch_audio(self) -> None:
+        """
+        Tests the vectorized audio transforms against the per-sample ones
+        """
+
+        # A batch of three stereo ramps of one second
+        audio = np.tile(np.arange(8000, dtype=np.float32), (3, 2, 1))
+
+        # Every window is a contiguous range of the ramp in both channels
+        cropped, sr = RandomAudioCropTransform(t=0.25).process_batch((audio, 8000))
+        self.assertEqual(cropped.shape, (3, 2, 2000))
+        self.assertEqual(sr, 8000)
+        for window in cropped:
+            self.assertTrue(np.array_equal(window[0], window[1]))
+            self.assertTrue((np.diff(window[0]) == 1).all())
+
+        # The batched spectrogram equals the per-sample spectrograms
+        transform = SpectrogramTransform()
+        spectrograms, _ = transform.process_batch((audio[:, 0], 8000))
+        expected = transform.process((audio[1, 0], 8000))[0]
+        self.assertTrue(np.allclose(spectrograms[1], expected))
+
+    def test_default_process_batch(self) -> None:
+        """
+        Tests that the default process_batch loops over the data points
+        """
+
+        # Bypass the vectorized implementation of the center crop
+        batch = np.ones((2, 10, 10, 3))
+        transform = CenterCropTransform(s=4)
+        cropped = super(CenterCropTransform, transform).process_batch(batch)
+        self.assertEqual(cropped.shape, (2, 4, 4, 3))
+
+    def test_process_batch_wrong_data_type(self) -> None:
+        """
+        Tests that batches of the wrong data type raise InvalidTransformError
+        """
+        images = np.ones((2, 10, 10, 3))
+        audio = (np.ones((2, 100)), 22050)
+        with self.assertRaises(InvalidTransformError):
+            CenterCropTransform(s=4).process_batch(audio)
+        with self.assertRaises(InvalidTransformError):
+            SquareErasingTransform(s=4).process_batch(audio)
+        with self.assertRaises(InvalidTransformError):
+            RandomAudioCropTransform(t=0.001).process_batch(images)
+        with self.assertRaises(InvalidTransformError):
+            SpectrogramTransform().process_batch(images)
+
+    def test_compose(self) -> None:
+        """
+        Tests that a composition equals its transforms applied one by one
+        """
+
+        # Crop then erase is fused into a single stage
+        image = np.full((20, 20, 3), 255, dtype=np.uint8)
+        crop, erase = CenterCropTransform(s=10), SquareErasingTransform(s=4)
+        transform = ComposeTransform([crop, ComposeTransform([erase])])
+        self.assertEqual(transform.transforms, (crop, erase))
+        self.assertEqual(len(transform._stages), 1)
+
+        # With the same random state the output equals the sequential output
+        state = RNG.bit_generator.state
+        expected = erase.process(crop.process(image))
+        RNG.bit_generator.state = state
+        output = transform.process(image)
+        self.assertTrue(np.array_equal(output, expected))
+        self.assertFalse(np.may_share_memory(output, image))
+        self.assertTrue((image == 255).all())
+
+        # A second erasing works in place on the data the first allocated
+        transform = ComposeTransform([erase, erase])
+        original = SquareErasingTransform.erase
+        with mock.patch.object(
+            SquareErasingTransform, "erase", autospec=True, side_effect=original
+        ) as erase_mock:
+            transform.process(image)
+        inplace = [call.kwargs["inplace"] for call in erase_mock.call_args_list]
+        self.assertEqual(inplace, [False, True])
+        self.assertTrue((image == 255).all())
+
+        # The batch of a composition equals the batches of its transforms
+        batch = np.full((2, 20, 20, 3), 255, dtype=np.uint8)
+        state = RNG.bit_generator.state
+        expected = erase.process_batch(crop.process_batch(batch))
+        RNG.bit_generator.state = state
+        output = ComposeTransform([crop, erase]).process_batch(batch)
+        self.assertTrue(np.array_equal(output, expected))
+        self.assertTrue((batch == 255).all())
+
+        # Only deterministic transforms make a deterministic composition
+        self.assertTrue(ComposeTransform([crop, crop]).deterministic)
+        self.assertFalse(ComposeTransform([crop, erase]).deterministic)
+
+        # The datasets check every transform of a composition
+        dataset = LazyImageDataset(root=f"{self.root}/image_dataset")
+        dataset.transform = ComposeTransform([crop, erase])
+        with self.assertRaises(InvalidTransformError):
+            dataset.transform = ComposeTransform([crop, SpectrogramTransform()])
+        with self.assertRaises(ValueError):
+            ComposeTransform([])
+
+
+# Run the tests
+if __name__ == "__main__":
+    unittest.main()